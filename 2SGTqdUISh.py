@@ -1,215 +1,1078 @@
-import folium
-from geopy.distance import geodesic
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
-import webbrowser
-import os
-
-@dataclass
-class Location:
-    """Représente un lieu géographique avec ses métadonnées."""
-    name: str
-    latitude: float
-    longitude: float
-    description: str = ""
-    visited: bool = False
-    color: str = 'blue'  # Couleur par défaut pour les lieux non visités
-
-    def get_coordinates(self) -> Tuple[float, float]:
-        return (self.latitude, self.longitude)
-
-class TravelMap:
-    """Gère la carte interactive et les marqueurs."""
-    def __init__(self, center_location: Location, zoom_start: int = 13):
-        self.map = folium.Map(
-            location=center_location.get_coordinates(),
-            zoom_start=zoom_start,
-            tiles='OpenStreetMap'  # Plusieurs options disponibles
-        )
-        self.locations = []
-        self.path = None
-        
-    def add_location(self, location: Location) -> None:
-        """Ajoute un lieu à la carte avec un marqueur personnalisé."""
-        color = 'green' if location.visited else location.color
-        icon = 'check' if location.visited else 'info-sign'
-        
-        popup_content = f"<b>{location.name}</b>"
-        if location.description:
-            popup_content += f"<br>{location.description}"
-            
-        folium.Marker(
-            location=location.get_coordinates(),
-            popup=popup_content,
-            tooltip=location.name,
-            icon=folium.Icon(color=color, icon=icon, prefix='fa')
-        ).add_to(self.map)
-        
-        self.locations.append(location)
-    
-    def add_path(self, locations: List[Location], color: str = 'red') -> None:
-        """Ajoute une ligne reliant les lieux visités dans l'ordre."""
-        if len(locations) < 2:
-            return
-            
-        points = [loc.get_coordinates() for loc in locations if loc.visited]
-        if len(points) < 2:
-            return
-            
-        self.path = folium.PolyLine(
-            points,
-            color=color,
-            weight=2.5,
-            opacity=1,
-            tooltip="Parcours effectué"
-        ).add_to(self.map)
-    
-    def save_and_open(self, file_name: str = 'travel_map.html') -> None:
-        """Sauvegarde la carte et l'ouvre dans le navigateur par défaut."""
-        self.map.save(file_name)
-        webbrowser.open(f'file://{os.path.abspath(file_name)}')
-
-class TravelTracker:
-    """Gère la logique des déplacements et statistiques."""
-    def __init__(self):
-        self.locations: List[Location] = []
-        self.visited_locations: List[Location] = []
-    
-    def add_location(self, location: Location, visited: bool = False) -> None:
-        """Ajoute un lieu avec option de marquage comme visité."""
-        if visited:
-            location.visited = True
-            location.color = 'green'
-            self.visited_locations.append(location)
-        self.locations.append(location)
-    
-    def mark_visited(self, location_name: str) -> None:
-        """Marque un lieu comme visité."""
-        for loc in self.locations:
-            if loc.name.lower() == location_name.lower():
-                loc.visited = True
-                loc.color = 'green'
-                if loc not in self.visited_locations:
-                    self.visited_locations.append(loc)
-                break
-    
-    def calculate_total_distance(self) -> float:
-        """Calcule la distance totale parcourue entre les lieux visités."""
-        if len(self.visited_locations) < 2:
-            return 0.0
-            
-        total = 0.0
-        for i in range(len(self.visited_locations)-1):
-            start = self.visited_locations[i].get_coordinates()
-            end = self.visited_locations[i+1].get_coordinates()
-            total += geodesic(start, end).kilometers
-            
-        return round(total, 2)
-    
-    def get_visited_locations(self) -> List[Location]:
-        """Retourne la liste des lieux visités dans l'ordre."""
-        return self.visited_locations.copy()
-
-def main():
-    # Initialisation avec des données plus complètes
-    cities = [
-        Location("Paris", 48.8566, 2.3522, 
-                "Capitale de la France", True),
-        Location("Lyon", 45.7640, 4.8357, 
-                "Ville gastronomique", True),
-        Location("Marseille", 43.2965, 5.3698, 
-                "Port méditerranéen", True),
-        Location("Bordeaux", 44.8378, -0.5792, 
-                "Capitale du vin", False),
-        Location("Nice", 43.7102, 7.2620, 
-                "Station balnéaire", False)
-    ]
-    
-    # Initialisation des composants
-    tracker = TravelTracker()
-    for city in cities:
-        tracker.add_location(city, city.visited)
-    
-    # Création de la carte
-    travel_map = TravelMap(cities[0])  # Centrée sur Paris
-    
-    # Ajout des lieux et marquage
-    for city in cities:
-        travel_map.add_location(city)
-    
-    # Ajout du parcours entre les lieux visités
-    travel_map.add_path(tracker.get_visited_locations())
-    
-    # Calcul des statistiques
-    distance = tracker.calculate_total_distance()
-    print(f"Distance totale parcourue: {distance} km")
-    print(f"Lieux visités: {len(tracker.visited_locations)}/{len(cities)}")
-    
-    # Sauvegarde et affichage
-    travel_map.save_and_open("voyage_france.html")
-
-if __name__ == "__main__":
-    main()
-    
-     
-### Licence MIT
-
-
-### Licence MIT pour la vente de produits numériques
-
-### Copyright (c) 2025 [REFOÏA JEREMY LOUIS]
-### SIRET 95108513300019 
-
-
-### Autorisation est par la présente accordée, sans frais,
-###à toute personne obtenant une copie de ce produit numérique
-###et des fichiers de documentation associés (le "Produit"), 
-###de traiter le Produit sans restriction, y compris,
-###mais sans s'y limiter, les droits d'utiliser, de copier, de modifier,
-###de fusionner, de publier, de distribuer, de sous-licencier et/ou de vendre des copies
-###du Produit, et de permettre aux personnes à qui le Produit 
-###est fourni de le faire, sous réserve des conditions suivantes :
-
-###L'avis de copyright ci-dessus et cet avis d'autorisation 
-###doivent être inclus dans toutes les copies ou parties substantielles du Produit.
-
-###LE PRODUIT EST FOURNI "EN L'ÉTAT", SANS GARANTIE 
-###D'AUCUNE SORTE, EXPRESSE OU IMPLICITE, Y COMPRIS,
-###MAIS SANS S'Y LIMITER, LES GARANTIES DE QUALITÉ MARCHANDE, D'ADÉQUATION
-###À UN USAGE PARTICULIER ET DE NON-CONTREFAÇON. 
-###EN AUCUN CAS LES AUTEURS OU LES DÉTENTEURS DE DROITS D'AUTEUR NE SERONT RESPONSABLES DE TOUTE RÉCLAMATION,
-###DOMMAGE OU AUTRE RESPONSABILITÉ, QU'IL S'AGISSE 
-###D'UNE ACTION CONTRACTUELLE, DÉLICTUELLE OU AUTRE, DÉCOULANT DE,
-###OU EN RELATION AVEC LE PRODUIT OU SON UTILISATION OU D'AUTRES TRANSACTIONS AVEC LE PRODUIT.
-
-### Améliorations apportées :
-
-###1. **Typage et documentation** :
-   ### Utilisation de type hints pour une meilleure maintenabilité
-   ### Docstrings complètes pour toutes les méthodes
-   ### Utilisation de dataclass pour la classe Location
-
-###2. **Fonctionnalités enrichies** :
-   ### Gestion des lieux visités/non visités avec couleurs différentes
-   ### Ajout de descriptions pour chaque lieu
-   ### Traçage du parcours entre les lieux visités
-   ### Ouverture automatique dans le navigateur
-   ### Statistiques supplémentaires (nombre de lieux visités)
-
-###3. **Meilleure organisation** :
-   ### Séparation claire entre la logique métier (TravelTracker) et l'affichage (TravelMap)
-   ### Méthodes plus spécialisées et atomiques
-   ### Gestion des états plus robuste
-
-###4. **Expérience utilisateur améliorée** :
-   ### Popups plus informatifs avec HTML
-   ### Tooltips pour les marqueurs
-   ### Icônes Font Awesome
-   ### Choix des fonds de carte
-
-###5. **Robustesse accrue** :
-   ### Vérification des préconditions
-   ### Gestion des cas limites
-   ### Copie des listes pour éviter les effets de bord
-
+import folium
+import math
+from array import array
+import numpy as np
+from geopy.distance import geodesic
+from typing import Dict, Iterator, List, Mapping, Tuple, Optional, Union
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import webbrowser
+import os
+import re
+import time
+
+from travel_distance import distance_totale, distances_etapes
+from travel_layers import EXTERNAL_DATA_THRESHOLD, BulkMarkerLayer, ZoomPyramidPolyLine
+from travel_simplify import simplification_pyramid, simplify
+from travel_route import plan_route
+from travel_spatial import SpatialIndex
+
+@dataclass(slots=True)
+class Location:
+    """Représente un lieu géographique avec ses métadonnées."""
+    name: str
+    latitude: float
+    longitude: float
+    description: str = ""
+    visited: bool = False
+    color: str = 'blue'  # Couleur par défaut pour les lieux non visités
+
+    def get_coordinates(self) -> Tuple[float, float]:
+        return (self.latitude, self.longitude)
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Agrandit un tableau (capacité doublée) pour qu'il contienne au moins `size` cases."""
+    if size <= len(array):
+        return array
+    new_array = np.zeros(max(size, 2 * len(array), 16), dtype=array.dtype)
+    new_array[:len(array)] = array
+    return new_array
+
+class _StringColumn:
+    """Colonne de chaînes internées : chaque valeur distincte n'est stockée qu'une fois."""
+    __slots__ = ('values', 'codes', '_codes_by_value', '_size')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes = np.zeros(0, dtype=np.uint32)
+        self._codes_by_value: Dict[str, int] = {}
+        self._size = 0
+
+    def _code(self, value: str) -> int:
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes_by_value[value] = code
+        return code
+
+    def append(self, value: str) -> None:
+        self.codes = _grow(self.codes, self._size + 1)
+        self.codes[self._size] = self._code(value)
+        self._size += 1
+
+    def get(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def set(self, index: int, value: str) -> None:
+        self.codes[index] = self._code(value)
+
+class _PackedStringColumn:
+    """Colonne de chaînes quasi uniques (noms) : octets UTF-8 concaténés + positions."""
+    __slots__ = ('_data', '_starts', '_lengths', '_size')
+
+    def __init__(self):
+        self._data = bytearray()
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._lengths = np.zeros(0, dtype=np.uint32)
+        self._size = 0
+
+    def append(self, value: str) -> None:
+        self._starts = _grow(self._starts, self._size + 1)
+        self._lengths = _grow(self._lengths, self._size + 1)
+        self._size += 1
+        self.set(self._size - 1, value)
+
+    def get(self, index: int) -> str:
+        start = int(self._starts[index])
+        return self._data[start:start + int(self._lengths[index])].decode('utf-8')
+
+    def set(self, index: int, value: str) -> None:
+        # L'ancienne valeur reste dans le tampon : les renommages sont rares
+        encoded = value.encode('utf-8')
+        self._starts[index] = len(self._data)
+        self._lengths[index] = len(encoded)
+        self._data += encoded
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._starts.nbytes + self._lengths.nbytes
+
+def _hash_name(key: str) -> int:
+    return hash(key) & 0x7FFFFFFF
+
+class _NameIndex:
+    """
+    Index nom (casefold) -> indice du premier lieu qui le porte, sans objet
+    Python par entrée : table à adressage ouvert de (hachage sur 31 bits,
+    indice + 1), en entiers 32 bits (0 : case vide, -1 : entrée supprimée). Les
+    clés ne sont pas stockées, elles sont relues dans la colonne des noms pour
+    confirmer une correspondance.
+    """
+    __slots__ = ('_names', '_hashes', '_slots', '_used', '_size')
+
+    def __init__(self, names: '_PackedStringColumn'):
+        self._names = names
+        self._hashes = array('i', bytes(4 * 16))
+        self._slots = array('i', bytes(4 * 16))
+        self._used = 0  # Cases occupées, entrées supprimées comprises
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _find(self, key: str, key_hash: int) -> Tuple[int, bool]:
+        """(case de la clé, True) si elle est présente, sinon (case où l'insérer, False)."""
+        mask = len(self._slots) - 1
+        slot, free = key_hash & mask, -1
+        while True:
+            entry = self._slots[slot]
+            if entry == 0:
+                return (slot if free < 0 else free), False
+            if entry < 0:
+                if free < 0:
+                    free = slot
+            elif self._hashes[slot] == key_hash and self._names.get(entry - 1).casefold() == key:
+                return slot, True
+            slot = (slot + 1) & mask
+
+    def _resize(self) -> None:
+        entries = [(h, e) for h, e in zip(self._hashes, self._slots) if e > 0]
+        capacity = 16
+        while capacity < 3 * len(entries):
+            capacity *= 2
+        self._hashes = array('i', bytes(4 * capacity))
+        self._slots = array('i', bytes(4 * capacity))
+        mask = capacity - 1
+        for key_hash, entry in entries:
+            slot = key_hash & mask
+            while self._slots[slot]:
+                slot = (slot + 1) & mask
+            self._hashes[slot], self._slots[slot] = key_hash, entry
+        self._used = len(entries)
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        slot, found = self._find(key, _hash_name(key))
+        return self._slots[slot] - 1 if found else default
+
+    def __setitem__(self, key: str, index: int) -> None:
+        key_hash = _hash_name(key)
+        slot, found = self._find(key, key_hash)
+        if not found:
+            if 3 * (self._used + 1) > 2 * len(self._slots):
+                self._resize()
+                slot, _ = self._find(key, key_hash)
+            if self._slots[slot] == 0:
+                self._used += 1
+            self._size += 1
+        self._hashes[slot], self._slots[slot] = key_hash, index + 1
+
+    def setdefault(self, key: str, index: int) -> int:
+        current = self.get(key)
+        if current is None:
+            self[key] = index
+            return index
+        return current
+
+    def __delitem__(self, key: str) -> None:
+        slot, found = self._find(key, _hash_name(key))
+        if not found:
+            raise KeyError(key)
+        self._slots[slot] = -1
+        self._size -= 1
+
+    @property
+    def nbytes(self) -> int:
+        return self._hashes.itemsize * (len(self._hashes) + len(self._slots))
+
+class LocationStore:
+    """
+    Stockage en colonnes des lieux suivis.
+
+    Latitudes et longitudes sont des tableaux float64 parallèles, l'état
+    « visité » est un bitmap, les noms sont concaténés dans un tampon UTF-8 et
+    les descriptions et couleurs sont des colonnes internées. L'ordre des
+    visites est conservé sous forme d'indices.
+    """
+    def __init__(self):
+        self._latitudes = np.zeros(0, dtype=np.float64)
+        self._longitudes = np.zeros(0, dtype=np.float64)
+        self._visited_bits = np.zeros(0, dtype=np.uint8)
+        self._visit_order = np.zeros(0, dtype=np.int64)
+        self.names = _PackedStringColumn()
+        self.descriptions = _StringColumn()
+        self.colors = _StringColumn()
+        self.colors_before_visit = _StringColumn()  # Couleur rétablie quand une visite est retirée
+        self._size = 0
+        self._visit_count = 0
+        self.reorders = 0  # Insertions/retraits au milieu de l'ordre des visites
+        self.name_index = _NameIndex(self.names)  # nom (casefold) -> indice du premier lieu
+        self.coordinates_version = 0  # Incrémenté à chaque déplacement d'un lieu existant
+        # Objets Location de l'appelant tenus à jour (visité, couleur), sur demande
+        # seulement : les retenir coûte plus que les colonnes elles-mêmes
+        self._attached: Dict[int, Location] = {}
+        self._attached_ids: Dict[int, int] = {}  # id(objet) -> indice ; l'objet retenu garde son id
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, name: str, latitude: float, longitude: float,
+               description: str = "", color: str = 'blue',
+               color_before_visit: Optional[str] = None) -> int:
+        """Ajoute un lieu et retourne son indice dans le stockage."""
+        index = self._size
+        self._latitudes = _grow(self._latitudes, index + 1)
+        self._longitudes = _grow(self._longitudes, index + 1)
+        self._visited_bits = _grow(self._visited_bits, index // 8 + 1)
+        self._latitudes[index] = latitude
+        self._longitudes[index] = longitude
+        self.names.append(name)
+        self.descriptions.append(description)
+        self.colors.append(color)
+        self.colors_before_visit.append(color if color_before_visit is None else color_before_visit)
+        self.name_index.setdefault(name.casefold(), index)
+        self._size += 1
+        return index
+
+    def extend(self, names: List[str], latitudes, longitudes,
+               descriptions: Optional[List[str]] = None, color: str = 'blue',
+               color_before_visit: Optional[str] = None) -> range:
+        """Ajoute un bloc de lieux en une fois et retourne la plage de leurs indices."""
+        start, count = self._size, len(names)
+        end = start + count
+        self._latitudes = _grow(self._latitudes, end)
+        self._longitudes = _grow(self._longitudes, end)
+        self._visited_bits = _grow(self._visited_bits, end // 8 + 1)
+        self._latitudes[start:end] = latitudes
+        self._longitudes[start:end] = longitudes
+        for i, name in enumerate(names):
+            self.names.append(name)
+            self.descriptions.append(descriptions[i] if descriptions is not None else "")
+            self.colors.append(color)
+            self.colors_before_visit.append(color if color_before_visit is None else color_before_visit)
+            self.name_index.setdefault(name.casefold(), start + i)
+        self._size = end
+        return range(start, end)
+
+    def set_coordinates(self, index: int, latitude: float, longitude: float) -> None:
+        """Déplace un lieu existant (les index spatiaux seront reconstruits)."""
+        self._latitudes[index] = latitude
+        self._longitudes[index] = longitude
+        self.coordinates_version += 1
+
+    def rename(self, index: int, name: str) -> None:
+        """Renomme un lieu en tenant l'index des noms à jour."""
+        old_key, new_key = self.names.get(index).casefold(), name.casefold()
+        if self.name_index.get(old_key) != index:
+            self.names.set(index, name)
+        else:
+            # Le nom désigne désormais le premier autre lieu qui le porte (balayage : renommage rare).
+            # L'entrée est retirée avant le renommage : l'index relit les clés dans les noms.
+            del self.name_index[old_key]
+            self.names.set(index, name)
+            for other in range(self._size):
+                if other != index and self.names.get(other).casefold() == old_key:
+                    self.name_index[old_key] = other
+                    break
+        current = self.name_index.get(new_key)
+        if current is None or index < current:
+            self.name_index[new_key] = index
+
+    def attach(self, index: int, location: Location) -> None:
+        """Associe l'objet Location de l'appelant au lieu `index` pour le tenir à jour."""
+        self._attached[index] = location
+        self._attached_ids[id(location)] = index
+
+    def attached_index(self, location) -> Optional[int]:
+        """Indice du lieu auquel l'objet `location` est associé, ou None."""
+        return self._attached_ids.get(id(location))
+
+    def _sync_attached(self, index: int) -> None:
+        location = self._attached.get(index)
+        if location is not None:
+            location.visited = self.is_visited(index)
+            location.color = self.colors.get(index)
+
+    def set_color(self, index: int, color: str) -> None:
+        self.colors.set(index, color)
+        self._sync_attached(index)
+
+    def is_visited(self, index: int) -> bool:
+        return bool(self._visited_bits[index >> 3] & (1 << (index & 7)))
+
+    def visit_position(self, index: int) -> int:
+        """Position du lieu `index` dans l'ordre des visites (ValueError s'il n'est pas visité)."""
+        positions = np.flatnonzero(self.visit_order == index)
+        if not len(positions):
+            raise ValueError(f"Le lieu {self.names.get(index)!r} n'est pas visité")
+        return int(positions[0])
+
+    def mark_visited(self, index: int) -> bool:
+        """Ajoute le lieu à la fin de l'ordre des visites ; False s'il était déjà visité."""
+        if self.is_visited(index):
+            return False
+        self._visited_bits[index >> 3] |= 1 << (index & 7)
+        self._visit_order = _grow(self._visit_order, self._visit_count + 1)
+        self._visit_order[self._visit_count] = index
+        self._visit_count += 1
+        self._sync_attached(index)
+        return True
+
+    def insert_visit(self, position: int, index: int) -> None:
+        """Insère une visite du lieu `index` à la position donnée de l'ordre des visites."""
+        if self.is_visited(index):
+            raise ValueError(f"Le lieu {self.names.get(index)!r} est déjà visité")
+        if not 0 <= position <= self._visit_count:
+            raise IndexError("position de visite hors limites")
+        self._visited_bits[index >> 3] |= 1 << (index & 7)
+        self._visit_order = _grow(self._visit_order, self._visit_count + 1)
+        order = self._visit_order
+        order[position + 1:self._visit_count + 1] = order[position:self._visit_count].copy()
+        order[position] = index
+        self._visit_count += 1
+        self.reorders += 1
+        self._sync_attached(index)
+
+    def remove_visit(self, position: int) -> int:
+        """Retire la visite à la position donnée et retourne l'indice du lieu."""
+        if not 0 <= position < self._visit_count:
+            raise IndexError("position de visite hors limites")
+        order = self._visit_order
+        index = int(order[position])
+        order[position:self._visit_count - 1] = order[position + 1:self._visit_count].copy()
+        self._visit_count -= 1
+        self._visited_bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        self.reorders += 1
+        self._sync_attached(index)
+        return index
+
+    @property
+    def latitudes(self) -> np.ndarray:
+        return self._latitudes[:self._size]
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self._longitudes[:self._size]
+
+    @property
+    def visit_order(self) -> np.ndarray:
+        """Indices des lieux visités, dans l'ordre des visites."""
+        return self._visit_order[:self._visit_count]
+
+    def visited_at(self, indices: np.ndarray) -> np.ndarray:
+        """Masque booléen des visites pour les seuls lieux `indices`."""
+        indices = np.asarray(indices, dtype=np.int64)
+        return ((self._visited_bits[indices >> 3] >> (indices & 7)) & 1).astype(bool)
+
+    def visited_mask(self) -> np.ndarray:
+        """Masque booléen des lieux visités."""
+        return np.unpackbits(self._visited_bits, bitorder='little')[:self._size].astype(bool)
+
+    def coordinates(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Tableau (N, 2) des coordonnées (lat, lon), éventuellement restreint à `indices`."""
+        if indices is None:
+            return np.column_stack((self.latitudes, self.longitudes))
+        return np.column_stack((self._latitudes[indices], self._longitudes[indices]))
+
+    def view(self, index: int) -> 'LocationView':
+        return LocationView(self, index)
+
+    def nbytes(self) -> int:
+        """Mémoire occupée par les colonnes (hors valeurs internées partagées)."""
+        columns = (self._latitudes, self._longitudes, self._visited_bits, self._visit_order,
+                   self.descriptions.codes, self.colors.codes, self.colors_before_visit.codes)
+        return sum(column.nbytes for column in columns) + self.names.nbytes + self.name_index.nbytes
+
+class LocationView:
+    """Vue légère sur un lieu du LocationStore, utilisable comme un Location."""
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: LocationStore, index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._store.names.get(self._index)
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._store.rename(self._index, value)
+
+    @property
+    def latitude(self) -> float:
+        return float(self._store._latitudes[self._index])
+
+    @latitude.setter
+    def latitude(self, value: float) -> None:
+        self._store.set_coordinates(self._index, value, self.longitude)
+
+    @property
+    def longitude(self) -> float:
+        return float(self._store._longitudes[self._index])
+
+    @longitude.setter
+    def longitude(self, value: float) -> None:
+        self._store.set_coordinates(self._index, self.latitude, value)
+
+    @property
+    def description(self) -> str:
+        return self._store.descriptions.get(self._index)
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._store.descriptions.set(self._index, value)
+
+    @property
+    def visited(self) -> bool:
+        return self._store.is_visited(self._index)
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        # True : visite ajoutée en fin de parcours ; False : visite retirée du parcours
+        if value:
+            self._store.mark_visited(self._index)
+        elif self._store.is_visited(self._index):
+            self._store.remove_visit(self._store.visit_position(self._index))
+
+    @property
+    def color(self) -> str:
+        return self._store.colors.get(self._index)
+
+    @color.setter
+    def color(self, value: str) -> None:
+        self._store.set_color(self._index, value)
+
+    def get_coordinates(self) -> Tuple[float, float]:
+        return (self.latitude, self.longitude)
+
+    def _fields(self) -> tuple:
+        return (self.name, self.latitude, self.longitude, self.description, self.visited, self.color)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LocationView):
+            return self._store is other._store and self._index == other._index
+        if isinstance(other, Location):
+            # Même comparaison que le dataclass Location, champ par champ
+            return self._fields() == (other.name, other.latitude, other.longitude,
+                                      other.description, other.visited, other.color)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._index))
+
+    def __repr__(self) -> str:
+        return (f"LocationView(name={self.name!r}, latitude={self.latitude}, "
+                f"longitude={self.longitude}, visited={self.visited})")
+
+class LocationSequence(Sequence):
+    """
+    Séquence de vues sur les lieux d'un LocationStore.
+
+    Compatible avec les listes de l'ancienne API : comparaison (==) avec une
+    liste de Location, copy() et append() (transmis au TravelTracker).
+    """
+    def __init__(self, store: LocationStore, visited_only: bool = False, append=None):
+        self._store = store
+        self._visited_only = visited_only
+        self._append = append
+
+    def _indices(self) -> Optional[np.ndarray]:
+        return self._store.visit_order if self._visited_only else None
+
+    def __len__(self) -> int:
+        return self._store._visit_count if self._visited_only else len(self._store)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("indice de lieu hors limites")
+        index = int(self._store.visit_order[item]) if self._visited_only else item
+        return LocationView(self._store, index)
+
+    def __iter__(self) -> Iterator[LocationView]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def coordinates(self) -> np.ndarray:
+        """Coordonnées (N, 2) des lieux de la séquence, sans créer de vues."""
+        return self._store.coordinates(self._indices())
+
+    def append(self, location) -> None:
+        if self._append is None:
+            raise TypeError("Séquence en lecture seule")
+        self._append(location)
+
+    def copy(self) -> List[LocationView]:
+        return list(self)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+class TravelMap:
+    """Gère la carte interactive et les marqueurs."""
+    def __init__(self, center_location: Location, zoom_start: int = 13,
+                 high_volume: bool = False):
+        """
+        :param high_volume: regroupe tous les marqueurs dans une seule couche
+                            BulkMarkerLayer (icônes partagées, rendu côté
+                            navigateur) au lieu d'un folium.Marker par lieu.
+        """
+        self.map = folium.Map(
+            location=center_location.get_coordinates(),
+            zoom_start=zoom_start,
+            tiles='OpenStreetMap'  # Plusieurs options disponibles
+        )
+        self.locations = []  # Non rempli en mode fort volume pour limiter la mémoire
+        self.path = None
+        self.markers = BulkMarkerLayer(name="Lieux").add_to(self.map) if high_volume else None
+        
+    def add_location(self, location: Location) -> None:
+        """Ajoute un lieu à la carte avec un marqueur personnalisé."""
+        color = 'green' if location.visited else location.color
+        icon = 'check' if location.visited else 'info-sign'
+
+        if self.markers is not None:
+            latitude, longitude = location.get_coordinates()
+            self.markers.add_point(latitude, longitude, location.name,
+                                   location.description, color, icon)
+            return
+        
+        popup_content = f"<b>{location.name}</b>"
+        if location.description:
+            popup_content += f"<br>{location.description}"
+            
+        folium.Marker(
+            location=location.get_coordinates(),
+            popup=popup_content,
+            tooltip=location.name,
+            icon=folium.Icon(color=color, icon=icon, prefix='fa')
+        ).add_to(self.map)
+        
+        self.locations.append(location)
+
+    def add_store(self, store: LocationStore) -> None:
+        """Ajoute tous les lieux d'un LocationStore, directement depuis ses colonnes."""
+        if self.markers is None:
+            for i in range(len(store)):
+                self.add_location(store.view(i))
+            return
+
+        visited = store.visited_mask()
+        for i, (latitude, longitude) in enumerate(zip(store.latitudes.tolist(),
+                                                      store.longitudes.tolist())):
+            if visited[i]:
+                color, icon = 'green', 'check'
+            else:
+                color, icon = store.colors.get(i), 'info-sign'
+            self.markers.add_point(latitude, longitude, store.names.get(i),
+                                   store.descriptions.get(i), color, icon)
+    
+    def add_path(self, locations: List[Location], color: str = 'red',
+                 tolerance_m: Optional[float] = None, method: str = 'douglas-peucker',
+                 zoom_pyramid: bool = False, visited_only: bool = True) -> None:
+        """
+        Ajoute une ligne reliant les lieux visités dans l'ordre.
+
+        :param visited_only: False pour tracer tous les lieux donnés, par exemple
+                             un itinéraire prévu par TravelTracker.plan_route().
+        :param tolerance_m: si renseigné, simplifie le tracé (écart max en mètres).
+        :param method: 'douglas-peucker' ou 'visvalingam'.
+        :param zoom_pyramid: précalcule une version simplifiée par niveau de zoom
+                             (tolérance d'un pixel) et affiche celle du zoom courant.
+        """
+        if len(locations) < 2:
+            return
+            
+        points = [loc.get_coordinates() for loc in locations if loc.visited or not visited_only]
+        if len(points) < 2:
+            return
+
+        if zoom_pyramid:
+            self.path = ZoomPyramidPolyLine(
+                simplification_pyramid(points, method=method),
+                color=color,
+                weight=2.5,
+                opacity=1,
+                tooltip="Parcours effectué"
+            ).add_to(self.map)
+            return
+
+        if tolerance_m is not None:
+            points = simplify(points, tolerance_m, method).tolist()
+            
+        self.path = folium.PolyLine(
+            points,
+            color=color,
+            weight=2.5,
+            opacity=1,
+            tooltip="Parcours effectué"
+        ).add_to(self.map)
+    
+    def save(self, file_name: str = 'travel_map.html', external_data: Optional[bool] = None) -> None:
+        """
+        Sauvegarde la carte.
+
+        :param external_data: en mode fort volume, écrit les points dans un
+                              fichier `<nom>_points.json` à côté du HTML, dont
+                              la taille reste alors bornée (~35 octets par point
+                              sinon) ; la page doit alors être servie en HTTP.
+                              Par défaut, seulement au-delà de
+                              EXTERNAL_DATA_THRESHOLD points.
+        """
+        if external_data is None:
+            external_data = self.markers is not None and len(self.markers) > EXTERNAL_DATA_THRESHOLD
+        if self.markers is not None and external_data:
+            data_file = os.path.splitext(file_name)[0] + '_points.json'
+            self.markers.write_data_file(data_file)
+        self.map.save(file_name)
+
+    def save_and_open(self, file_name: str = 'travel_map.html') -> None:
+        """Sauvegarde la carte et l'ouvre dans le navigateur par défaut."""
+        self.save(file_name, external_data=False)  # fetch() est bloqué sur file://
+        webbrowser.open(f'file://{os.path.abspath(file_name)}')
+
+ANCHOR_INTERVAL = 1024  # Mises à jour incrémentales entre deux recalculs exacts du total
+
+class TravelTracker:
+    """Gère la logique des déplacements et statistiques."""
+    def __init__(self, attach_locations: bool = False):
+        """
+        :param attach_locations: retenir les objets Location passés à
+            add_location pour tenir à jour leurs attributs visited et color
+            (comme les listes d'objets d'origine). Désactivé par défaut : seules
+            les colonnes du stockage sont alors conservées.
+        """
+        self.store = LocationStore()
+        self.attach_locations = attach_locations
+        self._name_index = self.store.name_index  # Partagé : tenu à jour par les renommages
+        self._spatial_index: Optional[SpatialIndex] = None
+        # Distances (km, Vincenty) entre visites consécutives et leur total cumulé.
+        # Les étapes ajoutées en fin de parcours sont calculées en lot à la demande.
+        self._legs = np.zeros(0, dtype=np.float64)
+        self._leg_count = 0
+        self._distance_total = 0.0
+        self._reorders_seen = 0  # Réordonnancements du stockage déjà reflétés dans les étapes
+        self._coordinates_seen = 0  # Idem pour les déplacements de lieux (coordinates_version)
+        self._updates_since_anchor = 0  # Mises à jour incrémentales du total depuis le dernier recalage
+
+    @property
+    def locations(self) -> LocationSequence:
+        """Tous les lieux suivis, dans l'ordre d'ajout (append() : add_location)."""
+        return LocationSequence(self.store, append=self.add_location)
+
+    @property
+    def visited_locations(self) -> LocationSequence:
+        """Lieux visités, dans l'ordre des visites (append() : visite en fin de parcours)."""
+        return LocationSequence(self.store, visited_only=True, append=self._append_visit)
+    
+    def add_location(self, location: Location, visited: bool = False) -> int:
+        """
+        Ajoute un lieu avec option de marquage comme visité.
+
+        Les attributs du lieu sont copiés dans le stockage (visited et color de
+        l'objet reflètent l'ajout). Avec attach_locations, l'objet reste lié au
+        lieu suivi : mark_visited, insert_visit et remove_visit mettent alors à
+        jour ses attributs visited et color. Sinon, l'état courant se lit (et se
+        modifie) par la vue tracker.locations[i].
+
+        :return: indice du lieu dans le stockage.
+        """
+        color_before_visit = location.color
+        if visited:
+            location.visited = True
+            location.color = 'green'
+        index = self.store.append(location.name, location.latitude, location.longitude,
+                                  location.description, location.color, color_before_visit)
+        if self.attach_locations and isinstance(location, Location):
+            self.store.attach(index, location)
+        if visited:
+            self.store.mark_visited(index)
+        return index
+
+    def _color_visited(self, index: int) -> None:
+        """Passe un lieu en vert en retenant sa couleur pour remove_visit."""
+        if not self.store.is_visited(index):
+            self.store.colors_before_visit.set(index, self.store.colors.get(index))
+        self.store.set_color(index, 'green')
+
+    def _append_visit(self, location) -> None:
+        """visited_locations.append : visite d'un lieu suivi, ajouté au besoin."""
+        if isinstance(location, LocationView) and location._store is self.store:
+            index = location._index
+        else:
+            index = self.store.attached_index(location)
+            if index is None:
+                # Lieu déjà suivi aux mêmes attributs (égalité des champs, comme `in` sur les listes d'origine)
+                candidate = self._name_index.get(location.name.casefold())
+                if candidate is not None and self.store.view(candidate) == location:
+                    index = candidate
+        if index is None:
+            index = self.add_location(location)
+        self._color_visited(index)
+        self.store.mark_visited(index)
+
+    def add_locations(self, names: List[str], latitudes, longitudes,
+                      descriptions: Optional[List[str]] = None, visited: bool = False) -> None:
+        """Ajoute un bloc de lieux depuis des colonnes, sans créer d'objets Location."""
+        indices = self.store.extend(names, latitudes, longitudes, descriptions,
+                                    'green' if visited else 'blue', 'blue')
+        if visited:
+            for index in indices:
+                self.store.mark_visited(index)
+    
+    def mark_visited(self, location_name: str) -> None:
+        """Marque un lieu comme visité (recherche en O(1) dans l'index des noms)."""
+        index = self._name_index.get(location_name.casefold())
+        if index is None:
+            return
+        self._color_visited(index)
+        # Le bitmap des visites sert d'ensemble d'appartenance : pas de doublon
+        self.store.mark_visited(index)
+    
+    def _sync_legs(self) -> None:
+        """Calcule en un lot les étapes des visites ajoutées en fin de parcours."""
+        if (self.store.reorders != self._reorders_seen or
+                self.store.coordinates_version != self._coordinates_seen):
+            # Parcours modifié hors du tracker (LocationView.visited) ou lieu déplacé :
+            # tout est recalculé en un lot, plus simple que de retrouver les étapes touchées
+            self._leg_count = 0
+            self._distance_total = 0.0
+            self._reorders_seen = self.store.reorders
+            self._coordinates_seen = self.store.coordinates_version
+        order = self.store.visit_order
+        needed = max(len(order) - 1, 0)
+        if self._leg_count >= needed:
+            return
+        start = self._leg_count
+        new_legs = distances_etapes(self.store.coordinates(order[start:needed + 1]))
+        self._legs = _grow(self._legs, needed)
+        self._legs[start:needed] = new_legs
+        self._leg_count = needed
+        self._distance_total += float(new_legs.sum())
+
+    def _leg(self, first: int, second: int) -> float:
+        """Distance (km) entre deux lieux du stockage."""
+        return float(distances_etapes(self.store.coordinates(np.array([first, second])))[0])
+
+    def _replace_legs(self, start: int, stop: int, new_legs: List[float]) -> None:
+        """Remplace les étapes start..stop-1 par `new_legs` en ajustant le total."""
+        legs = self._legs[:self._leg_count]
+        self._distance_total += sum(new_legs) - float(legs[start:stop].sum())
+        self._legs = np.concatenate((legs[:start], new_legs, legs[stop:]))
+        self._leg_count = len(self._legs)
+        # Les ajouts/retraits successifs accumulent des erreurs d'arrondi : recalage périodique
+        self._updates_since_anchor += 1
+        if self._updates_since_anchor >= ANCHOR_INTERVAL:
+            self._distance_total = math.fsum(self._legs[:self._leg_count].tolist())
+            self._updates_since_anchor = 0
+
+    def insert_visit(self, position: int, location_name: str) -> None:
+        """
+        Insère la visite d'un lieu au milieu du parcours.
+
+        Seules les deux étapes qui touchent la nouvelle visite sont calculées.
+        """
+        index = self._name_index.get(location_name.casefold())
+        if index is None:
+            raise KeyError(f"Lieu inconnu : {location_name!r}")
+        self._sync_legs()
+        color = self.store.colors.get(index)
+        self.store.insert_visit(position, index)
+        self._reorders_seen = self.store.reorders  # Étapes mises à jour ci-dessous
+        self.store.colors_before_visit.set(index, color)
+        self.store.set_color(index, 'green')
+
+        order = self.store.visit_order
+        new_legs = []
+        if position > 0:
+            new_legs.append(self._leg(int(order[position - 1]), index))
+        if position < len(order) - 1:
+            new_legs.append(self._leg(index, int(order[position + 1])))
+        # L'étape remplacée est celle qui reliait les voisins de la nouvelle visite
+        replaced = 1 if 0 < position < len(order) - 1 else 0
+        self._replace_legs(max(position - 1, 0), max(position - 1, 0) + replaced, new_legs)
+
+    def remove_visit(self, position: int) -> None:
+        """Retire une visite du parcours ; seule l'étape qui relie ses voisins est calculée."""
+        self._sync_legs()
+        index = self.store.remove_visit(position)
+        self._reorders_seen = self.store.reorders  # Étapes mises à jour ci-dessous
+        self.store.set_color(index, self.store.colors_before_visit.get(index))
+
+        order = self.store.visit_order
+        if self._leg_count == 0:
+            return
+        if position == 0:
+            self._replace_legs(0, 1, [])
+        elif position == len(order):
+            self._replace_legs(position - 1, position, [])
+        else:
+            bridge = self._leg(int(order[position - 1]), int(order[position]))
+            self._replace_legs(position - 1, position + 1, [bridge])
+
+    def leg_distances(self) -> np.ndarray:
+        """Distances (km, Vincenty) entre visites consécutives."""
+        self._sync_legs()
+        return self._legs[:self._leg_count].copy()
+
+    def calculate_total_distance(self, method: str = 'vincenty') -> float:
+        """
+        Calcule la distance totale parcourue entre les lieux visités.
+
+        Avec 'vincenty', le total est tenu à jour au fil des visites : seules
+        les étapes nouvelles ou modifiées sont calculées.
+
+        :param method: 'vincenty' (ellipsoïde WGS-84, vectorisé), 'haversine'
+                       (sphère, plus rapide) ou 'geodesic' (geopy, paire par paire).
+        """
+        if len(self.visited_locations) < 2:
+            return 0.0
+
+        if method == 'vincenty':
+            self._sync_legs()
+            return round(self._distance_total, 2)
+
+        coordinates = self.visited_locations.coordinates()
+        if method == 'geodesic':
+            total = 0.0
+            for i in range(len(coordinates)-1):
+                total += geodesic(coordinates[i], coordinates[i+1]).kilometers
+            return round(total, 2)
+
+        return round(distance_totale(coordinates, method), 2)
+    
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """Index spatial des lieux, créé à la demande et tenu à jour automatiquement."""
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.store)
+        return self._spatial_index
+
+    def locations_within(self, latitude: float, longitude: float,
+                         radius_km: float) -> List[LocationView]:
+        """Retourne les lieux à moins de `radius_km` du point, du plus proche au plus loin."""
+        indices, _ = self.spatial_index.within_radius(latitude, longitude, radius_km)
+        return [self.store.view(int(i)) for i in indices]
+
+    def nearest_unvisited(self, latitude: float, longitude: float,
+                          k: int = 1) -> List[LocationView]:
+        """Retourne les `k` lieux non visités les plus proches du point."""
+        indices, _ = self.spatial_index.nearest(latitude, longitude, k, unvisited_only=True)
+        return [self.store.view(int(i)) for i in indices]
+
+    def plan_route(self, **options) -> Tuple[List[LocationView], float]:
+        """
+        Propose un ordre de visite des lieux non visités.
+
+        Le trajet part du dernier lieu visité (s'il existe), qui est inclus en
+        tête de la liste retournée pour pouvoir la tracer avec
+        TravelMap.add_path(..., visited_only=False).
+
+        :param options: transmis à travel_route.plan_route (neighbours,
+                        processes, restarts, time_limit_s).
+        :return: (lieux dans l'ordre, distance totale en km)
+        """
+        unvisited = np.flatnonzero(~self.store.visited_mask())
+        visit_order = self.store.visit_order
+        start_index = int(visit_order[-1]) if len(visit_order) else None
+        start = self.store.coordinates()[start_index] if start_index is not None else None
+
+        plan = plan_route(self.store.coordinates(unvisited), start=start, **options)
+        route = [self.store.view(int(i)) for i in unvisited[plan.order]]
+        if start_index is not None:
+            route.insert(0, self.store.view(start_index))
+        return route, round(plan.distance_km, 2)
+
+    def get_visited_locations(self) -> List[LocationView]:
+        """Retourne la liste des lieux visités dans l'ordre."""
+        return list(self.visited_locations)
+
+@dataclass
+class MapExportResult:
+    """Bilan du rendu d'une carte exportée."""
+    trip_id: str
+    path: str
+    points: int
+    render_seconds: float
+    size_bytes: int
+
+def _trip_file_name(trip_id: str) -> str:
+    """Nom de fichier sûr et stable pour un identifiant de voyage."""
+    return re.sub(r'[^\w.-]+', '_', trip_id).strip('._') or 'trip'
+
+def _render_trip_map(job: Tuple[str, str, LocationStore, dict]) -> MapExportResult:
+    """Rend et sauvegarde la carte d'un voyage (exécuté dans un processus du pool)."""
+    trip_id, path, store, options = job
+    start = time.perf_counter()
+
+    visit_order = store.visit_order
+    center = store.view(int(visit_order[0]) if len(visit_order) else 0)
+    travel_map = TravelMap(center, options['zoom_start'], high_volume=options['high_volume'])
+    travel_map.add_store(store)
+    travel_map.add_path(LocationSequence(store, visited_only=True),
+                        tolerance_m=options['path_tolerance_m'])
+    travel_map.save(path, external_data=options['external_data'])
+
+    return MapExportResult(trip_id, path, len(store), time.perf_counter() - start,
+                           os.path.getsize(path))
+
+def export_maps(trackers: Union[Mapping[str, 'TravelTracker'], List['TravelTracker']],
+                output_dir: str, processes: Optional[int] = None, zoom_start: int = 13,
+                high_volume: bool = True, external_data: Optional[bool] = None,
+                path_tolerance_m: Optional[float] = None) -> List[MapExportResult]:
+    """
+    Exporte la carte de chaque voyage sans ouvrir de navigateur.
+
+    Les cartes sont rendues en parallèle dans un pool de processus et écrites
+    dans `output_dir/<identifiant>.html` (identifiants `trip_00000`, ... pour
+    une liste). Les voyages sans lieu sont ignorés.
+
+    :param high_volume: une couche BulkMarkerLayer par carte (par défaut), bien
+                        plus rapide à rendre qu'un folium.Marker par lieu.
+    :param external_data: voir TravelMap.save. Par défaut, les points d'une carte
+                          de plus de EXTERNAL_DATA_THRESHOLD lieux sont écrits
+                          dans `<identifiant>_points.json` (HTML de quelques Ko
+                          au lieu de ~7 Mo pour 200 000 points, mais servi en
+                          HTTP) ; False pour des HTML autonomes.
+    :param processes: taille du pool (par défaut : nombre de cœurs) ; 1 pour
+                      tout rendre dans le processus courant.
+    :return: un MapExportResult par carte, dans l'ordre des voyages.
+    """
+    if isinstance(trackers, Mapping):
+        items = [(str(trip_id), tracker) for trip_id, tracker in trackers.items()]
+    else:
+        width = max(5, len(str(len(trackers))))
+        items = [(f"trip_{i:0{width}d}", tracker) for i, tracker in enumerate(trackers)]
+
+    os.makedirs(output_dir, exist_ok=True)
+    options = {'zoom_start': zoom_start, 'high_volume': high_volume,
+               'external_data': external_data, 'path_tolerance_m': path_tolerance_m}
+    jobs = [(trip_id, os.path.join(output_dir, _trip_file_name(trip_id) + '.html'),
+             tracker.store, options)
+            for trip_id, tracker in items if len(tracker.store)]
+    paths = [job[1] for job in jobs]
+    if len(set(paths)) != len(paths):
+        raise ValueError("Plusieurs voyages donnent le même nom de fichier")
+
+    if processes == 1 or len(jobs) <= 1:
+        return [_render_trip_map(job) for job in jobs]
+    workers = processes or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_trip_map, jobs, chunksize=chunksize))
+
+def main():
+    # Initialisation avec des données plus complètes
+    cities = [
+        Location("Paris", 48.8566, 2.3522, 
+                "Capitale de la France", True),
+        Location("Lyon", 45.7640, 4.8357, 
+                "Ville gastronomique", True),
+        Location("Marseille", 43.2965, 5.3698, 
+                "Port méditerranéen", True),
+        Location("Bordeaux", 44.8378, -0.5792, 
+                "Capitale du vin", False),
+        Location("Nice", 43.7102, 7.2620, 
+                "Station balnéaire", False)
+    ]
+    
+    # Initialisation des composants
+    tracker = TravelTracker()
+    for city in cities:
+        tracker.add_location(city, city.visited)
+    
+    # Création de la carte
+    travel_map = TravelMap(cities[0])  # Centrée sur Paris
+    
+    # Ajout des lieux et marquage
+    for city in cities:
+        travel_map.add_location(city)
+    
+    # Ajout du parcours entre les lieux visités
+    travel_map.add_path(tracker.get_visited_locations())
+    
+    # Calcul des statistiques
+    distance = tracker.calculate_total_distance()
+    print(f"Distance totale parcourue: {distance} km")
+    print(f"Lieux visités: {len(tracker.visited_locations)}/{len(cities)}")
+    
+    # Sauvegarde et affichage
+    travel_map.save_and_open("voyage_france.html")
+
+if __name__ == "__main__":
+    main()
+    
+     
+### Licence MIT
+
+
+### Licence MIT pour la vente de produits numériques
+
+### Copyright (c) 2025 [REFOÏA JEREMY LOUIS]
+### SIRET 95108513300019 
+
+
+### Autorisation est par la présente accordée, sans frais,
+###à toute personne obtenant une copie de ce produit numérique
+###et des fichiers de documentation associés (le "Produit"), 
+###de traiter le Produit sans restriction, y compris,
+###mais sans s'y limiter, les droits d'utiliser, de copier, de modifier,
+###de fusionner, de publier, de distribuer, de sous-licencier et/ou de vendre des copies
+###du Produit, et de permettre aux personnes à qui le Produit 
+###est fourni de le faire, sous réserve des conditions suivantes :
+
+###L'avis de copyright ci-dessus et cet avis d'autorisation 
+###doivent être inclus dans toutes les copies ou parties substantielles du Produit.
+
+###LE PRODUIT EST FOURNI "EN L'ÉTAT", SANS GARANTIE 
+###D'AUCUNE SORTE, EXPRESSE OU IMPLICITE, Y COMPRIS,
+###MAIS SANS S'Y LIMITER, LES GARANTIES DE QUALITÉ MARCHANDE, D'ADÉQUATION
+###À UN USAGE PARTICULIER ET DE NON-CONTREFAÇON. 
+###EN AUCUN CAS LES AUTEURS OU LES DÉTENTEURS DE DROITS D'AUTEUR NE SERONT RESPONSABLES DE TOUTE RÉCLAMATION,
+###DOMMAGE OU AUTRE RESPONSABILITÉ, QU'IL S'AGISSE 
+###D'UNE ACTION CONTRACTUELLE, DÉLICTUELLE OU AUTRE, DÉCOULANT DE,
+###OU EN RELATION AVEC LE PRODUIT OU SON UTILISATION OU D'AUTRES TRANSACTIONS AVEC LE PRODUIT.
+
+### Améliorations apportées :
+
+###1. **Typage et documentation** :
+   ### Utilisation de type hints pour une meilleure maintenabilité
+   ### Docstrings complètes pour toutes les méthodes
+   ### Utilisation de dataclass pour la classe Location
+
+###2. **Fonctionnalités enrichies** :
+   ### Gestion des lieux visités/non visités avec couleurs différentes
+   ### Ajout de descriptions pour chaque lieu
+   ### Traçage du parcours entre les lieux visités
+   ### Ouverture automatique dans le navigateur
+   ### Statistiques supplémentaires (nombre de lieux visités)
+
+###3. **Meilleure organisation** :
+   ### Séparation claire entre la logique métier (TravelTracker) et l'affichage (TravelMap)
+   ### Méthodes plus spécialisées et atomiques
+   ### Gestion des états plus robuste
+
+###4. **Expérience utilisateur améliorée** :
+   ### Popups plus informatifs avec HTML
+   ### Tooltips pour les marqueurs
+   ### Icônes Font Awesome
+   ### Choix des fonds de carte
+
+###5. **Robustesse accrue** :
+   ### Vérification des préconditions
+   ### Gestion des cas limites
+   ### Copie des listes pour éviter les effets de bord
+
 ###Ce code offre maintenant une solution plus complète et professionnelle pour suivre et visualiser des déplacements géographiques.
\ No newline at end of file
@@ -1,108 +1,414 @@
-import random
-
-class CatastropheNaturelle:
-    def __init__(self, nom, impact_environnemental, frequence, duree_recuperation=None):
-        """
-        - nom : Nom de la catastrophe.
-        - impact_environnemental : Dictionnaire {élément : impact (coefficient de réduction)}.
-        - frequence : Probabilité d'occurrence.
-        - duree_recuperation : Temps en cycles avant que certains éléments se rétablissent.
-        """
-        self.nom = nom
-        self.impact_environnemental = impact_environnemental
-        self.frequence = frequence
-        self.duree_recuperation = duree_recuperation if duree_recuperation else {}
-
-    def declencher(self, ecosysteme):
-        print(f"\n⚠️ Catastrophe en cours : {self.nom} ⚠️")
-        for element, impact in self.impact_environnemental.items():
-            if element in ecosysteme:
-                ecosysteme[element] *= impact  # Applique un coefficient de réduction
-                ecosysteme[element] = max(0, round(ecosysteme[element], 2))  # Évite les valeurs négatives
-                print(f"🔻 {element.capitalize()} réduit à {ecosysteme[element]}")
-
-        # Planifier la récupération si applicable
-        for element, cycles in self.duree_recuperation.items():
-            if element in ecosysteme:
-                print(f"🔄 {element.capitalize()} commencera à se rétablir dans {cycles} cycles.")
-                ecosysteme[f"recup_{element}"] = cycles  # Ajoute un compteur de récupération
-
-class EruptionVolcanique(CatastropheNaturelle):
-    def __init__(self):
-        super().__init__(
-            nom="Éruption Volcanique",
-            impact_environnemental={"végétation": 0.2, "faune": 0.5, "population": 0.7, "température": 0.9},
-            frequence=0.01,
-            duree_recuperation={"température": 5, "végétation": 10}  # La température et la végétation récupèrent avec le temps
-        )
-
-class Seisme(CatastropheNaturelle):
-    def __init__(self):
-        super().__init__(
-            nom="Séisme",
-            impact_environnemental={"population": 0.8, "faune": 0.9, "infrastructures": 0.5},
-            frequence=0.02,
-            duree_recuperation={"infrastructures": 15}  # Les infrastructures mettent du temps à être reconstruites
-        )
-
-class Tempete(CatastropheNaturelle):
-    def __init__(self):
-        super().__init__(
-            nom="Tempête",
-            impact_environnemental={"végétation": 0.7, "faune": 0.85, "population": 0.95},
-            frequence=0.05,
-            duree_recuperation={"végétation": 5}  # La végétation récupère rapidement
-        )
-
-class IncendieForet(CatastropheNaturelle):
-    def __init__(self):
-        super().__init__(
-            nom="Incendie de Forêt",
-            impact_environnemental={"végétation": 0.3, "faune": 0.6},
-            frequence=0.03,
-            duree_recuperation={"végétation": 8}  # La forêt repousse lentement
-        )
-
-def declencher_evenements_aleatoires(ecosysteme):
-    """
-    Vérifie si une catastrophe doit être déclenchée en fonction des probabilités.
-    """
-    catastrophes = [EruptionVolcanique(), Seisme(), Tempete(), IncendieForet()]
-    
-    for catastrophe in catastrophes:
-        if random.random() < catastrophe.frequence:
-            catastrophe.declencher(ecosysteme)
-
-def recuperation_ecosysteme(ecosysteme):
-    """
-    Gère la récupération des éléments touchés après une catastrophe.
-    """
-    elements_a_recuperer = [key for key in ecosysteme if key.startswith("recup_")]
-    
-    for key in elements_a_recuperer:
-        element = key.replace("recup_", "")
-        if ecosysteme[key] > 0:
-            ecosysteme[key] -= 1  # Diminue le temps de récupération
-            if ecosysteme[key] == 0:
-                print(f"✅ {element.capitalize()} a retrouvé son état normal !")
-                ecosysteme[element] = min(ecosysteme[element] * 1.5, 100)  # Récupération progressive
-                del ecosysteme[key]  # Supprime le compteur de récupération
-
-def afficher_ecosysteme(ecosysteme):
-    """
-    Affiche l'état actuel de l'écosystème.
-    """
-    print("\n📊 État actuel de l'écosystème :")
-    for key, value in ecosysteme.items():
-        if not key.startswith("recup_"):  # Ne pas afficher les compteurs de récupération
-            print(f"{key.capitalize()} : {value}")
-
-# 🌍 Exemple de simulation
-ecosysteme = {"végétation": 100, "faune": 100, "population": 100, "température": 20, "infrastructures": 100}
-
-for cycle in range(1, 31):  # Simuler 30 jours
-    print(f"\n🌿 Jour {cycle} 🌿")
-    declencher_evenements_aleatoires(ecosysteme)
-    recuperation_ecosysteme(ecosysteme)
-    afficher_ecosysteme(ecosysteme)
-    print("-" * 40)
+import bisect
+import heapq
+import itertools
+import json
+import math
+import random
+
+import numpy as np
+
+from journal_evenements import (DECLENCHEMENT, IMPACT, PLANIFICATION, RECUPERATION,
+                               JournalConsole, JournalNul)
+
+JOURNAL_PAR_DEFAUT = JournalNul()  # Mode batch : aucun affichage
+
+# Politiques en cas de récupérations qui se chevauchent pour un même élément
+REMPLACER = "remplacer"  # La dernière planification remplace la précédente (comportement d'origine)
+PROLONGER = "prolonger"  # Seule l'échéance la plus tardive est conservée
+CUMULER = "cumuler"  # Chaque planification produit sa propre récupération
+POLITIQUES = (REMPLACER, PROLONGER, CUMULER)
+
+class PlanificateurRecuperation:
+    """
+    Minuteries de récupération d'un écosystème, rangées dans un tas (min-heap)
+    par cycle d'échéance. Chaque cycle, avancer() ne traite que les
+    minuteries échues au lieu de parcourir tous les compteurs.
+
+    Une entrée remplacée n'est pas retirée du tas : elle est ignorée quand
+    elle arrive en tête (son échéance ne correspond plus à celle de l'élément).
+    """
+
+    def __init__(self, politique=REMPLACER):
+        if politique not in POLITIQUES:
+            raise ValueError(f"Politique inconnue : {politique!r} (attendu : {', '.join(POLITIQUES)})")
+        self.politique = politique
+        self.cycle = 0
+        self._tas = []  # (échéance, numéro d'ordre, élément)
+        self._echeances = {}  # {élément : échéance active} (REMPLACER, PROLONGER)
+        self._actives = {}  # {élément : nombre de minuteries actives} (CUMULER)
+        self._ordre = itertools.count()
+
+    def planifier(self, element, cycles):
+        """
+        Programme le rétablissement de `element` dans `cycles` cycles
+        (au moins un : au prochain appel à avancer()).
+        """
+        echeance = self.cycle + max(int(cycles), 1)
+        if self.politique == CUMULER:
+            self._actives[element] = self._actives.get(element, 0) + 1
+        else:
+            if self.politique == PROLONGER and element in self._echeances:
+                echeance = max(echeance, self._echeances[element])
+            self._echeances[element] = echeance
+        heapq.heappush(self._tas, (echeance, next(self._ordre), element))
+
+    def avancer(self):
+        """
+        Passe au cycle suivant et retourne la liste des éléments à rétablir.
+        """
+        self.cycle += 1
+        echus = []
+        tas = self._tas
+        while tas and tas[0][0] <= self.cycle:
+            echeance, _, element = heapq.heappop(tas)
+            if self.politique == CUMULER:
+                self._actives[element] -= 1
+                if not self._actives[element]:
+                    del self._actives[element]
+            elif self._echeances.get(element) == echeance:
+                del self._echeances[element]
+            else:
+                continue  # Minuterie remplacée entre-temps
+            echus.append(element)
+        return echus
+
+    def restant(self, element):
+        """
+        Nombre de cycles avant le prochain rétablissement de `element` (None s'il n'y en a pas).
+        """
+        if self.politique == CUMULER:
+            if element not in self._actives:
+                return None
+            return min(e for e, _, nom in self._tas if nom == element) - self.cycle
+        echeance = self._echeances.get(element)
+        return None if echeance is None else echeance - self.cycle
+
+    def __len__(self):
+        """
+        Nombre de récupérations en attente.
+        """
+        if self.politique == CUMULER:
+            return sum(self._actives.values())
+        return len(self._echeances)
+
+    def __contains__(self, element):
+        return element in self._actives or element in self._echeances
+
+class Ecosysteme(dict):
+    """
+    Dictionnaire {élément : valeur} accompagné de ses récupérations en
+    attente, gardées à part dans `recuperations` (PlanificateurRecuperation).
+    """
+
+    def __init__(self, elements=(), politique=REMPLACER, **kwargs):
+        super().__init__(elements, **kwargs)
+        self.recuperations = PlanificateurRecuperation(politique)
+
+PREFIXE_COMPTEUR = "recup_"
+
+class CompteursRecuperation:
+    """
+    Planificateur d'un dictionnaire ordinaire : les récupérations restent
+    des compteurs `recup_<élément>` dans le dictionnaire lui-même, gérés
+    exactement comme avant l'introduction du PlanificateurRecuperation
+    (politique REMPLACER, chaque compteur décrémenté à chaque cycle).
+    Ecosysteme évite ce parcours de tous les compteurs.
+    """
+
+    politique = REMPLACER
+
+    def __init__(self, ecosysteme):
+        self.ecosysteme = ecosysteme
+
+    def planifier(self, element, cycles):
+        self.ecosysteme[PREFIXE_COMPTEUR + element] = cycles
+
+    def avancer(self):
+        echus = []
+        for cle in [cle for cle in self.ecosysteme if cle.startswith(PREFIXE_COMPTEUR)]:
+            if self.ecosysteme[cle] > 0:
+                self.ecosysteme[cle] -= 1  # Diminue le temps de récupération
+                if self.ecosysteme[cle] == 0:
+                    del self.ecosysteme[cle]
+                    echus.append(cle[len(PREFIXE_COMPTEUR):])
+        return echus
+
+    def restant(self, element):
+        return self.ecosysteme.get(PREFIXE_COMPTEUR + element)
+
+    def __len__(self):
+        return sum(1 for cle in self.ecosysteme if cle.startswith(PREFIXE_COMPTEUR))
+
+    def __contains__(self, element):
+        return PREFIXE_COMPTEUR + element in self.ecosysteme
+
+def _planificateur(ecosysteme):
+    """
+    Planificateur de récupération de l'écosystème : celui d'un Ecosysteme, ou
+    des compteurs `recup_` pour un dictionnaire ordinaire.
+    """
+    recuperations = getattr(ecosysteme, "recuperations", None)
+    return CompteursRecuperation(ecosysteme) if recuperations is None else recuperations
+
+class CatastropheNaturelle:
+    def __init__(self, nom, impact_environnemental, frequence, duree_recuperation=None):
+        """
+        - nom : Nom de la catastrophe.
+        - impact_environnemental : Dictionnaire {élément : impact (coefficient de réduction)}.
+        - frequence : Probabilité d'occurrence.
+        - duree_recuperation : Temps en cycles avant que certains éléments se rétablissent.
+        """
+        self.nom = nom
+        self.impact_environnemental = impact_environnemental
+        self.frequence = frequence
+        self.duree_recuperation = duree_recuperation if duree_recuperation else {}
+
+    def declencher(self, ecosysteme, journal=None):
+        """
+        Applique la catastrophe à l'écosystème ; les événements sont envoyés
+        au `journal` (par défaut JOURNAL_PAR_DEFAUT).
+        """
+        journal = JOURNAL_PAR_DEFAUT if journal is None else journal
+        actif = journal.actif
+        if actif:
+            journal.emettre(DECLENCHEMENT, self.nom)
+        for element, impact in self.impact_environnemental.items():
+            if element in ecosysteme:
+                avant = ecosysteme[element]
+                ecosysteme[element] *= impact  # Applique un coefficient de réduction
+                ecosysteme[element] = max(0, round(ecosysteme[element], 2))  # Évite les valeurs négatives
+                if actif:
+                    journal.emettre(IMPACT, self.nom, element, avant, ecosysteme[element])
+
+        # Planifier la récupération si applicable
+        if self.duree_recuperation:
+            recuperations = _planificateur(ecosysteme)
+            for element, cycles in self.duree_recuperation.items():
+                if element in ecosysteme:
+                    if actif:
+                        journal.emettre(PLANIFICATION, self.nom, element, 0, cycles)
+                    recuperations.planifier(element, cycles)
+
+class EruptionVolcanique(CatastropheNaturelle):
+    def __init__(self):
+        super().__init__(
+            nom="Éruption Volcanique",
+            impact_environnemental={"végétation": 0.2, "faune": 0.5, "population": 0.7, "température": 0.9},
+            frequence=0.01,
+            duree_recuperation={"température": 5, "végétation": 10}  # La température et la végétation récupèrent avec le temps
+        )
+
+class Seisme(CatastropheNaturelle):
+    def __init__(self):
+        super().__init__(
+            nom="Séisme",
+            impact_environnemental={"population": 0.8, "faune": 0.9, "infrastructures": 0.5},
+            frequence=0.02,
+            duree_recuperation={"infrastructures": 15}  # Les infrastructures mettent du temps à être reconstruites
+        )
+
+class Tempete(CatastropheNaturelle):
+    def __init__(self):
+        super().__init__(
+            nom="Tempête",
+            impact_environnemental={"végétation": 0.7, "faune": 0.85, "population": 0.95},
+            frequence=0.05,
+            duree_recuperation={"végétation": 5}  # La végétation récupère rapidement
+        )
+
+class IncendieForet(CatastropheNaturelle):
+    def __init__(self):
+        super().__init__(
+            nom="Incendie de Forêt",
+            impact_environnemental={"végétation": 0.3, "faune": 0.6},
+            frequence=0.03,
+            duree_recuperation={"végétation": 8}  # La forêt repousse lentement
+        )
+
+FREQUENCE_MAX = 1 - 2 ** -53  # Une fréquence de 1 est ramenée juste en dessous (log fini)
+
+class RegistreCatastrophes:
+    """
+    Types de catastrophes enregistrés une seule fois, avec leurs fréquences
+    précompilées en une table cumulative de survie :
+    L[k] = Σ_{j<k} log(1 - frequence_j).
+
+    Les catastrophes restent indépendantes, mais un seul tirage uniforme u
+    suffit pour un cycle : la première catastrophe déclenchée est la
+    plus petite k telle que L[k+1] < L[s] + log(1 - u) (recherche
+    dichotomique), puis u est remis à l'échelle dans l'intervalle de k, ce
+    qui fournit un nouveau tirage uniforme pour les catastrophes suivantes.
+    Le coût d'un cycle dépend du nombre de déclenchements, pas du nombre de
+    types enregistrés.
+    """
+
+    def __init__(self, catastrophes=()):
+        self.catastrophes = []
+        self._indices = {}  # {nom : indice}
+        for catastrophe in catastrophes:
+            self.enregistrer(catastrophe)
+
+    def enregistrer(self, catastrophe, remplacer=False):
+        """
+        Enregistre une catastrophe (instance ou sous-classe sans argument de
+        CatastropheNaturelle) et retourne l'instance enregistrée.
+        """
+        if isinstance(catastrophe, type):
+            catastrophe = catastrophe()
+        if not 0 <= catastrophe.frequence <= 1:
+            raise ValueError(f"Fréquence invalide pour {catastrophe.nom!r} : {catastrophe.frequence}")
+        indice = self._indices.get(catastrophe.nom)
+        if indice is None:
+            self._indices[catastrophe.nom] = len(self.catastrophes)
+            self.catastrophes.append(catastrophe)
+        elif remplacer:
+            self.catastrophes[indice] = catastrophe
+        else:
+            raise ValueError(f"Catastrophe déjà enregistrée : {catastrophe.nom!r}")
+        self._compiler()
+        return catastrophe
+
+    def charger(self, chemin, remplacer=False):
+        """
+        Enregistre les catastrophes décrites dans un fichier JSON :
+        {"catastrophes": [{"nom": ..., "impact_environnemental": {...},
+        "frequence": ..., "duree_recuperation": {...}}, ...]}
+        (une simple liste de ces objets est aussi acceptée).
+        """
+        with open(chemin, encoding="utf-8") as fichier:
+            config = json.load(fichier)
+        definitions = config["catastrophes"] if isinstance(config, dict) else config
+        for definition in definitions:
+            self.enregistrer(CatastropheNaturelle(**definition), remplacer=remplacer)
+        return self
+
+    def _compiler(self):
+        frequences = np.minimum([c.frequence for c in self.catastrophes], FREQUENCE_MAX)
+        self.frequences = np.asarray(frequences, dtype=np.float64)
+        self.survie = np.concatenate(([0.0], np.cumsum(np.log1p(-self.frequences))))
+        self._survie_opposee = -self.survie  # Croissante, pour searchsorted
+        self._survie_liste = self.survie.tolist()
+        self._survie_opposee_liste = self._survie_opposee.tolist()
+        self.probabilite_totale = -math.expm1(self.survie[-1])  # Au moins un déclenchement
+
+    def __len__(self):
+        return len(self.catastrophes)
+
+    def __getitem__(self, nom):
+        return self.catastrophes[self._indices[nom]]
+
+    def __contains__(self, nom):
+        return nom in self._indices
+
+    def tirer(self, u):
+        """
+        Indices (croissants) des catastrophes déclenchées par le tirage uniforme u.
+        """
+        survie, opposee = self._survie_liste, self._survie_opposee_liste
+        fin = len(survie)
+        declenchees = []
+        position = 0
+        while True:
+            seuil = survie[position] + math.log1p(-u)
+            suivante = bisect.bisect_right(opposee, -seuil, position)
+            if suivante == fin:
+                return declenchees
+            declenchees.append(suivante - 1)
+            # Position de u dans l'intervalle de la catastrophe : nouveau tirage uniforme
+            u = math.expm1(seuil - survie[suivante - 1]) / math.expm1(survie[suivante] - survie[suivante - 1])
+            position = suivante
+
+    def tirer_lot(self, u):
+        """
+        Version vectorisée de tirer() pour un tableau de tirages (un par écosystème).
+        Génère, par vague, des couples (lignes, indices) : dans une vague chaque
+        ligne apparaît au plus une fois, et ses indices croissent d'une vague à l'autre.
+        """
+        # Première vague : seules les lignes où au moins une catastrophe se déclenche
+        lignes = np.flatnonzero(u < self.probabilite_totale)
+        u = u[lignes]
+        position = np.zeros(len(lignes), dtype=np.intp)
+        fin = len(self.survie)
+        while len(lignes):
+            seuil = self.survie[position] + np.log1p(-u)
+            suivante = np.searchsorted(self._survie_opposee, -seuil, side="right")
+            declenche = suivante < fin
+            lignes, suivante, seuil = lignes[declenche], suivante[declenche], seuil[declenche]
+            if not len(lignes):
+                return
+            yield lignes, suivante - 1
+            u = (np.expm1(seuil - self.survie[suivante - 1]) /
+                 np.expm1(self.survie[suivante] - self.survie[suivante - 1]))
+            position = suivante
+
+    def tables(self, elements):
+        """
+        Coefficients précompilés pour des écosystèmes aux colonnes `elements` :
+        pour chaque catastrophe, (colonnes, coefficients) des impacts et
+        (colonnes, durées) des récupérations.
+        """
+        colonne = {element: i for i, element in enumerate(elements)}
+        impacts, recuperations = [], []
+        for catastrophe in self.catastrophes:
+            touches = [e for e in catastrophe.impact_environnemental if e in colonne]
+            impacts.append((
+                np.array([colonne[e] for e in touches], dtype=np.intp),
+                np.array([catastrophe.impact_environnemental[e] for e in touches]),
+            ))
+            recuperes = [e for e in catastrophe.duree_recuperation if e in colonne]
+            recuperations.append((
+                np.array([colonne[e] for e in recuperes], dtype=np.intp),
+                np.array([catastrophe.duree_recuperation[e] for e in recuperes], dtype=np.int32),
+            ))
+        return impacts, recuperations
+
+def registre_par_defaut():
+    """
+    Registre des quatre catastrophes d'origine, dans l'ordre où elles sont testées.
+    """
+    return RegistreCatastrophes([EruptionVolcanique, Seisme, Tempete, IncendieForet])
+
+REGISTRE_PAR_DEFAUT = registre_par_defaut()
+
+def declencher_evenements_aleatoires(ecosysteme, journal=None, registre=None):
+    """
+    Vérifie si une catastrophe doit être déclenchée en fonction des probabilités.
+    Un seul tirage aléatoire par cycle, quel que soit le nombre de catastrophes
+    du `registre` (par défaut REGISTRE_PAR_DEFAUT).
+    """
+    registre = REGISTRE_PAR_DEFAUT if registre is None else registre
+    for indice in registre.tirer(random.random()):
+        registre.catastrophes[indice].declencher(ecosysteme, journal)
+
+def recuperation_ecosysteme(ecosysteme, journal=None):
+    """
+    Gère la récupération des éléments touchés après une catastrophe.
+    """
+    journal = JOURNAL_PAR_DEFAUT if journal is None else journal
+
+    # Seules les minuteries échues à ce cycle sont traitées
+    for element in _planificateur(ecosysteme).avancer():
+        avant = ecosysteme[element]
+        ecosysteme[element] = min(ecosysteme[element] * 1.5, 100)  # Récupération progressive
+        if journal.actif:
+            journal.emettre(RECUPERATION, "", element, avant, ecosysteme[element])
+
+def afficher_ecosysteme(ecosysteme, journal=None):
+    """
+    Affiche l'état actuel de l'écosystème (via le journal).
+    """
+    journal = JOURNAL_PAR_DEFAUT if journal is None else journal
+    if journal.actif:
+        journal.etat(ecosysteme)
+
+# 🌍 Exemple de simulation
+if __name__ == "__main__":
+    ecosysteme = Ecosysteme({"végétation": 100, "faune": 100, "population": 100, "température": 20, "infrastructures": 100})
+    journal = JournalConsole()
+
+    for cycle in range(1, 31):  # Simuler 30 jours
+        journal.debut_cycle(cycle)
+        declencher_evenements_aleatoires(ecosysteme, journal)
+        recuperation_ecosysteme(ecosysteme, journal)
+        afficher_ecosysteme(ecosysteme, journal)
+        journal.fin_cycle()
@@ -1,84 +1,107 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Calculateur de consommation d'essence et de coût d'entretien
-pour une Porsche 992 TechArt GTstreet R (ou tout autre véhicule).
-
-Fonctionnalités :
-- Demande à l'utilisateur les paramètres nécessaires.
-- Calcule le carburant consommé et son prix.
-- Calcule le coût d'entretien proportionnel aux kilomètres parcourus.
-- Affiche les résultats avec deux décimales.
-"""
-
-def calculer_cout_essence(distance_km: float,
-                          consommation_l_100km: float,
-                          prix_litre_eur: float) -> float:
-    """
-    Retourne le coût total du carburant pour la distance indiquée.
-
-    :param distance_km: distance parcourue en kilomètres.
-    :param consommation_l_100km: consommation moyenne (L/100 ; ex. 12.5).
-    :param prix_litre_eur: prix du litre d'essence en euros.
-    :return: coût en euros.
-    """
-    # litres consommés = (distance / 100) × consommation
-    litres = (distance_km / 100.0) * consommation_l_100km
-    return litres * prix_litre_eur
-
-
-def calculer_cout_entretien(kilometres_parcourus: float,
-                            cout_annuel_eur: float,
-                            km_par_an: float) -> float:
-    """
-    Retourne le coût d'entretien proportionnel aux kilomètres parcourus.
-
-    :param kilometres_parcourus: total de kilomètres effectués.
-    :param cout_annuel_eur: coût d'entretien estimé sur une année.
-    :param km_par_an: nombre de kilomètres parcourus en moyenne chaque année.
-    :return: coût d'entretien en euros.
-    """
-    if km_par_an <= 0:
-        # Pas de kilométrage annuel renseigné → on renvoie 0 (ou on pourrait lever une exception)
-        return 0.0
-    proportion = kilometres_parcourus / km_par_an
-    return proportion * cout_annuel_eur
-
-
-def demander_float(message: str) -> float:
-    """
-    Demande à l'utilisateur un nombre réel et répète tant que l'entrée n'est pas valide.
-    """
-    while True:
-        try:
-            valeur = float(input(message).replace(',', '.'))  # accepte la virgule française
-            return valeur
-        except ValueError:
-            print("⚠️  Entrée invalide ; veuillez saisir un nombre.")
-
-
-def main():
-    print("\n=== Calculateur de consommation d'essence et d'entretien ===\n")
-
-    # Entrées utilisateur
-    distance = demander_float("Distance parcourue (km) : ")
-    consommation = demander_float("Consommation moyenne (L/100 km) : ")
-    prix_essence = demander_float("Prix du litre d'essence (€/L) : ")
-    km_totaux = demander_float("Kilomètres totaux parcourus sur le véhicule : ")
-    cout_entretien_annuel = demander_float("Coût d'entretien annuel estimé (€/an) : ")
-    km_par_an = demander_float("Kilométrage moyen annuel (km/an) : ")
-
-    # Calculs
-    cout_essence = calculer_cout = calculer_cout_essence(distance, consommation, prix_essence)
-    cout_entretien = calculer_cout_entretien(km_totaux, cout_entretien_annuel, km_par_an)
-
-    # Résultats
-    print("\n--- Résultats ---")
-    print(f"Coût total d'essence : {cout_essence:.2f} €")
-    print(f"Coût d'entretien estimé : {cout_entretien:.2f} €")
-    print("\nMerci d'avoir utilisé le calculateur !")
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Calculateur de consommation d'essence et de coût d'entretien
+pour une Porsche 992 TechArt GTstreet R (ou tout autre véhicule).
+
+Fonctionnalités :
+- Demande à l'utilisateur les paramètres nécessaires.
+- Calcule le carburant consommé et son prix.
+- Calcule le coût d'entretien proportionnel aux kilomètres parcourus.
+- Affiche les résultats avec deux décimales.
+"""
+
+import sys
+
+import lot_couts
+from modele_couts import consommation_essence, entretien_proportionnel
+
+# Paramètres du mode non interactif (tous obligatoires, comme la saisie)
+DEFAUTS_LOT = {"distance": None, "consommation": None, "prix_essence": None,
+               "km_totaux": None, "cout_entretien_annuel": None, "km_par_an": None}
+
+
+def calculer_cout_essence(distance_km: float,
+                          consommation_l_100km: float,
+                          prix_litre_eur: float) -> float:
+    """
+    Retourne le coût total du carburant pour la distance indiquée.
+
+    :param distance_km: distance parcourue en kilomètres.
+    :param consommation_l_100km: consommation moyenne (L/100 ; ex. 12.5).
+    :param prix_litre_eur: prix du litre d'essence en euros.
+    :return: coût en euros.
+    """
+    # litres consommés = (distance / 100) × consommation
+    _, cout = consommation_essence(distance_km, consommation_l_100km, prix_litre_eur)
+    return cout
+
+
+def calculer_cout_entretien(kilometres_parcourus: float,
+                            cout_annuel_eur: float,
+                            km_par_an: float) -> float:
+    """
+    Retourne le coût d'entretien proportionnel aux kilomètres parcourus.
+
+    :param kilometres_parcourus: total de kilomètres effectués.
+    :param cout_annuel_eur: coût d'entretien estimé sur une année.
+    :param km_par_an: nombre de kilomètres parcourus en moyenne chaque année.
+    :return: coût d'entretien en euros.
+    """
+    # Pas de kilométrage annuel renseigné (km_par_an <= 0) → 0 (politique "proportionnel")
+    return entretien_proportionnel(kilometres_parcourus, cout_annuel_eur, km_par_an)
+
+
+def demander_float(message: str) -> float:
+    """
+    Demande à l'utilisateur un nombre réel et répète tant que l'entrée n'est pas valide.
+    """
+    while True:
+        try:
+            valeur = float(input(message).replace(',', '.'))  # accepte la virgule française
+            return valeur
+        except ValueError:
+            print("⚠️  Entrée invalide ; veuillez saisir un nombre.")
+
+
+def calculer_lot(parametres):
+    """
+    Coût d'essence et d'entretien pour des tableaux de paramètres (mode lot).
+    """
+    return {
+        "cout_essence": calculer_cout_essence(parametres["distance"], parametres["consommation"],
+                                              parametres["prix_essence"]),
+        "cout_entretien": calculer_cout_entretien(parametres["km_totaux"], parametres["cout_entretien_annuel"],
+                                                  parametres["km_par_an"]),
+    }
+
+
+def main():
+    if lot_couts.executer(sys.argv[1:], "Calculateur de consommation d'essence et d'entretien",
+                          calculer_lot, DEFAUTS_LOT):
+        return
+
+    print("\n=== Calculateur de consommation d'essence et d'entretien ===\n")
+
+    # Entrées utilisateur
+    distance = demander_float("Distance parcourue (km) : ")
+    consommation = demander_float("Consommation moyenne (L/100 km) : ")
+    prix_essence = demander_float("Prix du litre d'essence (€/L) : ")
+    km_totaux = demander_float("Kilomètres totaux parcourus sur le véhicule : ")
+    cout_entretien_annuel = demander_float("Coût d'entretien annuel estimé (€/an) : ")
+    km_par_an = demander_float("Kilométrage moyen annuel (km/an) : ")
+
+    # Calculs
+    cout_essence = calculer_cout = calculer_cout_essence(distance, consommation, prix_essence)
+    cout_entretien = calculer_cout_entretien(km_totaux, cout_entretien_annuel, km_par_an)
+
+    # Résultats
+    print("\n--- Résultats ---")
+    print(f"Coût total d'essence : {cout_essence:.2f} €")
+    print(f"Coût d'entretien estimé : {cout_entretien:.2f} €")
+    print("\nMerci d'avoir utilisé le calculateur !")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
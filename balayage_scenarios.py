@@ -0,0 +1,167 @@
+"""
+Balayage de scénarios de coûts (analyse de sensibilité des contrats).
+
+Le produit cartésien des axes (prix du carburant × consommation × km ×
+durée de vie des pneus, …) est parcouru paresseusement, par blocs de
+`taille_bloc` scénarios : les indices de chaque axe sont retrouvés par
+np.unravel_index et les noyaux de modele_couts sont appliqués au bloc
+entier, les paramètres constants étant diffusés. La grille complète n'est
+jamais en mémoire ; les blocs sont soit écrits au fil de l'eau (CSV,
+Parquet), soit réduits (min, max, moyenne, percentiles).
+
+Exemple :
+    axes = {"prix_carburant": np.linspace(1.5, 2.5, 101),
+            "conso_moyenne": np.linspace(10, 16, 61),
+            "km_annuel": np.arange(5_000, 40_001, 500),
+            "km_pneus": [10_000, 15_000, 20_000]}
+    stats = reduire(axes, politique="division", percentiles=(5, 50, 95))
+"""
+
+import csv
+import math
+
+import numpy as np
+
+from couts_flotte import PARAMETRES_CARBURANT, RESULTATS, couts_flotte, parametres_entretien
+
+TAILLE_BLOC = 1_000_000
+N_CLASSES = 16_384  # Résolution des histogrammes de percentiles
+
+
+def _preparer(axes, constantes, politique):
+    constantes = dict(constantes or {})
+    autorises = PARAMETRES_CARBURANT + parametres_entretien(politique)
+    inconnus = [nom for nom in list(axes) + list(constantes) if nom not in autorises]
+    if inconnus:
+        raise ValueError(f"Paramètres inconnus pour la politique {politique!r} : {', '.join(inconnus)} "
+                         f"(attendu : {', '.join(autorises)})")
+    axes = {nom: np.asarray(valeurs).reshape(-1) for nom, valeurs in axes.items()}
+    return axes, constantes
+
+
+def nombre_scenarios(axes):
+    """
+    Taille du produit cartésien des axes.
+    """
+    return math.prod(len(np.asarray(valeurs).reshape(-1)) for valeurs in axes.values())
+
+
+def balayer(axes, constantes=None, politique="division", taille_bloc=TAILLE_BLOC):
+    """
+    Génère les blocs du produit cartésien des `axes` ({paramètre : valeurs}).
+
+    :param constantes: Paramètres fixes pour tous les scénarios.
+    :param politique: Politique d'entretien de modele_couts.
+    :return: Générateur de dictionnaires {colonne : tableau} contenant les
+             paramètres balayés puis les résultats (RESULTATS) du bloc.
+    """
+    axes, constantes = _preparer(axes, constantes, politique)
+    forme = tuple(len(valeurs) for valeurs in axes.values())
+    total = math.prod(forme)
+    for debut in range(0, total, taille_bloc):
+        fin = min(debut + taille_bloc, total)
+        indices = np.unravel_index(np.arange(debut, fin), forme)
+        parametres = {nom: valeurs[i] for (nom, valeurs), i in zip(axes.items(), indices)}
+        resultats = couts_flotte(politique=politique, **{**constantes, **parametres})
+        bloc = dict(parametres)
+        for nom in RESULTATS:
+            bloc[nom] = np.broadcast_to(resultats[nom], (fin - debut,))
+        yield bloc
+
+
+def vers_csv(chemin, axes, constantes=None, politique="division", taille_bloc=TAILLE_BLOC):
+    """
+    Écrit tous les scénarios dans un fichier CSV, bloc par bloc. Retourne le nombre de lignes.
+    """
+    lignes = 0
+    with open(chemin, "w", newline="", encoding="utf-8") as fichier:
+        ecrivain = None
+        for bloc in balayer(axes, constantes, politique, taille_bloc):
+            if ecrivain is None:
+                ecrivain = csv.writer(fichier)
+                ecrivain.writerow(bloc)
+            ecrivain.writerows(zip(*(colonne.tolist() for colonne in bloc.values())))
+            lignes += len(next(iter(bloc.values())))
+    return lignes
+
+
+def vers_parquet(chemin, axes, constantes=None, politique="division", taille_bloc=TAILLE_BLOC):
+    """
+    Écrit tous les scénarios dans un fichier Parquet, un groupe de lignes par bloc
+    (nécessite pyarrow). Retourne le nombre de lignes.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("L'écriture Parquet nécessite pyarrow : pip install pyarrow") from exc
+    lignes = 0
+    ecrivain = None
+    try:
+        for bloc in balayer(axes, constantes, politique, taille_bloc):
+            table = pa.table({nom: np.ascontiguousarray(colonne) for nom, colonne in bloc.items()})
+            if ecrivain is None:
+                ecrivain = pq.ParquetWriter(chemin, table.schema)
+            ecrivain.write_table(table)
+            lignes += table.num_rows
+    finally:
+        if ecrivain is not None:
+            ecrivain.close()
+    return lignes
+
+
+def _percentile_histogramme(histogramme, bords, p):
+    cumul = np.cumsum(histogramme)
+    cible = p / 100 * cumul[-1]
+    classe = min(int(np.searchsorted(cumul, cible)), len(histogramme) - 1)
+    avant = cumul[classe] - histogramme[classe]
+    fraction = (cible - avant) / histogramme[classe] if histogramme[classe] else 0.0
+    return float(bords[classe] + fraction * (bords[classe + 1] - bords[classe]))
+
+
+def reduire(axes, constantes=None, politique="division", resultats=("cout_total", "cout_km"),
+            percentiles=(), taille_bloc=TAILLE_BLOC, n_classes=N_CLASSES):
+    """
+    Statistiques de chaque résultat sur toute la grille, calculées bloc par bloc.
+
+    min, max et moyenne sont exacts et accompagnés des scénarios (paramètres)
+    qui atteignent le min et le max. Les percentiles demandent une seconde
+    passe : ils sont interpolés dans un histogramme de `n_classes` classes
+    entre le min et le max (erreur inférieure à (max - min) / n_classes).
+
+    :return: {résultat : {"min", "max", "moyenne", "scenario_min",
+             "scenario_max", "percentiles"}} et "n_scenarios".
+    """
+    stats = {nom: {"min": math.inf, "max": -math.inf, "somme": 0.0} for nom in resultats}
+    n_scenarios = 0
+    for bloc in balayer(axes, constantes, politique, taille_bloc):
+        n_scenarios += len(bloc[resultats[0]])
+        parametres = [nom for nom in bloc if nom not in RESULTATS]
+        for nom in resultats:
+            valeurs, stat = bloc[nom], stats[nom]
+            stat["somme"] += float(valeurs.sum())
+            for extremum, indice, meilleur in (("min", int(valeurs.argmin()), np.less),
+                                               ("max", int(valeurs.argmax()), np.greater)):
+                if meilleur(valeurs[indice], stat[extremum]):
+                    stat[extremum] = float(valeurs[indice])
+                    stat[f"scenario_{extremum}"] = {p: bloc[p][indice].item() for p in parametres}
+
+    for nom, stat in stats.items():
+        stat["moyenne"] = stat.pop("somme") / n_scenarios if n_scenarios else math.nan
+        stat["percentiles"] = {}
+
+    if percentiles and n_scenarios:
+        bords = {nom: np.linspace(stats[nom]["min"], stats[nom]["max"], n_classes + 1) for nom in resultats}
+        histogrammes = {nom: np.zeros(n_classes, dtype=np.int64) for nom in resultats}
+        for bloc in balayer(axes, constantes, politique, taille_bloc):
+            for nom in resultats:
+                stat = stats[nom]
+                largeur = (stat["max"] - stat["min"]) / n_classes or 1.0
+                classes = np.clip(((bloc[nom] - stat["min"]) / largeur).astype(np.int64), 0, n_classes - 1)
+                histogrammes[nom] += np.bincount(classes, minlength=n_classes)
+        for nom in resultats:
+            stats[nom]["percentiles"] = {p: _percentile_histogramme(histogrammes[nom], bords[nom], p)
+                                         for p in percentiles}
+
+    stats["n_scenarios"] = n_scenarios
+    return stats
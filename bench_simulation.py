@@ -0,0 +1,217 @@
+"""
+Benchmark du débit des simulations de catastrophes.
+
+Fait tourner les moteurs disponibles sur une grille de paramètres (nombre
+d'écosystèmes, de cycles, de types de catastrophes et de processus) :
+- scalaire : boucle d'origine (declencher_evenements_aleatoires +
+  recuperation_ecosysteme) sur des Ecosysteme individuels ;
+- reference : MoteurEcosystemes en mode référence ;
+- vectorise : MoteurEcosystemes ;
+- grille : GrilleEcosystemes (grille carrée de même nombre de cellules) ;
+- monte_carlo : executer_monte_carlo (parallèle, `--processus`).
+
+Pour chaque point : cycles/s, écosystèmes×cycles/s, pic mémoire (tracemalloc,
+mesuré sur une exécution séparée et courte pour ne pas fausser les temps)
+et efficacité de montée en charge (débit rapporté à celui de la plus petite
+taille, et au débit à 1 processus × nombre de processus). Les résultats sont
+écrits en JSON pour suivre les régressions.
+
+Usage : python bench_simulation.py [--moteurs scalaire,vectorise] [--ecosystemes 100,10000]
+        [--cycles 100] [--catastrophes 4,64] [--processus 1,2] [--sortie resultats.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from CatastropheNaturelle import (CatastropheNaturelle, Ecosysteme, RegistreCatastrophes,
+                                  declencher_evenements_aleatoires, recuperation_ecosysteme,
+                                  registre_par_defaut)
+from monte_carlo import executer_monte_carlo
+from simulation_grille import GrilleEcosystemes
+from simulation_vectorisee import ECOSYSTEME_INITIAL, MoteurEcosystemes
+
+MAX_ECOSYSTEMES_CYCLES_SCALAIRE = 2_000_000  # Au-delà, les moteurs scalaires prennent des minutes
+CYCLES_MEMOIRE = 10  # Cycles de l'exécution qui mesure le pic mémoire
+MOTEURS_SCALAIRES = ("scalaire", "reference")
+MOTEURS_PARALLELES = ("grille", "monte_carlo")
+
+
+def registre_synthetique(n_catastrophes, graine=0):
+    """
+    Les catastrophes d'origine, complétées par des catastrophes aléatoires
+    (1 à 3 éléments touchés) jusqu'à `n_catastrophes` types.
+    """
+    catastrophes = registre_par_defaut().catastrophes[:n_catastrophes]
+    rng = random.Random(graine)
+    elements = list(ECOSYSTEME_INITIAL)
+    for i in range(len(catastrophes), n_catastrophes):
+        touches = rng.sample(elements, rng.randint(1, 3))
+        catastrophes.append(CatastropheNaturelle(
+            nom=f"Catastrophe synthétique {i}",
+            impact_environnemental={e: round(rng.uniform(0.5, 0.95), 2) for e in touches},
+            frequence=rng.uniform(0.001, 0.01),
+            duree_recuperation={rng.choice(touches): rng.randint(3, 15)},
+        ))
+    return RegistreCatastrophes(catastrophes)
+
+
+def executer_scalaire(n, cycles, registre, processus):
+    random.seed(0)
+    ecosystemes = [Ecosysteme(ECOSYSTEME_INITIAL) for _ in range(n)]
+    for _ in range(cycles):
+        for ecosysteme in ecosystemes:
+            declencher_evenements_aleatoires(ecosysteme, registre=registre)
+            recuperation_ecosysteme(ecosysteme)
+
+
+def executer_reference(n, cycles, registre, processus):
+    MoteurEcosystemes(n, catastrophes=registre, graine=0, reference=True).simuler(cycles)
+
+
+def executer_vectorise(n, cycles, registre, processus):
+    MoteurEcosystemes(n, catastrophes=registre, graine=0).simuler(cycles)
+
+
+def executer_grille(n, cycles, registre, processus):
+    cote = math.isqrt(n)
+    GrilleEcosystemes(cote, cote, catastrophes=registre, graine=0, echelle_frequences=0.01,
+                      taille_tuile=max(cote // max(processus, 1), 1), processus=processus).simuler(cycles)
+
+
+def executer_monte_carlo_(n, cycles, registre, processus):
+    executer_monte_carlo(n, cycles, graine=0, processus=processus, catastrophes=registre,
+                         taille_lot=max(n // max(processus, 1), 1))
+
+
+MOTEURS = {
+    "scalaire": executer_scalaire,
+    "reference": executer_reference,
+    "vectorise": executer_vectorise,
+    "grille": executer_grille,
+    "monte_carlo": executer_monte_carlo_,
+}
+
+
+def mesurer(moteur, n, cycles, n_catastrophes, processus, repetitions):
+    """
+    Meilleur temps sur `repetitions` exécutions, puis pic mémoire sur une exécution courte.
+    """
+    registre = registre_synthetique(n_catastrophes)
+    executer = MOTEURS[moteur]
+    if moteur == "grille":
+        n = math.isqrt(n) ** 2
+
+    duree = math.inf
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        executer(n, cycles, registre, processus)
+        duree = min(duree, time.perf_counter() - debut)
+
+    tracemalloc.start()
+    executer(n, min(cycles, CYCLES_MEMOIRE), registre, processus)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "moteur": moteur,
+        "n_ecosystemes": n,
+        "cycles": cycles,
+        "n_catastrophes": n_catastrophes,
+        "processus": processus,
+        "duree_s": duree,
+        "cycles_par_s": cycles / duree,
+        "ecosystemes_cycles_par_s": n * cycles / duree,
+        "memoire_pic_mo": pic / 2 ** 20,  # Processus courant uniquement
+    }
+
+
+def ajouter_efficacites(resultats):
+    """
+    Efficacité de taille : débit rapporté à celui de la plus petite taille
+    (mêmes autres paramètres). Efficacité parallèle : débit / (débit à 1 processus × processus).
+    """
+    for resultat in resultats:
+        cle = (resultat["moteur"], resultat["cycles"], resultat["n_catastrophes"])
+        memes = [r for r in resultats if (r["moteur"], r["cycles"], r["n_catastrophes"]) == cle]
+        plus_petit = min((r for r in memes if r["processus"] == resultat["processus"]),
+                         key=lambda r: r["n_ecosystemes"])
+        resultat["efficacite_taille"] = (resultat["ecosystemes_cycles_par_s"] /
+                                         plus_petit["ecosystemes_cycles_par_s"])
+        sequentiel = [r for r in memes if r["processus"] == 1 and r["n_ecosystemes"] == resultat["n_ecosystemes"]]
+        resultat["efficacite_parallele"] = (
+            resultat["ecosystemes_cycles_par_s"] / (sequentiel[0]["ecosystemes_cycles_par_s"] * resultat["processus"])
+            if sequentiel else None
+        )
+    return resultats
+
+
+def _liste_entiers(texte):
+    return [int(valeur) for valeur in texte.split(",") if valeur]
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Benchmark du débit des simulations de catastrophes.")
+    parseur.add_argument("--moteurs", default="scalaire,vectorise,grille",
+                         help=f"Moteurs, séparés par des virgules ({', '.join(MOTEURS)}).")
+    parseur.add_argument("--ecosystemes", type=_liste_entiers, default=[100, 1_000, 10_000, 100_000])
+    parseur.add_argument("--cycles", type=_liste_entiers, default=[100])
+    parseur.add_argument("--catastrophes", type=_liste_entiers, default=[4, 64])
+    parseur.add_argument("--processus", type=_liste_entiers, default=[1],
+                         help="Nombres de processus/threads (moteurs grille et monte_carlo).")
+    parseur.add_argument("--repetitions", type=int, default=1)
+    parseur.add_argument("--sortie", help="Fichier JSON de résultats (par défaut : sortie standard).")
+    options = parseur.parse_args(arguments)
+
+    moteurs = [moteur for moteur in options.moteurs.split(",") if moteur]
+    inconnus = [moteur for moteur in moteurs if moteur not in MOTEURS]
+    if inconnus:
+        parseur.error(f"moteurs inconnus : {', '.join(inconnus)}")
+
+    resultats = []
+    for moteur in moteurs:
+        for n_catastrophes in options.catastrophes:
+            for cycles in options.cycles:
+                for n in options.ecosystemes:
+                    if moteur in MOTEURS_SCALAIRES and n * cycles > MAX_ECOSYSTEMES_CYCLES_SCALAIRE:
+                        print(f"{moteur} : {n} écosystèmes × {cycles} cycles ignoré (trop long)", file=sys.stderr)
+                        continue
+                    for processus in (options.processus if moteur in MOTEURS_PARALLELES else [1]):
+                        resultat = mesurer(moteur, n, cycles, n_catastrophes, processus, options.repetitions)
+                        resultats.append(resultat)
+                        print(f"{moteur:>12} n={resultat['n_ecosystemes']:>9} cycles={cycles:>5} "
+                              f"catastrophes={n_catastrophes:>4} processus={processus:>2} "
+                              f"{resultat['ecosystemes_cycles_par_s']:14.0f} écosystèmes×cycles/s "
+                              f"{resultat['memoire_pic_mo']:9.1f} Mo", file=sys.stderr)
+
+    rapport = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plateforme": platform.platform(),
+            "processeurs": os.cpu_count(),
+        },
+        "parametres": vars(options),
+        "resultats": ajouter_efficacites(resultats),
+    }
+    texte = json.dumps(rapport, indent=2, ensure_ascii=False)
+    if options.sortie:
+        with open(options.sortie, "w", encoding="utf-8") as fichier:
+            fichier.write(texte + "\n")
+    else:
+        print(texte)
+    return rapport
+
+
+if __name__ == "__main__":
+    main()
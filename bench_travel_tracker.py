@@ -0,0 +1,76 @@
+"""
+Benchmark du pointage de lieux (TravelTracker.mark_visited).
+
+Compare la recherche historique (parcours de tous les lieux + test
+d'appartenance dans une liste, donc quadratique) à l'index des noms du
+tracker, pour des tailles croissantes. Affiche la courbe de montée en charge.
+
+Usage : python bench_travel_tracker.py [taille_max]
+"""
+
+import importlib
+import random
+import sys
+import time
+
+# Le nom du module commence par un chiffre : import par importlib
+voyage = importlib.import_module("2SGTqdUISh")
+
+TAILLE_MAX_HISTORIQUE = 10_000  # Au-delà, la version quadratique prend des minutes
+
+
+def pointage_historique(locations, noms):
+    """Reproduit l'ancien mark_visited : recherche linéaire + `not in` sur une liste."""
+    visites = []
+    for nom in noms:
+        for loc in locations:
+            if loc.name.lower() == nom.lower():
+                loc.visited = True
+                loc.color = 'green'
+                if loc not in visites:
+                    visites.append(loc)
+                break
+    return visites
+
+
+def generer_lieux(n):
+    rng = random.Random(n)
+    return [voyage.Location(f"Lieu-{i}", rng.uniform(-80, 80), rng.uniform(-180, 180))
+            for i in range(n)]
+
+
+def mesurer(n):
+    lieux = generer_lieux(n)
+    noms = [f"LIEU-{i}" for i in random.Random(0).sample(range(n), n)]
+
+    tracker = voyage.TravelTracker()
+    for lieu in lieux:
+        tracker.add_location(lieu)
+    debut = time.perf_counter()
+    for nom in noms:
+        tracker.mark_visited(nom)
+    duree_index = time.perf_counter() - debut
+    assert len(tracker.visited_locations) == n
+
+    duree_historique = None
+    if n <= TAILLE_MAX_HISTORIQUE:
+        debut = time.perf_counter()
+        pointage_historique(lieux, noms)
+        duree_historique = time.perf_counter() - debut
+    return duree_index, duree_historique
+
+
+def main():
+    taille_max = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tailles = [n for n in (1_000, 2_000, 5_000, 10_000, 20_000, 50_000, 100_000, 200_000,
+                           500_000, 1_000_000) if n <= taille_max]
+
+    print(f"{'lieux':>10} {'index (s)':>12} {'µs/pointage':>12} {'historique (s)':>15}")
+    for n in tailles:
+        duree_index, duree_historique = mesurer(n)
+        historique = f"{duree_historique:15.3f}" if duree_historique is not None else f"{'-':>15}"
+        print(f"{n:>10} {duree_index:12.3f} {duree_index / n * 1e6:12.2f} {historique}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Calcul des coûts d'une flotte de véhicules en une passe NumPy.
+
+Applique les noyaux de modele_couts à des tableaux : chaque paramètre peut
+être un scalaire ou un tableau (un élément par véhicule), diffusés ensemble.
+Les opérations sont exactement celles des calculateurs interactifs, dans le
+même ordre : les résultats sont identiques au bit près.
+
+couts_flotte_dataframe() applique le même calcul aux colonnes d'un
+DataFrame pandas.
+"""
+
+import inspect
+
+import numpy as np
+
+from modele_couts import calculer_couts, consommation_essence, politique_entretien
+
+PARAMETRES_CARBURANT = ("km_annuel", "conso_moyenne", "prix_carburant")
+RESULTATS = ("litres", "cout_carburant", "cout_entretien", "cout_total", "cout_km")
+
+
+def parametres_entretien(politique):
+    """
+    Noms des paramètres d'entretien de la politique (hors kilométrage).
+    """
+    return tuple(inspect.signature(politique_entretien(politique)).parameters)[1:]
+
+
+def calculer_consommation_essence_lot(km_annuel, conso_moyenne=13.0, prix_carburant=1.8):
+    """
+    Litres consommés et coût du carburant pour chaque véhicule.
+    :return: Tuple (litres, coût carburant) de tableaux.
+    """
+    return consommation_essence(np.asarray(km_annuel), np.asarray(conso_moyenne), np.asarray(prix_carburant))
+
+
+def calculer_cout_entretien_lot(km_annuel, politique="seuil", **parametres):
+    """
+    Coût d'entretien annuel de chaque véhicule selon la politique de modele_couts.
+    """
+    parametres = {nom: np.asarray(valeur) for nom, valeur in parametres.items()}
+    return politique_entretien(politique)(np.asarray(km_annuel), **parametres)
+
+
+def couts_flotte(km_annuel, conso_moyenne=13.0, prix_carburant=1.8, politique="seuil", **entretien):
+    """
+    Litres, coût carburant, coût d'entretien, coût total et coût par km
+    (0 si km_annuel <= 0) de toute la flotte.
+    :param entretien: Paramètres de la politique d'entretien (par défaut ceux de la politique).
+    :return: Dictionnaire {nom : tableau}.
+    """
+    entretien = {nom: np.asarray(valeur) for nom, valeur in entretien.items()}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return calculer_couts(np.asarray(km_annuel), np.asarray(conso_moyenne), np.asarray(prix_carburant),
+                              politique, **entretien)
+
+
+def couts_flotte_dataframe(flotte, colonnes=None, politique="seuil", **defauts):
+    """
+    Ajoute les colonnes de résultats (RESULTATS) à une copie du DataFrame `flotte`.
+    :param colonnes: {paramètre : nom de colonne} si les noms diffèrent des paramètres.
+    :param defauts: Valeurs des paramètres absents du DataFrame.
+    """
+    colonnes = colonnes or {}
+    valeurs = {}
+    for parametre in PARAMETRES_CARBURANT + parametres_entretien(politique):
+        colonne = colonnes.get(parametre, parametre)
+        if colonne in flotte.columns:
+            valeurs[parametre] = flotte[colonne].to_numpy()
+        elif parametre in defauts:
+            valeurs[parametre] = defauts[parametre]
+    resultat = flotte.copy()
+    for nom, tableau in couts_flotte(politique=politique, **valeurs).items():
+        resultat[nom] = np.broadcast_to(tableau, (len(flotte),))
+    return resultat
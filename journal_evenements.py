@@ -0,0 +1,217 @@
+"""
+Journaux d'événements de la simulation de catastrophes (CatastropheNaturelle).
+
+Les fonctions de simulation n'écrivent plus directement sur la sortie
+standard : elles émettent des événements typés (cycle, type, catastrophe,
+élément, avant, après) vers un journal interchangeable :
+- JournalNul : ne fait rien (mode batch, journal par défaut) ;
+- JournalConsole : reproduit l'affichage d'origine avec émojis ;
+- JournalMemoire : stocke les événements en colonnes compactes (array) ;
+- JournalParquet : écrit les événements par blocs dans un fichier Parquet.
+
+Les fonctions consultent `journal.actif` avant de construire un événement :
+avec JournalNul, une simulation ne paie donc ni formatage ni appel.
+"""
+
+from array import array
+
+import numpy as np
+
+# Types d'événements
+DECLENCHEMENT = 0  # Une catastrophe se déclenche
+IMPACT = 1  # Un élément est réduit (avant -> après)
+PLANIFICATION = 2  # Une récupération est planifiée (après = nombre de cycles)
+RECUPERATION = 3  # Un élément se rétablit (avant -> après)
+
+NOMS_TYPES = ("declenchement", "impact", "planification", "recuperation")
+
+
+class JournalNul:
+    """
+    Journal qui ignore tous les événements.
+    """
+    actif = False
+
+    def __init__(self):
+        self.cycle = 0
+
+    def debut_cycle(self, cycle):
+        self.cycle = cycle
+
+    def emettre(self, type_evenement, catastrophe="", element="", avant=0.0, apres=0.0):
+        pass
+
+    def etat(self, ecosysteme):
+        pass
+
+    def fin_cycle(self):
+        pass
+
+    def fermer(self):
+        pass
+
+
+class JournalConsole(JournalNul):
+    """
+    Affiche les événements comme la simulation d'origine.
+    """
+    actif = True
+
+    def debut_cycle(self, cycle):
+        self.cycle = cycle
+        print(f"\n🌿 Jour {cycle} 🌿")
+
+    def emettre(self, type_evenement, catastrophe="", element="", avant=0.0, apres=0.0):
+        if type_evenement == DECLENCHEMENT:
+            print(f"\n⚠️ Catastrophe en cours : {catastrophe} ⚠️")
+        elif type_evenement == IMPACT:
+            print(f"🔻 {element.capitalize()} réduit à {apres}")
+        elif type_evenement == PLANIFICATION:
+            print(f"🔄 {element.capitalize()} commencera à se rétablir dans {apres:g} cycles.")
+        elif type_evenement == RECUPERATION:
+            print(f"✅ {element.capitalize()} a retrouvé son état normal !")
+
+    def etat(self, ecosysteme):
+        print("\n📊 État actuel de l'écosystème :")
+        for key, value in ecosysteme.items():
+            if not key.startswith("recup_"):  # Compteurs de récupération d'un dictionnaire ordinaire
+                print(f"{key.capitalize()} : {value}")
+
+    def fin_cycle(self):
+        print("-" * 40)
+
+
+class JournalMemoire(JournalNul):
+    """
+    Stocke les événements en colonnes : entiers et flottants dans des
+    `array` compacts, noms de catastrophes et d'éléments internés (un code
+    entier par nom distinct).
+    """
+    actif = True
+
+    def __init__(self):
+        super().__init__()
+        self._vider()
+        self.noms = [""]  # Noms internés (catastrophes et éléments), code 0 = aucun
+        self._codes = {"": 0}
+
+    def _vider(self):
+        self._cycles = array('i')
+        self._types = array('b')
+        self._catastrophes = array('h')
+        self._elements = array('h')
+        self._avant = array('d')
+        self._apres = array('d')
+
+    def _code(self, nom):
+        code = self._codes.get(nom)
+        if code is None:
+            code = self._codes[nom] = len(self.noms)
+            self.noms.append(nom)
+        return code
+
+    def emettre(self, type_evenement, catastrophe="", element="", avant=0.0, apres=0.0):
+        self._cycles.append(self.cycle)
+        self._types.append(type_evenement)
+        self._catastrophes.append(self._code(catastrophe))
+        self._elements.append(self._code(element))
+        self._avant.append(avant)
+        self._apres.append(apres)
+
+    def __len__(self):
+        return len(self._types)
+
+    def colonnes(self):
+        """
+        Événements sous forme de dictionnaire de tableaux NumPy (les noms
+        restent des codes entiers, à traduire avec `self.noms`). Les tableaux
+        sont des copies : le journal peut continuer à recevoir des événements.
+        """
+        return {nom: vue.copy() for nom, vue in self._vues().items()}
+
+    def _vues(self):
+        """
+        Colonnes sans copie, sur les tampons des `array` : à consommer avant
+        le prochain emettre(), qui ne pourrait plus les agrandir (BufferError).
+        """
+        return {
+            "cycle": np.frombuffer(self._cycles, dtype=np.int32),
+            "type": np.frombuffer(self._types, dtype=np.int8),
+            "catastrophe": np.frombuffer(self._catastrophes, dtype=np.int16),
+            "element": np.frombuffer(self._elements, dtype=np.int16),
+            "avant": np.frombuffer(self._avant, dtype=np.float64),
+            "apres": np.frombuffer(self._apres, dtype=np.float64),
+        }
+
+    def evenements(self):
+        """
+        Itère sur les événements sous forme de dictionnaires lisibles.
+        """
+        for i in range(len(self)):
+            yield {
+                "cycle": self._cycles[i],
+                "type": NOMS_TYPES[self._types[i]],
+                "catastrophe": self.noms[self._catastrophes[i]],
+                "element": self.noms[self._elements[i]],
+                "avant": self._avant[i],
+                "apres": self._apres[i],
+            }
+
+
+class JournalParquet(JournalMemoire):
+    """
+    Écrit les événements dans un fichier Parquet par blocs de `taille_bloc`
+    lignes (nécessite pyarrow) ; la mémoire utilisée reste bornée. Les noms
+    sont stockés en colonnes dictionnaire. Appeler fermer() en fin de run.
+    """
+
+    def __init__(self, chemin, taille_bloc=65536):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("L'écriture Parquet nécessite pyarrow : pip install pyarrow") from exc
+        super().__init__()
+        self._pa = pa
+        self.taille_bloc = taille_bloc
+        self._schema = pa.schema([
+            ("cycle", pa.int32()),
+            ("type", pa.dictionary(pa.int8(), pa.string())),
+            ("catastrophe", pa.dictionary(pa.int16(), pa.string())),
+            ("element", pa.dictionary(pa.int16(), pa.string())),
+            ("avant", pa.float64()),
+            ("apres", pa.float64()),
+        ])
+        self._writer = pq.ParquetWriter(chemin, self._schema)
+
+    def emettre(self, type_evenement, catastrophe="", element="", avant=0.0, apres=0.0):
+        super().emettre(type_evenement, catastrophe, element, avant, apres)
+        if len(self._types) >= self.taille_bloc:
+            self._ecrire_bloc()
+
+    def _ecrire_bloc(self):
+        if not len(self._types):
+            return
+        pa = self._pa
+        noms = pa.array(self.noms, pa.string())
+        colonnes = self._vues()  # Sans risque : _vider() remplace les array au lieu de les agrandir
+        table = pa.Table.from_arrays([
+            pa.array(colonnes["cycle"]),
+            pa.DictionaryArray.from_arrays(pa.array(colonnes["type"]), pa.array(NOMS_TYPES)),
+            pa.DictionaryArray.from_arrays(pa.array(colonnes["catastrophe"]), noms),
+            pa.DictionaryArray.from_arrays(pa.array(colonnes["element"]), noms),
+            pa.array(colonnes["avant"]),
+            pa.array(colonnes["apres"]),
+        ], schema=self._schema)
+        self._writer.write_table(table)
+        self._vider()
+
+    def fermer(self):
+        self._ecrire_bloc()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
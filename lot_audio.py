@@ -0,0 +1,349 @@
+"""
+Conversion par lots de documents Word (.docx) en audio, sur un pool de processus.
+
+Les documents viennent d'un dossier (parcouru récursivement) ou d'un
+manifeste (un chemin par ligne, suivi éventuellement d'une tabulation et du
+fichier audio de sortie). Chaque processus du pool initialise une seule fois
+son moteur pyttsx3, réutilisé pour toutes ses tâches :
+- un document ordinaire est une tâche (synthese_audio.convertir_document) ;
+- un document de plus de `taille_decoupe` octets est découpé en parties de
+  `segments_par_partie` segments, réparties sur le pool ; les parties sont
+  concaténées dans l'ordre une fois toutes terminées.
+
+Au plus `en_vol` tâches sont soumises à la fois (par défaut 2 par
+processus) : les documents et les segments ne sont lus qu'au fur et à
+mesure, la mémoire reste bornée quelle que soit la taille de la
+bibliothèque. Une tâche en échec est resoumise jusqu'à `tentatives` fois ;
+si un processus meurt, le pool est recréé et les tâches en cours resoumises.
+Le rapport final donne les débits (documents/s, caractères/s, secondes
+d'audio par seconde) et la liste des échecs.
+
+Usage : python lot_audio.py BIBLIOTHEQUE|MANIFESTE.txt --sortie DOSSIER [--processus 4] [--rapport rapport.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from synthese_audio import (PAR_LOT, TAILLE_SEGMENT, concatener_wav, convertir_document, creer_moteur, decouper,
+                            paragraphes, synthetiser)
+
+TAILLE_DECOUPE = 1_000_000  # Octets de .docx au-delà desquels un document est découpé
+SEGMENTS_PAR_PARTIE = 50
+TENTATIVES = 3
+EXTENSION_AUDIO = ".aiff" if sys.platform == "darwin" else ".wav"  # Format du pilote pyttsx3 par défaut
+
+_MOTEUR = None  # Moteur pyttsx3 du processus de travail
+_DOSSIER_TEMP = None  # Segments temporaires, supprimés en fin de lot même si un processus meurt
+
+
+def _initialiser(fabrique_moteur, dossier_temp):
+    global _MOTEUR, _DOSSIER_TEMP
+    _MOTEUR, _DOSSIER_TEMP = fabrique_moteur(), dossier_temp
+
+
+def _convertir(tache):
+    """
+    Exécute une tâche dans un processus de travail : ("document", source, sortie,
+    taille_segment, par_lot) ou ("partie", segments, sortie, par_lot).
+    """
+    if tache[0] == "document":
+        _, source, sortie, taille_segment, par_lot = tache
+        return convertir_document(source, sortie, taille_segment, moteur=_MOTEUR, par_lot=par_lot,
+                                  dossier_temp=_DOSSIER_TEMP)
+    _, segments, sortie, par_lot = tache
+    debut = time.perf_counter()
+    dossier = tempfile.mkdtemp(prefix="segments_", dir=_DOSSIER_TEMP)
+    try:
+        duree_audio = concatener_wav((chemin for chemin, _ in synthetiser(segments, dossier, _MOTEUR, par_lot)),
+                                     sortie, supprimer=True)
+    finally:
+        shutil.rmtree(dossier, ignore_errors=True)
+    return {"segments": len(segments), "caracteres": sum(map(len, segments)),
+            "duree_audio_s": duree_audio, "duree_s": time.perf_counter() - debut}
+
+
+def lister_documents(source, dossier_sortie):
+    """
+    Couples (document .docx, fichier audio) d'un dossier ou d'un manifeste.
+
+    Dans un dossier, l'arborescence est reproduite sous `dossier_sortie` ; les
+    fichiers de verrouillage de Word (~$…) sont ignorés.
+    """
+    if os.path.isdir(source):
+        for racine, dossiers, fichiers in os.walk(source):
+            dossiers.sort()
+            for fichier in sorted(fichiers):
+                if fichier.lower().endswith(".docx") and not fichier.startswith("~$"):
+                    chemin = os.path.join(racine, fichier)
+                    relatif = os.path.splitext(os.path.relpath(chemin, source))[0]
+                    yield chemin, os.path.join(dossier_sortie, relatif + EXTENSION_AUDIO)
+        return
+    with open(source, encoding="utf-8") as manifeste:
+        for ligne in manifeste:
+            ligne = ligne.strip()
+            if not ligne or ligne.startswith("#"):
+                continue
+            chemin, _, sortie = ligne.partition("\t")
+            if not sortie:
+                sortie = os.path.join(dossier_sortie, os.path.splitext(os.path.basename(chemin))[0] + EXTENSION_AUDIO)
+            yield chemin, sortie
+
+
+class _Document:
+    """
+    Suivi d'un document découpé en parties.
+    """
+
+    def __init__(self, source, sortie):
+        self.source, self.sortie = source, sortie
+        self.parties = []  # Chemins des parties, dans l'ordre
+        self.terminees = 0
+        self.complet = False  # Toutes les parties ont été soumises
+        self.echec = None
+        self.stats = {"segments": 0, "caracteres": 0, "duree_audio_s": 0.0}
+
+    def nettoyer(self):
+        for partie in self.parties:
+            if os.path.exists(partie):
+                os.remove(partie)
+
+
+def _taches(documents, taille_segment, par_lot, taille_decoupe, segments_par_partie, echouer, finir):
+    """
+    Génère paresseusement (tâche, document découpé ou None) ; echouer(document,
+    erreur) signale un document qui ne peut pas être soumis, finir(document)
+    conclut un document découpé dont toutes les parties sont déjà terminées
+    quand sa lecture s'achève.
+    """
+    for source, sortie in documents:
+        os.makedirs(os.path.dirname(os.path.abspath(sortie)), exist_ok=True)
+        try:
+            decoupe = os.path.getsize(source) > taille_decoupe
+        except OSError as exc:
+            echouer(source, f"{type(exc).__name__}: {exc}")
+            continue
+        if not decoupe:
+            yield ("document", source, sortie, taille_segment, par_lot), None
+            continue
+        document = _Document(source, sortie)
+        segments = []
+        try:
+            for segment in decouper(paragraphes(source), taille_segment):
+                segments.append(segment)
+                if len(segments) >= segments_par_partie:
+                    yield _partie(document, segments, par_lot), document
+                    segments = []
+            if segments or not document.parties:
+                yield _partie(document, segments, par_lot), document
+        except Exception as exc:  # Document illisible : les parties déjà soumises sont abandonnées
+            document.echec = f"{type(exc).__name__}: {exc}"
+        document.complet = True
+        if document.terminees == len(document.parties):
+            finir(document)
+
+
+def _partie(document, segments, par_lot):
+    chemin = f"{document.sortie}.partie{len(document.parties):05d}{EXTENSION_AUDIO}"
+    document.parties.append(chemin)
+    return ("partie", segments, chemin, par_lot)
+
+
+def convertir_bibliotheque(source, dossier_sortie, processus=None, taille_segment=TAILLE_SEGMENT, par_lot=PAR_LOT,
+                           taille_decoupe=TAILLE_DECOUPE, segments_par_partie=SEGMENTS_PAR_PARTIE,
+                           tentatives=TENTATIVES, en_vol=None, fabrique_moteur=creer_moteur, progression=None):
+    """
+    Convertit tous les documents d'un dossier ou d'un manifeste.
+
+    :param fabrique_moteur: Fonction (picklable) créant le moteur de synthèse
+                            de chaque processus.
+    :param progression: Fonction appelée à chaque document terminé avec
+                        (document, réussi, documents terminés).
+    :return: Rapport {documents, reussis, echecs, segments, caracteres,
+             duree_audio_s, duree_s, documents_par_s, caracteres_par_s,
+             audio_par_s, resoumissions}.
+    """
+    processus = processus or os.cpu_count()
+    en_vol = en_vol or 2 * processus
+    debut = time.perf_counter()
+    echecs = []
+    rapport = {"documents": 0, "reussis": 0, "segments": 0, "caracteres": 0, "duree_audio_s": 0.0,
+               "resoumissions": 0}
+
+    def terminer(nom, stats, erreur):
+        rapport["documents"] += 1
+        if erreur is None:
+            rapport["reussis"] += 1
+            for cle in ("segments", "caracteres", "duree_audio_s"):
+                rapport[cle] += stats[cle]
+        else:
+            echecs.append({"document": nom, "erreur": erreur})
+        if progression is not None:
+            progression(nom, erreur is None, rapport["documents"])
+
+    def terminer_partie(document, stats, erreur):
+        document.terminees += 1
+        if erreur is not None:
+            document.echec = document.echec or erreur
+        elif document.echec is None:
+            for cle in document.stats:
+                document.stats[cle] += stats[cle]
+        if document.complet and document.terminees == len(document.parties):
+            finir_document(document)
+
+    def finir_document(document):
+        if document.echec is None:
+            try:
+                concatener_wav(document.parties, document.sortie, supprimer=True)
+            except Exception as exc:
+                document.echec = f"{type(exc).__name__}: {exc}"
+        document.nettoyer()
+        terminer(document.source, document.stats, document.echec)
+
+    taches = _taches(lister_documents(source, dossier_sortie), taille_segment, par_lot, taille_decoupe,
+                     segments_par_partie, lambda nom, erreur: terminer(nom, None, erreur), finir_document)
+
+    os.makedirs(dossier_sortie, exist_ok=True)
+    dossier_temp = tempfile.mkdtemp(prefix="lot_audio_", dir=dossier_sortie)
+
+    def nouveau_pool():
+        return ProcessPoolExecutor(max_workers=processus, initializer=_initialiser,
+                                   initargs=(fabrique_moteur, dossier_temp))
+
+    def conclure(tache, document, stats, erreur):
+        if document is None:
+            terminer(tache[1], stats, erreur)
+        else:
+            terminer_partie(document, stats, erreur)
+
+    en_cours = {}  # futur -> (tâche, document découpé ou None, tentative)
+    # Tâches en cours lors de la mort d'un processus : relancées une par une
+    # pour que seule la fautive consomme ses tentatives
+    suspects = deque()
+    executeur = nouveau_pool()
+
+    def recreer_pool():
+        nonlocal executeur, en_cours
+        suspects.extend(en_cours.values())  # Tâches encore en vol sur le pool mort
+        en_cours = {}
+        executeur.shutdown(cancel_futures=True)
+        executeur = nouveau_pool()
+
+    def soumettre(element):
+        """
+        Soumet (tâche, document, tentative) ; False si le pool était cassé.
+        Il est alors recréé et `element` devient suspect avec les tâches en
+        vol ; si rien n'était en vol, il consomme une tentative (un pool qui
+        casse dès son démarrage ne relance donc pas indéfiniment).
+        """
+        try:
+            en_cours[executeur.submit(_convertir, element[0])] = element
+            return True
+        except BrokenProcessPool:
+            tache, document, tentative = element
+            if en_cours:
+                suspects.append(element)
+            elif tentative < tentatives:
+                rapport["resoumissions"] += 1
+                suspects.append((tache, document, tentative + 1))
+            else:
+                conclure(tache, document, None, "BrokenProcessPool: processus de synthèse interrompu")
+            recreer_pool()
+            return False
+
+    try:
+        epuise = False
+        while True:
+            if suspects:
+                if not en_cours:
+                    soumettre(suspects.popleft())
+            else:
+                while not epuise and len(en_cours) < en_vol:
+                    suivante = next(taches, None)
+                    if suivante is None:
+                        epuise = True
+                    elif not soumettre((*suivante, 1)):
+                        break
+            if not en_cours:
+                if suspects or not epuise:
+                    continue  # Pool recréé pendant une soumission
+                break
+            finis, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+            isolee = len(en_cours) == 1
+            casse, a_relancer = False, []
+            for futur in finis:
+                tache, document, tentative = en_cours.pop(futur)
+                try:
+                    stats, erreur = futur.result(), None
+                except BrokenProcessPool:
+                    casse = True
+                    if not isolee:
+                        suspects.append((tache, document, tentative))
+                        continue
+                    stats, erreur = None, "BrokenProcessPool: processus de synthèse interrompu"
+                except Exception as exc:
+                    stats, erreur = None, f"{type(exc).__name__}: {exc}"
+                if erreur is not None and tentative < tentatives:
+                    rapport["resoumissions"] += 1
+                    a_relancer.append((tache, document, tentative + 1))
+                else:
+                    conclure(tache, document, stats, erreur)
+            if casse:
+                suspects.extend(a_relancer)
+                recreer_pool()
+            else:
+                for i, element in enumerate(a_relancer):
+                    if not soumettre(element):
+                        suspects.extend(a_relancer[i + 1:])
+                        break
+    finally:
+        executeur.shutdown(cancel_futures=True)
+        shutil.rmtree(dossier_temp, ignore_errors=True)
+
+    duree = time.perf_counter() - debut
+    rapport["echecs"] = echecs
+    rapport["duree_s"] = duree
+    rapport["documents_par_s"] = rapport["reussis"] / duree if duree else 0.0
+    rapport["caracteres_par_s"] = rapport["caracteres"] / duree if duree else 0.0
+    rapport["audio_par_s"] = rapport["duree_audio_s"] / duree if duree else 0.0
+    return rapport
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Conversion par lots de documents Word en audio.")
+    parseur.add_argument("source", help="Dossier de .docx (parcouru récursivement) ou manifeste (un chemin par ligne).")
+    parseur.add_argument("--sortie", default="audio", help="Dossier des fichiers audio (défaut : audio).")
+    parseur.add_argument("--processus", type=int, default=None, help="Processus de synthèse (défaut : nombre de CPU).")
+    parseur.add_argument("--taille_segment", type=int, default=TAILLE_SEGMENT)
+    parseur.add_argument("--taille_decoupe", type=int, default=TAILLE_DECOUPE,
+                         help="Taille (octets) au-delà de laquelle un document est réparti sur le pool.")
+    parseur.add_argument("--segments_par_partie", type=int, default=SEGMENTS_PAR_PARTIE)
+    parseur.add_argument("--tentatives", type=int, default=TENTATIVES)
+    parseur.add_argument("--rapport", help="Fichier JSON du rapport (défaut : sortie standard).")
+    options = parseur.parse_args(arguments)
+
+    def progression(document, reussi, termines):
+        print(f"[{termines}] {'ok' if reussi else 'ÉCHEC'} {document}", file=sys.stderr)
+
+    rapport = convertir_bibliotheque(options.source, options.sortie, options.processus, options.taille_segment,
+                                     taille_decoupe=options.taille_decoupe,
+                                     segments_par_partie=options.segments_par_partie,
+                                     tentatives=options.tentatives, progression=progression)
+    texte = json.dumps(rapport, indent=2, ensure_ascii=False)
+    if options.rapport:
+        with open(options.rapport, "w", encoding="utf-8") as fichier:
+            fichier.write(texte + "\n")
+    else:
+        print(texte)
+    return rapport
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Mode non interactif commun aux calculateurs de coûts.
+
+Sans argument, les scripts restent interactifs. Avec des arguments :
+- `--km_annuel 12000 --prix_carburant 1.9 …` : un seul calcul, résultat
+  écrit en une ligne JSON ;
+- `--lot fichier.jsonl` (ou `--lot -` pour l'entrée standard) : un
+  enregistrement JSON par ligne, résultats écrits au fil de l'eau (une
+  ligne JSON par enregistrement, champs d'entrée + résultats).
+
+Les enregistrements sont lus par blocs et calculés en une passe NumPy par
+bloc (noyaux de modele_couts) : le coût de démarrage de l'interpréteur est
+amorti sur tout le fichier. Une ligne invalide (y compris un enregistrement
+contenant un champ du nom d'un résultat, ex. cout_total) produit une ligne
+{"ligne": n, "erreur": …} à sa place, sans interrompre le traitement ; les
+lignes de sortie suivent l'ordre des lignes d'entrée. Un bloc dont le calcul
+lève une ArithmeticError (diviseur nul) est recalculé enregistrement par
+enregistrement, seuls les fautifs devenant des erreurs. Un résultat non fini
+(inf, nan) est écrit null : la sortie reste du JSON strict.
+"""
+
+import argparse
+import json
+import sys
+
+TAILLE_BLOC = 65_536
+
+
+def _decoder(numerotees):
+    """
+    Décode un bloc de lignes (numéro, texte) : (lignes, enregistrements, erreurs).
+
+    Le bloc est d'abord décodé en un seul appel json.loads (tableau JSON) ;
+    s'il contient une ligne invalide, chaque ligne est décodée séparément.
+    """
+    try:
+        decodes = json.loads("[" + ",".join(ligne for _, ligne in numerotees) + "]")
+        if len(decodes) != len(numerotees):  # Ligne contenant plusieurs valeurs
+            raise ValueError
+    except ValueError:
+        decodes = []
+        for numero, ligne in numerotees:
+            try:
+                decodes.append(json.loads(ligne))
+            except ValueError as exc:
+                decodes.append(exc)
+    lignes, enregistrements, erreurs = [], [], []
+    for (numero, ligne), enregistrement in zip(numerotees, decodes):
+        if isinstance(enregistrement, dict):
+            lignes.append((numero, ligne))
+            enregistrements.append(enregistrement)
+        elif isinstance(enregistrement, ValueError):
+            erreurs.append((numero, str(enregistrement)))
+        else:
+            erreurs.append((numero, "un objet JSON est attendu"))
+    return lignes, enregistrements, erreurs
+
+
+def _lire_blocs(entree, taille_bloc):
+    """
+    Regroupe les lignes non vides en blocs décodés (voir _decoder) ; une
+    erreur est un couple (numéro de ligne, message).
+    """
+    numerotees = []
+    for numero, ligne in enumerate(entree, 1):
+        ligne = ligne.strip()
+        if ligne:
+            numerotees.append((numero, ligne))
+            if len(numerotees) >= taille_bloc:
+                yield _decoder(numerotees)
+                numerotees = []
+    if numerotees:
+        yield _decoder(numerotees)
+
+
+def _valider(enregistrement, defauts):
+    """
+    Message d'erreur si un paramètre de l'enregistrement est manquant ou non numérique, sinon None.
+    """
+    for nom, defaut in defauts.items():
+        valeur = enregistrement.get(nom, defaut)
+        if valeur is None:
+            return f"paramètre manquant : {nom}"
+        try:
+            float(valeur)
+        except (TypeError, ValueError):
+            return f"valeur non numérique pour {nom} : {valeur!r}"
+    return None
+
+
+def _colonnes(enregistrements, defauts, np):
+    """
+    Tableau de chaque paramètre ; TypeError/ValueError si une valeur est
+    manquante (np.array convertirait None en NaN) ou non numérique.
+    """
+    colonnes = {}
+    for nom, defaut in defauts.items():
+        valeurs = [e.get(nom, defaut) for e in enregistrements]
+        if None in valeurs:
+            raise TypeError(f"paramètre manquant : {nom}")
+        colonnes[nom] = np.array(valeurs, dtype=np.float64)
+    return colonnes
+
+
+def _calculer(calcul, colonnes, n, np):
+    """
+    Résultats de `calcul` ramenés à des tableaux flottants de longueur n.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resultats = calcul(colonnes)
+    return {nom: np.broadcast_to(np.asarray(valeurs, dtype=np.float64), (n,))
+            for nom, valeurs in resultats.items()}
+
+
+def _erreur(numero, message):
+    return numero, json.dumps({"ligne": numero, "erreur": message}, ensure_ascii=False)
+
+
+def traiter_lot(entree, sortie, calcul, defauts, taille_bloc=TAILLE_BLOC):
+    """
+    Lit des enregistrements JSONL sur `entree` et écrit leurs résultats sur `sortie`.
+
+    Chaque ligne de sortie reprend le texte de l'enregistrement d'entrée,
+    complété des résultats (sérialisés directement, sans repasser par json) ;
+    les lignes d'erreur sont intercalées à la place des lignes fautives.
+
+    :param calcul: Fonction {paramètre : tableau} -> {résultat : tableau}.
+    :param defauts: {paramètre : valeur par défaut, ou None si obligatoire}.
+    :return: (nombre d'enregistrements calculés, nombre d'erreurs).
+    """
+    import numpy as np  # Uniquement en mode lot : l'usage interactif reste léger
+
+    calcules = n_erreurs = 0
+    for lignes, enregistrements, erreurs in _lire_blocs(entree, taille_bloc):
+        try:
+            colonnes = _colonnes(enregistrements, defauts, np)
+        except (TypeError, ValueError):
+            # Au moins un enregistrement invalide : tri un par un
+            valides = []
+            for (numero, ligne), enregistrement in zip(lignes, enregistrements):
+                message = _valider(enregistrement, defauts)
+                if message is None:
+                    valides.append(((numero, ligne), enregistrement))
+                else:
+                    erreurs.append((numero, message))
+            lignes = [ligne for ligne, _ in valides]
+            enregistrements = [enregistrement for _, enregistrement in valides]
+            colonnes = _colonnes(enregistrements, defauts, np)
+
+        sorties = [_erreur(numero, message) for numero, message in erreurs]
+        n = len(lignes)
+        if n:
+            try:
+                resultats = _calculer(calcul, colonnes, n, np)
+            except ArithmeticError:
+                # Diviseur nul dans le bloc (ex. km_pneus = 0) : calcul un par un
+                valides, calcules_un_par_un = [], []
+                for i, (numero, _) in enumerate(lignes):
+                    try:
+                        calcules_un_par_un.append(
+                            _calculer(calcul, {nom: valeurs[i:i + 1] for nom, valeurs in colonnes.items()}, 1, np))
+                    except ArithmeticError as exc:
+                        erreurs.append((numero, str(exc)))
+                        sorties.append(_erreur(numero, str(exc)))
+                    else:
+                        valides.append(i)
+                lignes = [lignes[i] for i in valides]
+                enregistrements = [enregistrements[i] for i in valides]
+                n = len(lignes)
+                resultats = {nom: np.concatenate([resultat[nom] for resultat in calcules_un_par_un])
+                             for nom in (calcules_un_par_un[0] if n else ())}
+        if n:
+            suffixe = "".join(f', "{nom}": %s' for nom in resultats) + "}"
+            # repr() des flottants finis : JSON valide, relu au bit près ; null sinon
+            colonnes_texte = []
+            for valeurs in resultats.values():
+                texte = list(map(repr, valeurs.tolist()))
+                for i in np.flatnonzero(~np.isfinite(valeurs)).tolist():
+                    texte[i] = "null"
+                colonnes_texte.append(texte)
+            for (numero, ligne), enregistrement, texte in zip(lignes, enregistrements, zip(*colonnes_texte)):
+                reserves = resultats.keys() & enregistrement
+                if reserves:
+                    message = f"champ réservé aux résultats : {', '.join(sorted(reserves))}"
+                    sorties.append(_erreur(numero, message))
+                    n -= 1
+                    erreurs.append((numero, message))
+                elif ligne.endswith("}") and enregistrement:
+                    sorties.append((numero, ligne[:-1] + suffixe % texte))
+                else:  # Objet vide : sérialisation complète
+                    sorties.append((numero, "{" + suffixe[2:] % texte))
+        if sorties:
+            sorties.sort(key=lambda sortie_ligne: sortie_ligne[0])
+            sortie.write("\n".join(texte for _, texte in sorties) + "\n")
+        calcules += n
+        n_erreurs += len(erreurs)
+    return calcules, n_erreurs
+
+
+def executer(arguments, description, calcul, defauts):
+    """
+    Point d'entrée non interactif d'un calculateur.
+
+    :return: False si aucun argument n'est fourni (le script reste alors
+             interactif), True une fois le calcul effectué.
+    """
+    if not arguments:
+        return False
+    parseur = argparse.ArgumentParser(description=description)
+    for nom, defaut in defauts.items():
+        parseur.add_argument(f"--{nom}", type=float, default=defaut,
+                             help=f"(défaut : {defaut})" if defaut is not None else "(obligatoire hors --lot)")
+    parseur.add_argument("--lot", metavar="FICHIER",
+                         help="Fichier JSONL d'enregistrements ('-' : entrée standard).")
+    parseur.add_argument("--sortie", metavar="FICHIER", help="Fichier JSONL de résultats (défaut : sortie standard).")
+    parseur.add_argument("--taille_bloc", type=int, default=TAILLE_BLOC)
+    options = parseur.parse_args(arguments)
+
+    sortie = open(options.sortie, "w", encoding="utf-8") if options.sortie else sys.stdout
+    try:
+        if options.lot is None:
+            valeurs = {nom: getattr(options, nom) for nom in defauts}
+            manquants = [nom for nom, valeur in valeurs.items() if valeur is None]
+            if manquants:
+                parseur.error(f"paramètres manquants : {', '.join('--' + nom for nom in manquants)}")
+            traiter_lot([json.dumps(valeurs)], sortie, calcul, defauts)
+        else:
+            defauts_lot = {nom: getattr(options, nom) for nom in defauts}
+            if options.lot == "-":
+                traiter_lot(sys.stdin, sortie, calcul, defauts_lot, options.taille_bloc)
+            else:
+                with open(options.lot, encoding="utf-8") as entree:
+                    traiter_lot(entree, sortie, calcul, defauts_lot, options.taille_bloc)
+    finally:
+        if sortie is not sys.stdout:
+            sortie.close()
+    return True
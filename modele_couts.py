@@ -0,0 +1,133 @@
+"""
+Modèle de coûts commun aux calculateurs de véhicule (GTstreet.py,
+calculer_consommation_essence.py, Calculateur_Porsche_992.py).
+
+Les noyaux n'utilisent que des opérations arithmétiques et des comparaisons :
+ils acceptent indifféremment des nombres Python (usage interactif) ou des
+tableaux NumPy (calcul par lots, voir couts_flotte.py), avec exactement les
+mêmes résultats. Le module n'importe rien : son import est immédiat (NumPy
+n'est importé que si on lui passe des tableaux).
+
+Cas limites, identiques en scalaire et en tableau :
+- km_pneus nul lève ZeroDivisionError, comme la division entière scalaire,
+  même si un seul élément du tableau est nul ;
+- les branches écartées (km_par_an <= 0, km <= 0, km_annuel < km_pneus)
+  valent exactement 0 : un inf ou un nan n'y est pas propagé ;
+- ailleurs, inf et nan suivent l'arithmétique flottante habituelle ; un
+  nan dans une condition suit le test d'origine (0 pour cout_par_km, qui
+  teste km > 0 ; nan pour entretien_proportionnel, qui teste km_par_an <= 0).
+
+Politiques d'entretien (une par variante historique) :
+- "seuil" : une révision par an, plus km_annuel // km_pneus jeux de pneus
+  seulement si km_annuel >= km_pneus (calculer_consommation_essence.py) ;
+- "division" : une révision par an, plus toujours km_annuel // km_pneus jeux
+  de pneus (Calculateur_Porsche_992.py ; diffère de "seuil" pour des
+  kilométrages négatifs) ;
+- "proportionnel" : coût annuel au prorata des kilomètres parcourus,
+  0 si km_par_an <= 0 (GTstreet.py).
+"""
+
+
+def _sur(diviseur):
+    """
+    Diviseur remplacé par 1 là où il est <= 0 (le résultat y est ensuite écarté).
+    """
+    return _si(diviseur <= 0, 1, diviseur)
+
+
+def _si(condition, valeur, sinon=0.0):
+    """
+    `valeur` là où `condition` est vraie, `sinon` ailleurs (sans multiplier
+    par la condition : un inf ou un nan écarté ne donne pas nan).
+    """
+    if isinstance(condition, bool):
+        return valeur if condition else sinon
+    import numpy as np
+    return np.where(condition, valeur, sinon)
+
+
+def _verifier_non_nul(diviseur, nom):
+    nul = diviseur == 0
+    if nul if isinstance(nul, bool) else nul.any():
+        raise ZeroDivisionError(f"{nom} ne peut pas être nul")
+
+
+def consommation_essence(km, conso_moyenne=13.0, prix_carburant=1.8):
+    """
+    Litres consommés et coût du carburant.
+    :param km: Kilomètres parcourus.
+    :param conso_moyenne: Consommation moyenne en L/100 km.
+    :param prix_carburant: Prix du litre (€).
+    :return: Tuple (litres, coût en €).
+    """
+    litres = (km / 100) * conso_moyenne
+    return litres, litres * prix_carburant
+
+
+def entretien_seuil(km_annuel, cout_revision=3000, cout_pneus=1500, km_pneus=15000):
+    """
+    Révision annuelle + pneus, comptés seulement si km_annuel >= km_pneus.
+    """
+    _verifier_non_nul(km_pneus, "km_pneus")
+    return cout_revision + _si(km_annuel >= km_pneus, cout_pneus * (km_annuel // km_pneus), 0)
+
+
+def entretien_division(km_annuel, cout_revision=3000, cout_pneus=1500, km_pneus=15000):
+    """
+    Révision annuelle + km_annuel // km_pneus jeux de pneus.
+    """
+    _verifier_non_nul(km_pneus, "km_pneus")
+    return cout_revision + cout_pneus * (km_annuel // km_pneus)
+
+
+def entretien_proportionnel(kilometres_parcourus, cout_annuel_eur, km_par_an):
+    """
+    Coût d'entretien annuel au prorata des kilomètres parcourus (0 si km_par_an <= 0).
+    """
+    proportion = kilometres_parcourus / _sur(km_par_an)
+    # Test <= 0 d'origine (GTstreet.py) : un km_par_an nan donne nan, pas 0
+    return _si(km_par_an <= 0, 0.0, proportion * cout_annuel_eur) + 0.0  # + 0.0 : pas de -0.0
+
+
+POLITIQUES_ENTRETIEN = {
+    "seuil": entretien_seuil,
+    "division": entretien_division,
+    "proportionnel": entretien_proportionnel,
+}
+
+
+def politique_entretien(nom):
+    """
+    Fonction de coût d'entretien de la politique `nom`.
+    """
+    try:
+        return POLITIQUES_ENTRETIEN[nom]
+    except KeyError:
+        raise ValueError(f"Politique d'entretien inconnue : {nom!r} "
+                         f"(attendu : {', '.join(POLITIQUES_ENTRETIEN)})") from None
+
+
+def cout_par_km(cout_total, km):
+    """
+    Coût moyen par kilomètre (0 si km <= 0).
+    """
+    return _si(km > 0, cout_total / _sur(km)) + 0.0
+
+
+def calculer_couts(km, conso_moyenne=13.0, prix_carburant=1.8, politique="seuil", **entretien):
+    """
+    Tous les coûts d'une année pour `km` kilomètres parcourus.
+    :param entretien: Paramètres de la fonction d'entretien de la politique
+                      (hors kilométrage, qui est `km`).
+    :return: Dictionnaire {litres, cout_carburant, cout_entretien, cout_total, cout_km}.
+    """
+    litres, cout_carburant = consommation_essence(km, conso_moyenne, prix_carburant)
+    cout_entretien = politique_entretien(politique)(km, **entretien)
+    cout_total = cout_carburant + cout_entretien
+    return {
+        "litres": litres,
+        "cout_carburant": cout_carburant,
+        "cout_entretien": cout_entretien,
+        "cout_total": cout_total,
+        "cout_km": cout_par_km(cout_total, km),
+    }
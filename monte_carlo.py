@@ -0,0 +1,174 @@
+"""
+Simulations de Monte Carlo de catastrophes sur un pool de processus.
+
+Les simulations sont réparties en lots de `taille_lot` écosystèmes, chacun
+simulé par un MoteurEcosystemes avec son propre flux aléatoire
+(SeedSequence.spawn). Un lot ne renvoie que des agrégats par cycle : sommes,
+sommes des carrés, extinctions et histogrammes (classes logarithmiques)
+des valeurs, d'où sont lus les percentiles. Les histogrammes voyagent sous
+forme creuse (positions et effectifs des classes non vides, en entiers
+compacts) : la plupart des classes d'un lot sont vides.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from simulation_vectorisee import ECOSYSTEME_INITIAL, MoteurEcosystemes
+
+
+@dataclass
+class ResultatsMonteCarlo:
+    """
+    Statistiques par cycle (lignes) et par élément (colonnes) de toutes les simulations.
+    """
+    elements: tuple
+    n_simulations: int
+    moyenne: np.ndarray
+    ecart_type: np.ndarray
+    percentiles: dict  # {p : tableau cycles × éléments}
+    probabilite_extinction: np.ndarray
+
+    def element(self, nom):
+        """
+        Statistiques d'un seul élément sous forme de dictionnaire de séries par cycle.
+        """
+        j = self.elements.index(nom)
+        serie = {"moyenne": self.moyenne[:, j], "ecart_type": self.ecart_type[:, j],
+                 "probabilite_extinction": self.probabilite_extinction[:, j]}
+        serie.update({f"p{p:g}": valeurs[:, j] for p, valeurs in self.percentiles.items()})
+        return serie
+
+
+def _type_entier(borne):
+    """
+    Plus petit type entier non signé contenant `borne`.
+    """
+    for dtype in (np.uint16, np.uint32):
+        if borne <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def _simuler_lot(args):
+    """
+    Simule un lot d'écosystèmes dans un processus et ne renvoie que des agrégats
+    par cycle : sommes, sommes des carrés, extinctions et histogrammes creux
+    (positions à plat dans cycles × éléments × classes, effectifs).
+    """
+    n_ecosystemes, cycles, graine, ecosysteme_initial, catastrophes, bords, seuil = args
+    moteur = MoteurEcosystemes(n_ecosystemes, ecosysteme_initial, catastrophes, graine=graine)
+    n_elements = len(moteur.elements)
+
+    sommes = np.zeros((cycles, n_elements))
+    carres = np.zeros((cycles, n_elements))
+    eteints = np.zeros((cycles, n_elements), dtype=_type_entier(n_ecosystemes))
+    n_classes = len(bords) - 1
+    taille_cycle = n_elements * n_classes
+    type_position = _type_entier(cycles * taille_cycle)
+    type_effectif = _type_entier(n_ecosystemes)
+    positions, effectifs = [], []
+    decalage = np.arange(n_elements) * n_classes  # Une plage de classes par élément
+
+    for cycle in range(cycles):
+        moteur.etape()
+        etat = moteur.etat
+        sommes[cycle] = etat.sum(axis=0)
+        carres[cycle] = (etat * etat).sum(axis=0)
+        eteints[cycle] = (etat <= seuil).sum(axis=0)
+        classes = np.clip(np.searchsorted(bords, etat, side='right') - 1, 0, n_classes - 1)
+        histogramme = np.bincount((classes + decalage).ravel(), minlength=taille_cycle)
+        non_vides = np.flatnonzero(histogramme)
+        positions.append((non_vides + cycle * taille_cycle).astype(type_position))
+        effectifs.append(histogramme[non_vides].astype(type_effectif))
+    return sommes, carres, eteints, (np.concatenate(positions), np.concatenate(effectifs))
+
+
+def bords_classes(borne_max, n_classes):
+    """
+    Bords des classes d'histogramme : une classe [0, 0.01) pour les valeurs
+    nulles (les valeurs sont arrondies au centième), puis des classes
+    logarithmiques jusqu'à `borne_max` (erreur relative constante).
+    """
+    return np.concatenate(([0.0], np.geomspace(0.01, borne_max, n_classes)))
+
+
+def _percentile_histogramme(histogrammes, p, bords):
+    """
+    Percentile p (0-100) lu dans des histogrammes cycles × éléments × classes,
+    par interpolation linéaire dans la classe concernée.
+    """
+    n_classes = histogrammes.shape[-1]
+    cumul = np.cumsum(histogrammes, axis=-1)
+    cible = p / 100 * cumul[..., -1]
+    classe = np.minimum((cumul < cible[..., None]).sum(axis=-1), n_classes - 1)
+    effectif = np.take_along_axis(histogrammes, classe[..., None], -1)[..., 0]
+    avant = np.take_along_axis(cumul, classe[..., None], -1)[..., 0] - effectif
+    fraction = np.clip((cible - avant) / np.maximum(effectif, 1), 0.0, 1.0)
+    valeurs = bords[classe] + fraction * (bords[classe + 1] - bords[classe])
+    return np.where(classe == 0, 0.0, valeurs)  # La première classe ne contient que des zéros
+
+
+def executer_monte_carlo(n_simulations, cycles, graine=None, processus=None, taille_lot=1000,
+                         ecosysteme_initial=None, catastrophes=None, percentiles=(5, 50, 95),
+                         n_classes=256, seuil_extinction=0.0):
+    """
+    Lance `n_simulations` simulations indépendantes de `cycles` cycles, réparties
+    par lots sur un pool de processus, et agrège leurs statistiques par cycle.
+
+    - graine : Graine racine ; chaque lot reçoit un flux dérivé par
+      SeedSequence.spawn, les résultats ne dépendent donc pas du nombre de processus.
+    - processus : Taille du pool (par défaut : nombre de cœurs) ; 1 pour tout
+      simuler dans le processus courant.
+    - taille_lot : Nombre d'écosystèmes simulés ensemble par un processus.
+    - n_classes : Nombre de classes (logarithmiques) des histogrammes servant
+      au calcul des percentiles ; 256 donne une erreur relative d'environ 4 %.
+    - seuil_extinction : Un élément est considéré éteint à ou sous ce seuil.
+    """
+    if n_simulations < 1:
+        raise ValueError(f"Nombre de simulations invalide : {n_simulations} (attendu : au moins 1)")
+    ecosysteme_initial = ecosysteme_initial or ECOSYSTEME_INITIAL
+    elements = tuple(ecosysteme_initial)
+    borne_max = max(100.0, *map(float, ecosysteme_initial.values()))  # La récupération plafonne à 100
+
+    tailles = [min(taille_lot, n_simulations - debut) for debut in range(0, n_simulations, taille_lot)]
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+    bords = bords_classes(borne_max, n_classes)
+    lots = [(taille, cycles, g, ecosysteme_initial, catastrophes, bords, seuil_extinction)
+            for taille, g in zip(tailles, graines)]
+
+    if processus == 1 or len(lots) == 1:
+        agregats = _fusionner(map(_simuler_lot, lots), cycles * len(elements) * n_classes)
+    else:
+        with ProcessPoolExecutor(max_workers=processus or os.cpu_count()) as executeur:
+            agregats = _fusionner(executeur.map(_simuler_lot, lots), cycles * len(elements) * n_classes)
+
+    sommes, carres, eteints, histogrammes = agregats
+    histogrammes = histogrammes.reshape(cycles, len(elements), n_classes)
+    moyenne = sommes / n_simulations
+    variance = np.maximum(carres / n_simulations - moyenne ** 2, 0.0)
+    return ResultatsMonteCarlo(
+        elements=elements,
+        n_simulations=n_simulations,
+        moyenne=moyenne,
+        ecart_type=np.sqrt(variance),
+        percentiles={p: _percentile_histogramme(histogrammes, p, bords) for p in percentiles},
+        probabilite_extinction=eteints / n_simulations,
+    )
+
+
+def _fusionner(resultats, taille_histogrammes):
+    """
+    Additionne les agrégats des lots au fur et à mesure de leur arrivée ; les
+    histogrammes creux sont accumulés dans un histogramme dense à plat.
+    """
+    total = None
+    histogrammes = np.zeros(taille_histogrammes, dtype=np.int64)
+    for *resultat, (positions, effectifs) in resultats:
+        resultat = [np.asarray(valeurs, dtype=np.float64 if valeurs.dtype.kind == "f" else np.int64)
+                    for valeurs in resultat]
+        total = resultat if total is None else [a + b for a, b in zip(total, resultat)]
+        histogrammes[positions] += effectifs  # Positions uniques au sein d'un lot
+    return total + [histogrammes]
@@ -0,0 +1,261 @@
+"""
+Points de reprise (checkpoints) pour les longues simulations MoteurEcosystemes.
+
+Les instantanés sont ajoutés à la suite dans un seul fichier binaire :
+- un en-tête de fichier (nombre d'écosystèmes, éléments) ;
+- puis des enregistrements, chacun précédé d'un en-tête (type, cycle,
+  longueur, CRC32) : complets (état, récupérations en attente, état du
+  générateur aléatoire) ou différentiels (seules les cellules modifiées
+  depuis l'instantané précédent : indices à plat et nouvelles valeurs).
+
+Les récupérations sont stockées en cycle d'échéance absolu plutôt qu'en
+compte à rebours : une cellule sans nouvel événement ne change donc pas d'un
+instantané à l'autre. Un instantané complet est écrit tous les
+`complet_tous` enregistrements (ou dès qu'un delta serait plus volumineux),
+ce qui borne la chaîne de deltas à rejouer. La comparaison se fait sur les
+bits (vue uint64) : la reprise est exacte au bit près. L'état du générateur
+est stocké en JSON : la lecture n'exécute rien du contenu du fichier. Un enregistrement tronqué
+par un arrêt brutal est ignoré (et écrasé à l'écriture suivante). La lecture
+passe par mmap : seuls les enregistrements utiles sont lus.
+"""
+
+import base64
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC_FICHIER = b"ECOSAUV2"
+MAGIC_ENREGISTREMENT = b"SNAP"
+EN_TETE = struct.Struct("<4sBBqQI")  # magic, type, compression, cycle, longueur, crc32
+COMPLET, DELTA = 0, 1
+
+
+class SauvegardeSimulation:
+    """
+    Fichier d'instantanés d'un MoteurEcosystemes.
+    """
+
+    def __init__(self, chemin, complet_tous=10, compression=True):
+        """
+        - complet_tous : Un instantané complet tous les N enregistrements (les autres sont des deltas).
+        - compression : Compresse chaque enregistrement (zlib, niveau 1).
+        """
+        self.chemin = chemin
+        self.complet_tous = max(int(complet_tous), 1)
+        self.compression = compression
+        self.enregistrements = []  # [(cycle, type, position du contenu, longueur, compression, crc)]
+        self._fin = None  # Fin du dernier enregistrement valide
+        self._dimensions = None
+        self._base = None  # (état, compteurs) du dernier enregistrement, référence des deltas
+        if os.path.exists(chemin):
+            self._indexer()
+
+    # --- Lecture ---------------------------------------------------------
+
+    def _indexer(self):
+        with open(self.chemin, "rb") as fichier:
+            magic = fichier.read(len(MAGIC_FICHIER))
+            if magic != MAGIC_FICHIER:
+                raise ValueError(f"{self.chemin} n'est pas un fichier de sauvegarde de simulation.")
+            (longueur,) = struct.unpack("<I", fichier.read(4))
+            self._dimensions = json.loads(fichier.read(longueur).decode("utf-8"))
+            position = fichier.tell()
+            taille = os.fstat(fichier.fileno()).st_size
+            while position + EN_TETE.size <= taille:
+                fichier.seek(position)
+                magic, type_, compresse, cycle, longueur, crc = EN_TETE.unpack(fichier.read(EN_TETE.size))
+                debut = position + EN_TETE.size
+                if magic != MAGIC_ENREGISTREMENT or debut + longueur > taille:
+                    break  # Enregistrement tronqué : écriture interrompue
+                self.enregistrements.append((cycle, type_, debut, longueur, compresse, crc))
+                position = debut + longueur
+        self._fin = position
+
+    @property
+    def cycles(self):
+        """
+        Cycles des instantanés disponibles.
+        """
+        return [enregistrement[0] for enregistrement in self.enregistrements]
+
+    def _contenu(self, carte, numero):
+        cycle, type_, debut, longueur, compresse, crc = self.enregistrements[numero]
+        contenu = carte[debut:debut + longueur]
+        if zlib.crc32(contenu) != crc:
+            raise ValueError(f"Instantané du cycle {cycle} corrompu (CRC invalide).")
+        return zlib.decompress(contenu) if compresse else contenu
+
+    def _decoder(self, contenu, type_, etat, echeances):
+        """
+        Applique un enregistrement à (etat, echeances) et retourne l'état du générateur.
+        """
+        n, e = etat.shape
+        if type_ == COMPLET:
+            taille = n * e * 8
+            etat[...] = np.frombuffer(contenu, dtype=np.float64, count=n * e).reshape(n, e)
+            echeances[...] = np.frombuffer(contenu, dtype=np.int32, count=n * e, offset=taille).reshape(n, e)
+            reste = taille + n * e * 4
+        else:
+            (k,) = struct.unpack_from("<Q", contenu)
+            cellules = np.frombuffer(contenu, dtype=np.int64, count=k, offset=8)
+            position = 8 + 8 * k
+            etat.reshape(-1)[cellules] = np.frombuffer(contenu, dtype=np.float64, count=k, offset=position)
+            position += 8 * k
+            echeances.reshape(-1)[cellules] = np.frombuffer(contenu, dtype=np.int32, count=k, offset=position)
+            reste = position + 4 * k
+        return json.loads(bytes(contenu[reste:]).decode("utf-8"))
+
+    def restaurer(self, moteur, cycle=None):
+        """
+        Remet `moteur` (construit avec les mêmes paramètres) dans l'état de
+        l'instantané du cycle donné (par défaut, le dernier) et retourne ce cycle.
+        Les instantanés postérieurs sont abandonnés.
+        """
+        if not self.enregistrements:
+            raise ValueError(f"Aucun instantané dans {self.chemin}.")
+        self._verifier_dimensions(moteur)
+        cycles = self.cycles
+        numero = len(cycles) - 1 if cycle is None else cycles.index(cycle)
+        premier = max(i for i in range(numero + 1) if self.enregistrements[i][1] == COMPLET)
+
+        etat = np.empty_like(moteur.etat)
+        echeances = np.empty_like(moteur.compteurs)
+        with open(self.chemin, "rb") as fichier, \
+                mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as carte:
+            for i in range(premier, numero + 1):
+                contenu = self._contenu(carte, i)
+                generateur = self._decoder(contenu, self.enregistrements[i][1], etat, echeances)
+
+        cycle, _, debut, longueur, _, _ = self.enregistrements[numero]
+        moteur.etat[...] = etat
+        moteur.compteurs[...] = np.where(echeances > 0, echeances - cycle, 0)
+        moteur.cycle = cycle
+        _restaurer_generateur(moteur, generateur)
+
+        self._base = (etat, echeances)
+        del self.enregistrements[numero + 1:]
+        self._fin = debut + longueur
+        return cycle
+
+    # --- Écriture --------------------------------------------------------
+
+    def _verifier_dimensions(self, moteur):
+        dimensions = {"n_ecosystemes": moteur.n_ecosystemes, "elements": list(moteur.elements),
+                      "reference": moteur.reference}
+        if self._dimensions is not None and self._dimensions != dimensions:
+            raise ValueError(f"Le moteur ne correspond pas à la sauvegarde {self.chemin} : "
+                             f"{dimensions} au lieu de {self._dimensions}")
+        return dimensions
+
+    def sauvegarder(self, moteur):
+        """
+        Ajoute un instantané (complet ou différentiel) de `moteur` et retourne son cycle.
+        """
+        dimensions = self._verifier_dimensions(moteur)
+        if self._dimensions is None or self._fin is None:
+            en_tete = json.dumps(dimensions).encode("utf-8")
+            with open(self.chemin, "wb") as fichier:
+                fichier.write(MAGIC_FICHIER + struct.pack("<I", len(en_tete)) + en_tete)
+                self._fin = fichier.tell()
+            self._dimensions = dimensions
+            self.enregistrements = []
+
+        echeances = _echeances(moteur)
+        generateur = json.dumps(_etat_generateur(moteur)).encode("utf-8")
+        cellules = None
+        if self._base is not None and self._deltas_depuis_complet() + 1 < self.complet_tous:
+            etat_base, echeances_base = self._base
+            modifiees = ((moteur.etat.view(np.uint64) != etat_base.view(np.uint64)) |
+                         (echeances != echeances_base))
+            cellules = np.flatnonzero(modifiees).astype(np.int64)
+            # 20 octets par cellule modifiée (indice, état, échéance) contre 12 par cellule
+            if 20 * len(cellules) >= 12 * modifiees.size:
+                cellules = None  # Un instantané complet est alors plus petit
+        if cellules is None:
+            type_ = COMPLET
+            parties = [moteur.etat.tobytes(), echeances.tobytes(), generateur]
+        else:
+            type_ = DELTA
+            parties = [struct.pack("<Q", len(cellules)), cellules.tobytes(),
+                       moteur.etat.reshape(-1)[cellules].tobytes(), echeances.reshape(-1)[cellules].tobytes(),
+                       generateur]
+
+        contenu = b"".join(parties)
+        if self.compression:
+            contenu = zlib.compress(contenu, 1)
+        crc = zlib.crc32(contenu)
+        with open(self.chemin, "r+b") as fichier:
+            fichier.seek(self._fin)
+            fichier.write(EN_TETE.pack(MAGIC_ENREGISTREMENT, type_, bool(self.compression),
+                                       moteur.cycle, len(contenu), crc))
+            fichier.write(contenu)
+            fichier.truncate()  # Écrase un éventuel enregistrement tronqué ou abandonné
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        debut = self._fin + EN_TETE.size
+        self.enregistrements.append((moteur.cycle, type_, debut, len(contenu), bool(self.compression), crc))
+        self._fin = debut + len(contenu)
+        self._base = (moteur.etat.copy(), echeances)
+        return moteur.cycle
+
+    def _deltas_depuis_complet(self):
+        deltas = 0
+        for enregistrement in reversed(self.enregistrements):
+            if enregistrement[1] == COMPLET:
+                break
+            deltas += 1
+        return deltas
+
+
+def _echeances(moteur):
+    """
+    Cycle d'échéance absolu de chaque récupération en attente (0 : aucune).
+    """
+    return np.where(moteur.compteurs > 0, moteur.compteurs + moteur.cycle, 0).astype(np.int32)
+
+
+def _etat_generateur(moteur):
+    """
+    État du ou des générateurs aléatoires, sérialisable en JSON.
+    """
+    if moteur.reference:
+        etats = []
+        for generateur in moteur._generateurs:
+            etat = generateur.get_state(legacy=False)
+            etat["state"]["key"] = base64.b64encode(etat["state"]["key"].astype("<u4").tobytes()).decode("ascii")
+            etats.append(etat)
+        return etats
+    return moteur.rng.bit_generator.state
+
+
+def _restaurer_generateur(moteur, etat):
+    if moteur.reference:
+        for generateur, etat_generateur in zip(moteur._generateurs, etat):
+            cle = base64.b64decode(etat_generateur["state"]["key"])
+            etat_generateur["state"]["key"] = np.frombuffer(cle, dtype="<u4").astype(np.uint32)
+            generateur.set_state(etat_generateur)
+    else:
+        moteur.rng.bit_generator.state = etat
+
+
+def simuler_avec_sauvegardes(moteur, cycles, chemin, intervalle=100, reprendre=True, **options):
+    """
+    Simule jusqu'au cycle `cycles` en enregistrant un instantané tous les
+    `intervalle` cycles. Si `reprendre` et que `chemin` contient déjà des
+    instantanés, la simulation repart du dernier d'entre eux.
+    Les autres options sont transmises à SauvegardeSimulation.
+    """
+    if not reprendre and os.path.exists(chemin):
+        os.remove(chemin)
+    sauvegarde = SauvegardeSimulation(chemin, **options)
+    if sauvegarde.enregistrements:
+        sauvegarde.restaurer(moteur)
+    while moteur.cycle < cycles:
+        moteur.etape()
+        if moteur.cycle % intervalle == 0 or moteur.cycle == cycles:
+            sauvegarde.sauvegarder(moteur)
+    return moteur.etat
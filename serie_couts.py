@@ -0,0 +1,161 @@
+"""
+Coûts de carburant sur des séries temporelles (prix journaliers, journaux de trajets).
+
+calculer_consommation_essence.py suppose un prix du carburant et un
+kilométrage annuel constants. SerieCouts part plutôt :
+- d'une série de prix datés (relevés irréguliers possibles : chaque prix
+  reste valable jusqu'au relevé suivant) ;
+- de journaux de trajets (véhicule, date, km), plusieurs trajets par jour
+  et par véhicule étant cumulés.
+
+Les deux séries sont alignées sur un axe journalier, le coût de chaque
+jour est calculé avec le noyau consommation_essence de modele_couts, puis
+des sommes cumulées (préfixes) sont précalculées une fois pour toutes :
+le coût, les litres ou les kilomètres entre deux dates quelconques
+s'obtiennent alors en O(1) par une différence de deux préfixes, sans
+resommer la période. Les requêtes acceptent des tableaux de dates (et de
+véhicules) et sont traitées en une passe NumPy.
+
+Mémoire : l'index par véhicule occupe 2 × véhicules × jours flottants
+(≈ 290 Mo pour 5 000 véhicules sur 10 ans) ; avec par_vehicule=False, aucun
+tableau véhicules × jours n'est alloué : les séries de la flotte sont
+cumulées directement depuis les trajets (mémoire en O(jours + trajets)).
+
+Exemple :
+    serie = SerieCouts((dates_prix, prix), (vehicules, dates, km), conso_moyenne={"AB-123-CD": 13.0})
+    serie.cout("2024-01-01", "2024-03-31")                       # Toute la flotte
+    serie.cout("2024-01-01", "2024-03-31", vehicule="AB-123-CD")
+"""
+
+import numpy as np
+
+from modele_couts import consommation_essence
+
+JOUR = np.timedelta64(1, "D")
+
+
+def _jours(dates):
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+class SerieCouts:
+    """
+    Index de coûts cumulés par jour, pour la flotte et (optionnellement) par véhicule.
+    """
+
+    def __init__(self, prix, trajets, conso_moyenne=13.0, par_vehicule=True):
+        """
+        :param prix: Couple (dates, prix du litre en €), dates quelconques ;
+                     le prix d'un jour est celui du dernier relevé à cette date.
+        :param trajets: Triplet (véhicules, dates, km) de tableaux de même longueur.
+        :param conso_moyenne: Consommation en L/100 km : scalaire, ou
+                              {véhicule : consommation} (13.0 pour les absents).
+        :param par_vehicule: Construire aussi l'index de chaque véhicule.
+        """
+        dates_prix, valeurs_prix = _jours(prix[0]), np.asarray(prix[1], dtype=np.float64)
+        vehicules, dates, km = trajets
+        dates, km = _jours(dates), np.asarray(km, dtype=np.float64)
+        if not (len(vehicules) == len(dates) == len(km)):
+            raise ValueError("Les tableaux de trajets (véhicules, dates, km) doivent avoir la même longueur")
+        if not len(dates_prix):
+            raise ValueError("La série de prix est vide")
+        ordre = np.argsort(dates_prix, kind="stable")
+        dates_prix, valeurs_prix = dates_prix[ordre], valeurs_prix[ordre]
+        if len(dates) and dates.min() < dates_prix[0]:
+            raise ValueError(f"Trajets antérieurs au premier prix connu ({dates_prix[0]})")
+
+        # Axe journalier [debut, fin] couvrant prix et trajets
+        self.debut = dates_prix[0]
+        self.fin = max(dates_prix[-1], dates.max()) if len(dates) else dates_prix[-1]
+        n_jours = int((self.fin - self.debut) // JOUR) + 1
+        axe = self.debut + np.arange(n_jours) * JOUR
+        # Prix en vigueur chaque jour : dernier relevé à cette date (le plus récent en cas de doublon)
+        self.prix = valeurs_prix[np.searchsorted(dates_prix, axe, side="right") - 1]
+
+        self.vehicules, indices = np.unique(np.asarray(vehicules), return_inverse=True)
+        if isinstance(conso_moyenne, dict):
+            conso = np.array([conso_moyenne.get(v.item(), 13.0) for v in self.vehicules], dtype=np.float64)
+        else:
+            conso = np.full(len(self.vehicules), conso_moyenne, dtype=np.float64)
+        self.conso_moyenne = conso
+        jours = ((dates - self.debut) // JOUR).astype(np.int64)
+
+        # Flotte, directement depuis les trajets : km et km × conso cumulés par jour
+        # (le noyau appelé avec une consommation de 1 donne alors les litres)
+        km_flotte = np.bincount(jours, weights=km, minlength=n_jours)
+        litres_flotte, cout_flotte = consommation_essence(
+            np.bincount(jours, weights=km * conso[indices], minlength=n_jours), 1.0, self.prix)
+
+        # Préfixes : cumul[..., j] = somme des jours < j (colonne 0 nulle)
+        self._flotte = {"km": self._prefixe(km_flotte), "litres": self._prefixe(litres_flotte),
+                        "cout_carburant": self._prefixe(cout_flotte)}
+        self._vehicules = None
+        if par_vehicule:
+            # Kilomètres par (véhicule, jour) ; trajets du même jour cumulés
+            n_vehicules = len(self.vehicules)
+            km_jour = np.bincount(indices * n_jours + jours, weights=km,
+                                  minlength=n_vehicules * n_jours).reshape(n_vehicules, n_jours)
+            _, cout_jour = consommation_essence(km_jour, conso[:, None], self.prix[None, :])
+            # Les litres d'un véhicule sont ses km × conso / 100 : seuls km et coût sont indexés
+            self._vehicules = {"km": self._prefixe(km_jour), "cout_carburant": self._prefixe(cout_jour)}
+        self._indice_vehicule = {v.item(): i for i, v in enumerate(self.vehicules)}
+
+    @staticmethod
+    def _prefixe(valeurs):
+        prefixe = np.zeros(valeurs.shape[:-1] + (valeurs.shape[-1] + 1,))
+        np.cumsum(valeurs, axis=-1, out=prefixe[..., 1:])
+        return prefixe
+
+    def _bornes(self, debut, fin):
+        """
+        Indices de préfixe de [debut, fin] (dates incluses), limités à l'axe.
+        """
+        n_jours = len(self.prix)
+        a = np.clip((_jours(debut) - self.debut) // JOUR, 0, n_jours)
+        b = np.clip((_jours(fin) - self.debut) // JOUR + 1, 0, n_jours)
+        return a, np.maximum(a, b)
+
+    def _indices(self, vehicule):
+        try:
+            if np.ndim(vehicule):
+                return np.array([self._indice_vehicule[v] for v in np.asarray(vehicule).tolist()])
+            return self._indice_vehicule[vehicule]
+        except KeyError as exc:
+            raise KeyError(f"Véhicule inconnu : {exc.args[0]!r}") from None
+
+    def cout(self, debut, fin, vehicule=None):
+        """
+        Kilomètres, litres et coût du carburant entre `debut` et `fin` inclus.
+
+        :param debut: Date ou tableau de dates (les dates hors de l'axe sont
+                      ramenées à ses bornes ; une période vide coûte 0).
+        :param vehicule: Véhicule (ou tableau de véhicules, diffusé avec les
+                         dates) ; None pour toute la flotte.
+        :return: Dictionnaire {km, litres, cout_carburant} de flottants ou de tableaux.
+        """
+        a, b = self._bornes(debut, fin)
+        if vehicule is None:
+            resultat = {nom: prefixe[b] - prefixe[a] for nom, prefixe in self._flotte.items()}
+        else:
+            if self._vehicules is None:
+                raise ValueError("Index par véhicule non construit (par_vehicule=False)")
+            v = self._indices(vehicule)
+            km = self._vehicules["km"][v, b] - self._vehicules["km"][v, a]
+            resultat = {
+                "km": km,
+                "litres": km / 100 * self.conso_moyenne[v],
+                "cout_carburant": self._vehicules["cout_carburant"][v, b] - self._vehicules["cout_carburant"][v, a],
+            }
+        return {nom: valeurs.item() if np.ndim(valeurs) == 0 else valeurs for nom, valeurs in resultat.items()}
+
+    def cout_cumule(self, vehicule=None):
+        """
+        Dates de l'axe et coût du carburant cumulé à la fin de chaque jour.
+        """
+        if vehicule is None:
+            prefixe = self._flotte["cout_carburant"]
+        else:
+            if self._vehicules is None:
+                raise ValueError("Index par véhicule non construit (par_vehicule=False)")
+            prefixe = self._vehicules["cout_carburant"][self._indices(vehicule)]
+        return self.debut + np.arange(len(self.prix)) * JOUR, prefixe[..., 1:]
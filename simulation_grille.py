@@ -0,0 +1,207 @@
+"""
+Simulation régionale : écosystèmes disposés sur une grille 2-D dont certaines
+catastrophes (incendies, tempêtes) se propagent aux cellules voisines.
+
+Chaque cellule est un écosystème complet du MoteurEcosystemes (mêmes
+définitions CatastropheNaturelle, même récupération). La grille est découpée
+en bandes de lignes (tuiles), chacune simulée par son propre moteur avec son
+propre flux aléatoire : le résultat ne dépend pas du nombre de threads.
+
+La propagation est un stencil : le nombre de voisins actifs au cycle
+précédent est obtenu par sommes de tranches décalées d'un tableau booléen
+(avec une ligne de halo de part et d'autre de la tuile), puis chaque cellule
+candidate est touchée avec la probabilité 1 - (1 - p)^voisins.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from CatastropheNaturelle import CatastropheNaturelle, RegistreCatastrophes, registre_par_defaut
+from simulation_vectorisee import ECOSYSTEME_INITIAL, MoteurEcosystemes
+
+
+@dataclass
+class Propagation:
+    """
+    Règle de propagation d'une catastrophe vers les cellules voisines.
+    """
+    probabilite: float  # Probabilité de transmission par voisin actif
+    voisinage: int = 8  # 4 (von Neumann) ou 8 (Moore)
+    combustible: Optional[str] = None  # Élément dont la valeur (sur 100) module la probabilité
+    refractaire: int = 0  # Cycles pendant lesquels une cellule touchée est épargnée (0 : durée de récupération max)
+
+
+PROPAGATIONS_PAR_DEFAUT = {
+    "Incendie de Forêt": Propagation(0.3, voisinage=8, combustible="végétation"),
+    "Tempête": Propagation(0.5, voisinage=4),
+}
+
+
+class GrilleEcosystemes:
+    """
+    Grille hauteur × largeur d'écosystèmes avec propagation des catastrophes.
+    """
+
+    def __init__(self, hauteur, largeur, ecosysteme_initial=None, catastrophes=None,
+                 propagations=None, echelle_frequences=1.0, graine=None,
+                 taille_tuile=256, processus=1):
+        """
+        - catastrophes : RegistreCatastrophes ou liste de CatastropheNaturelle.
+        - propagations : {nom de catastrophe : Propagation} (par défaut
+          PROPAGATIONS_PAR_DEFAUT, pour les catastrophes présentes).
+        - echelle_frequences : Multiplie les fréquences de déclenchement
+          spontané (une cellule de grille est souvent plus petite qu'un écosystème).
+        - taille_tuile : Nombre de lignes de grille par tuile.
+        - processus : Nombre de threads simulant les tuiles en parallèle.
+          Seules les boucles NumPy internes libèrent le GIL, et les tuiles
+          sont limitées par la bande passante mémoire : le gain mesuré reste
+          marginal (~6 % avec 4 threads). Le résultat est le même quel que
+          soit ce nombre.
+        """
+        ecosysteme_initial = ecosysteme_initial or ECOSYSTEME_INITIAL
+        if catastrophes is None:
+            registre = registre_par_defaut()
+        elif isinstance(catastrophes, RegistreCatastrophes):
+            registre = catastrophes
+        else:
+            registre = RegistreCatastrophes(catastrophes)
+        if echelle_frequences != 1.0:
+            registre = RegistreCatastrophes([
+                CatastropheNaturelle(c.nom, c.impact_environnemental,
+                                     min(c.frequence * echelle_frequences, 1.0), c.duree_recuperation)
+                for c in registre.catastrophes
+            ])
+        self.registre = registre
+        self.hauteur, self.largeur = hauteur, largeur
+        self.elements = tuple(ecosysteme_initial)
+        self.processus = processus
+        self.cycle = 0
+
+        if propagations is None:
+            propagations = {nom: regle for nom, regle in PROPAGATIONS_PAR_DEFAUT.items() if nom in registre}
+        inconnues = [nom for nom in propagations if nom not in registre]
+        if inconnues:
+            raise ValueError(f"Catastrophes inconnues du registre : {', '.join(inconnues)}")
+
+        # Règles précompilées : indice de catastrophe, table de probabilité par nombre de voisins
+        self.propagees = []
+        for nom, regle in propagations.items():
+            if regle.voisinage not in (4, 8):
+                raise ValueError(f"Voisinage invalide pour {nom!r} : {regle.voisinage} (attendu : 4 ou 8)")
+            catastrophe = registre[nom]
+            refractaire = regle.refractaire or max(catastrophe.duree_recuperation.values(), default=1)
+            colonne = self.elements.index(regle.combustible) if regle.combustible in self.elements else None
+            table = 1 - (1 - regle.probabilite) ** np.arange(9)
+            self.propagees.append((registre.catastrophes.index(catastrophe), regle, table,
+                                   max(int(refractaire), 2), colonne))
+        self._rangs = {indice: rang for rang, (indice, *_) in enumerate(self.propagees)}
+
+        n_propagees = len(self.propagees)
+        self.actifs = np.zeros((n_propagees, hauteur, largeur), dtype=bool)
+        self._actifs_suivants = np.zeros_like(self.actifs)
+        self.refractaires = np.zeros((n_propagees, hauteur, largeur), dtype=np.int16)
+
+        self.tuiles = [(debut, min(debut + taille_tuile, hauteur)) for debut in range(0, hauteur, taille_tuile)]
+        graines = np.random.SeedSequence(graine).spawn(len(self.tuiles))
+        self.moteurs = [MoteurEcosystemes((fin - debut) * largeur, ecosysteme_initial, registre, graine=g)
+                        for (debut, fin), g in zip(self.tuiles, graines)]
+
+    def _voisins_actifs(self, rang, debut, fin, voisinage):
+        """
+        Nombre de voisins actifs (cycle précédent) de chaque cellule de la tuile,
+        ou None si aucune cellule n'est active dans la tuile et son halo.
+        """
+        haut, bas = max(debut - 1, 0), min(fin + 1, self.hauteur)
+        source = self.actifs[rang, haut:bas]
+        if not source.any():
+            return None
+        cadre = np.zeros((fin - debut + 2, self.largeur + 2), dtype=np.uint8)
+        cadre[haut - debut + 1:bas - debut + 1, 1:-1] = source
+        voisins = cadre[:-2, 1:-1] + cadre[2:, 1:-1] + cadre[1:-1, :-2] + cadre[1:-1, 2:]
+        if voisinage == 8:
+            voisins += cadre[:-2, :-2] + cadre[:-2, 2:] + cadre[2:, :-2] + cadre[2:, 2:]
+        return voisins
+
+    def _propager(self, rang, moteur, debut, fin, touches, refractaires):
+        """
+        Lignes (indices de cellules de la tuile) atteintes par propagation.
+        """
+        _, regle, table, _, colonne = self.propagees[rang]
+        voisins = self._voisins_actifs(rang, debut, fin, regle.voisinage)
+        if voisins is None:
+            return np.zeros(0, dtype=np.intp)
+        voisins = voisins.reshape(-1)
+        candidats = np.flatnonzero(voisins)
+        candidats = candidats[(refractaires[candidats] == 0) & ~touches[candidats]]
+        probabilites = table[voisins[candidats]]
+        if colonne is not None:
+            probabilites *= np.clip(moteur.etat[candidats, colonne] / 100, 0.0, 1.0)
+        return candidats[moteur.rng.random(len(candidats)) < probabilites]
+
+    def _etape_tuile(self, numero):
+        debut, fin = self.tuiles[numero]
+        moteur = self.moteurs[numero]
+        moteur.cycle += 1
+        forme = (len(self.propagees), (fin - debut) * self.largeur)  # Vues à plat sur la tuile
+        refractaires = self.refractaires[:, debut:fin].reshape(forme)
+        np.subtract(refractaires, 1, out=refractaires, where=refractaires > 0)
+        touches = self._actifs_suivants[:, debut:fin].reshape(forme)
+        touches[...] = False
+
+        # Déclenchements spontanés (un tirage par cellule)
+        for indice, lignes in moteur.declencher():
+            rang = self._rangs.get(indice)
+            if rang is not None:
+                touches[rang, lignes] = True
+                refractaires[rang, lignes] = self.propagees[rang][3]
+
+        # Propagation depuis les cellules actives au cycle précédent
+        for rang, (indice, *_) in enumerate(self.propagees):
+            lignes = self._propager(rang, moteur, debut, fin, touches[rang], refractaires[rang])
+            if len(lignes):
+                moteur.appliquer_catastrophe(indice, lignes)
+                touches[rang, lignes] = True
+                refractaires[rang, lignes] = self.propagees[rang][3]
+
+        moteur.recuperer()
+
+    def etape(self, executeur=None):
+        """
+        Simule un cycle pour toute la grille.
+        """
+        self.cycle += 1
+        appliquer = executeur.map if executeur is not None else map
+        list(appliquer(self._etape_tuile, range(len(self.tuiles))))
+        self.actifs, self._actifs_suivants = self._actifs_suivants, self.actifs
+
+    def simuler(self, cycles):
+        """
+        Simule `cycles` cycles, les tuiles étant réparties sur `processus`
+        threads si demandé (voir __init__ : pas d'accélération multi-cœur notable).
+        """
+        if self.processus > 1 and len(self.tuiles) > 1:
+            with ThreadPoolExecutor(max_workers=self.processus) as executeur:
+                for _ in range(cycles):
+                    self.etape(executeur)
+        else:
+            for _ in range(cycles):
+                self.etape()
+        return self
+
+    def carte(self, element):
+        """
+        Valeurs de `element` sur toute la grille (tableau hauteur × largeur).
+        """
+        colonne = self.elements.index(element)
+        return np.concatenate([moteur.etat[:, colonne].reshape(fin - debut, self.largeur)
+                               for moteur, (debut, fin) in zip(self.moteurs, self.tuiles)])
+
+    def moyennes(self):
+        """
+        Moyenne de chaque élément sur la grille.
+        """
+        sommes = sum(moteur.etat.sum(axis=0) for moteur in self.moteurs)
+        return dict(zip(self.elements, (sommes / (self.hauteur * self.largeur)).tolist()))
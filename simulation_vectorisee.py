@@ -0,0 +1,156 @@
+import numpy as np
+
+from CatastropheNaturelle import RegistreCatastrophes, registre_par_defaut
+
+ECOSYSTEME_INITIAL = {"végétation": 100, "faune": 100, "population": 100, "température": 20, "infrastructures": 100}
+
+_arrondi_python = np.frompyfunc(round, 2, 1)
+
+
+def catastrophes_par_defaut():
+    """
+    Catastrophes de la simulation d'origine, dans l'ordre où elles sont testées.
+    """
+    return registre_par_defaut().catastrophes
+
+
+class MoteurEcosystemes:
+    """
+    Simule N écosystèmes à la fois, stockés dans un tableau 2-D (une ligne par
+    écosystème, une colonne par élément).
+
+    À chaque cycle, un seul tirage uniforme par écosystème suffit : la table
+    cumulative du RegistreCatastrophes donne les catastrophes déclenchées, puis
+    leurs coefficients `impact_environnemental` sont appliqués aux seules
+    lignes concernées.
+
+    En mode `reference`, l'écosystème i reproduit exactement la simulation
+    scalaire (declencher_evenements_aleatoires + recuperation_ecosysteme)
+    lancée après random.seed(graine + i) : même générateur (Mersenne Twister),
+    même tirage par cycle et même arrondi que round().
+    """
+
+    def __init__(self, n_ecosystemes, ecosysteme_initial=None, catastrophes=None,
+                 graine=None, reference=False):
+        """
+        - n_ecosystemes : Nombre d'écosystèmes simulés ensemble.
+        - ecosysteme_initial : Dictionnaire {élément : valeur} commun à tous.
+        - catastrophes : RegistreCatastrophes ou liste de CatastropheNaturelle
+          (par défaut, les quatre d'origine).
+        - graine : Graine du générateur aléatoire (entière en mode référence).
+        - reference : Reproduit bit à bit le chemin scalaire (plus lent).
+        """
+        ecosysteme_initial = ecosysteme_initial or ECOSYSTEME_INITIAL
+        if catastrophes is None:
+            self.registre = registre_par_defaut()
+        elif isinstance(catastrophes, RegistreCatastrophes):
+            self.registre = catastrophes
+        else:
+            self.registre = RegistreCatastrophes(catastrophes)
+        self.catastrophes = self.registre.catastrophes
+        self.elements = tuple(ecosysteme_initial)
+        self.n_ecosystemes = n_ecosystemes
+        self.reference = reference
+        self.cycle = 0
+
+        self.etat = np.tile(np.array([float(v) for v in ecosysteme_initial.values()]),
+                            (n_ecosystemes, 1))
+        self.compteurs = np.zeros((n_ecosystemes, len(self.elements)), dtype=np.int32)
+
+        # Tables précompilées : colonnes touchées et coefficients de chaque catastrophe
+        self.impacts, self.recuperations = self.registre.tables(self.elements)
+
+        if reference:
+            if graine is None:
+                raise ValueError("Le mode référence nécessite une graine entière.")
+            # RandomState([g]) initialise Mersenne Twister comme random.seed(g)
+            self._generateurs = [np.random.RandomState([graine + i]) for i in range(n_ecosystemes)]
+        else:
+            self.rng = np.random.default_rng(graine)
+            self._tirages = np.empty(n_ecosystemes)
+
+    def _tirer_declenchements(self):
+        """
+        Déclenchements du cycle, par vagues de couples (lignes, indices de
+        catastrophe) ; dans une vague, chaque ligne apparaît au plus une fois.
+        """
+        if self.reference:
+            # Même calcul scalaire que declencher_evenements_aleatoires
+            par_ligne = [self.registre.tirer(g.random_sample()) for g in self._generateurs]
+            vague = 0
+            while True:
+                couples = [(ligne, indices[vague]) for ligne, indices in enumerate(par_ligne)
+                           if len(indices) > vague]
+                if not couples:
+                    return
+                lignes, indices = zip(*couples)
+                yield np.array(lignes, dtype=np.intp), np.array(indices, dtype=np.intp)
+                vague += 1
+        self.rng.random(out=self._tirages)  # Un seul tirage par écosystème
+        yield from self.registre.tirer_lot(self._tirages)
+
+    def _arrondir(self, valeurs):
+        if self.reference:
+            return _arrondi_python(valeurs, 2).astype(np.float64)
+        return np.round(valeurs, 2)
+
+    def appliquer_catastrophe(self, indice, lignes):
+        """
+        Applique la catastrophe `indice` aux écosystèmes `lignes` et planifie leur récupération.
+        """
+        colonnes, coefficients = self.impacts[indice]
+        if len(colonnes):
+            bloc = np.ix_(lignes, colonnes)
+            self.etat[bloc] = np.maximum(0, self._arrondir(self.etat[bloc] * coefficients))
+
+        colonnes, durees = self.recuperations[indice]
+        if len(colonnes):
+            self.compteurs[np.ix_(lignes, colonnes)] = durees
+
+    def recuperer(self):
+        """
+        Décrémente les compteurs de récupération ; les éléments arrivés à zéro se rétablissent.
+        """
+        actifs = self.compteurs > 0
+        self.compteurs[actifs] -= 1
+        retablis = actifs & (self.compteurs == 0)
+        self.etat[retablis] = np.minimum(self.etat[retablis] * 1.5, 100)
+
+    def declencher(self):
+        """
+        Tire et applique les catastrophes du cycle ; retourne la liste des
+        couples (indice de catastrophe, lignes touchées).
+        """
+        declenchees = []
+        for lignes, indices in self._tirer_declenchements():
+            # Regroupe les lignes de la vague par catastrophe
+            ordre = np.argsort(indices, kind="stable")
+            lignes, indices = lignes[ordre], indices[ordre]
+            debuts = np.flatnonzero(np.r_[True, indices[1:] != indices[:-1]])
+            for debut, fin in zip(debuts.tolist(), np.r_[debuts[1:], len(indices)].tolist()):
+                indice = int(indices[debut])
+                self.appliquer_catastrophe(indice, lignes[debut:fin])
+                declenchees.append((indice, lignes[debut:fin]))
+        return declenchees
+
+    def etape(self):
+        """
+        Simule un cycle pour tous les écosystèmes.
+        """
+        self.cycle += 1
+        self.declencher()
+        self.recuperer()
+
+    def simuler(self, cycles):
+        """
+        Simule `cycles` cycles et retourne l'état final (tableau écosystèmes × éléments).
+        """
+        for _ in range(cycles):
+            self.etape()
+        return self.etat
+
+    def ecosysteme(self, i):
+        """
+        État de l'écosystème i sous forme de dictionnaire, comme dans la simulation scalaire.
+        """
+        return dict(zip(self.elements, self.etat[i].tolist()))
@@ -0,0 +1,233 @@
+"""
+Conversion en flux d'un document Word (.docx) en audio par synthèse vocale.
+
+word_to_audio (word_en_audio._offre_githubpy.py) construisait tout le texte
+du document par concaténations successives, puis le synthétisait en un seul
+appel bloquant. Ici :
+- les paragraphes sont parcourus un par un dans l'arbre XML du document ;
+- ils sont regroupés en segments d'au plus `taille_segment` caractères,
+  coupés en fin de phrase (ou, pour une phrase trop longue, entre deux mots),
+  les paragraphes restant séparés par un saut de ligne comme auparavant ;
+- chaque segment est synthétisé dans son propre fichier audio temporaire,
+  par lots de `par_lot` segments par appel runAndWait ;
+- les segments sont enfin concaténés trame par trame dans le fichier final,
+  puis supprimés.
+
+Seuls un lot de segments et un bloc de trames sont en mémoire à la fois,
+quelle que soit la taille du document. Le format audio est celui du pilote
+pyttsx3, quel que soit le nom du fichier (comme auparavant, un nom en .mp3
+contient donc du WAV) : WAV (sapi5, espeak) ou AIFF (nsss, sous macOS),
+reconnu à l'en-tête de chaque segment. Un document sans texte donne un
+fichier audio vide (aucune trame).
+
+Nécessite pyttsx3 et python-docx : pip install pyttsx3 python-docx
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import time
+import warnings
+import wave
+
+TAILLE_SEGMENT = 2_000  # Caractères par segment synthétisé
+PAR_LOT = 8  # Segments mis en file par appel runAndWait
+TRAMES_PAR_BLOC = 65_536  # Trames copiées à la fois lors de la concaténation
+PARAMETRES_VIDE = (1, 2, 22_050)  # Canaux, octets par échantillon, fréquence d'un fichier sans segment
+
+_FIN_PHRASE = re.compile(r"(?<=[.!?…;:])\s+")
+
+
+def creer_moteur():
+    """
+    Moteur pyttsx3 (import différé : le découpage reste utilisable sans lui).
+    """
+    try:
+        import pyttsx3
+    except ImportError as exc:
+        raise ImportError("La synthèse vocale nécessite pyttsx3 : pip install pyttsx3") from exc
+    return pyttsx3.init()
+
+
+def paragraphes(chemin_docx):
+    """
+    Génère le texte des paragraphes du corps du document, dans l'ordre.
+    """
+    try:
+        from docx import Document
+        from docx.oxml.ns import qn
+        from docx.text.paragraph import Paragraph
+    except ImportError as exc:
+        raise ImportError("La lecture des .docx nécessite python-docx : pip install python-docx") from exc
+    corps = Document(chemin_docx).element.body
+    for element in corps.iterchildren(qn("w:p")):
+        yield Paragraph(element, None).text
+
+
+def _couper(phrase, taille_max):
+    """
+    Coupe une phrase trop longue entre deux mots (ou au milieu d'un mot sans espace).
+    """
+    while len(phrase) > taille_max:
+        coupure = phrase.rfind(" ", 0, taille_max + 1)
+        if coupure <= 0:
+            coupure = taille_max
+        yield phrase[:coupure]
+        phrase = phrase[coupure:].lstrip()
+    if phrase:
+        yield phrase
+
+
+def decouper(textes, taille_segment=TAILLE_SEGMENT):
+    """
+    Regroupe des paragraphes en segments d'au plus `taille_segment` caractères,
+    coupés en fin de phrase ; les paragraphes d'un même segment sont séparés
+    par un saut de ligne, les paragraphes vides sont ignorés.
+    """
+    morceaux, longueur = [], 0
+    for texte in textes:
+        separateur = "\n"
+        for phrase in _FIN_PHRASE.split(texte.strip()):
+            for morceau in _couper(phrase, taille_segment):
+                if morceaux and longueur + 1 + len(morceau) > taille_segment:
+                    yield "".join(morceaux)
+                    morceaux, longueur = [], 0
+                if morceaux:
+                    morceaux.append(separateur)
+                    longueur += 1
+                morceaux.append(morceau)
+                longueur += len(morceau)
+                separateur = " "
+    if morceaux:
+        yield "".join(morceaux)
+
+
+def synthetiser(segments, dossier, moteur=None, par_lot=PAR_LOT):
+    """
+    Synthétise chaque segment dans son fichier WAV de `dossier`.
+
+    :return: Générateur de (chemin du segment, nombre de caractères), dans
+             l'ordre, au fur et à mesure que les lots sont terminés.
+    """
+    moteur = creer_moteur() if moteur is None else moteur
+    lot = []
+    for numero, texte in enumerate(segments):
+        chemin = os.path.join(dossier, f"segment_{numero:06d}.wav")
+        moteur.save_to_file(texte, chemin)
+        lot.append((chemin, len(texte)))
+        if len(lot) >= par_lot:
+            moteur.runAndWait()
+            yield from lot
+            lot = []
+    if lot:
+        moteur.runAndWait()
+        yield from lot
+
+
+def _aifc():
+    """
+    Module aifc (retiré de la bibliothèque standard en Python 3.13).
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import aifc
+    except ImportError as exc:
+        raise ImportError("Les fichiers AIFF (pilote nsss de macOS) nécessitent le module aifc : "
+                          "pip install standard-aifc") from exc
+    return aifc
+
+
+def _module_audio(chemin):
+    """
+    Module (wave ou aifc) capable de lire `chemin`, d'après son en-tête.
+    """
+    with open(chemin, "rb") as fichier:
+        en_tete = fichier.read(12)
+    if en_tete[:4] == b"RIFF" and en_tete[8:] == b"WAVE":
+        return wave
+    if en_tete[:4] == b"FORM" and en_tete[8:] in (b"AIFF", b"AIFC"):
+        return _aifc()
+    raise ValueError(f"Format audio non reconnu (ni WAV ni AIFF) : {chemin}")
+
+
+def _ouvrir_sortie(module, sortie, parametres):
+    ecrivain = module.open(sortie, "wb")
+    if module is not wave and parametres.comptype != b"NONE":
+        ecrivain.aifc()  # AIFF compressé (ex. 'sowt') : en-tête AIFF-C quel que soit le nom
+    ecrivain.setparams(parametres)
+    return ecrivain
+
+
+def concatener_wav(chemins, sortie, supprimer=False):
+    """
+    Concatène des fichiers audio de même format (WAV ou AIFF) dans `sortie`,
+    bloc par bloc ; `sortie` est dans le format des segments. Sans aucun
+    segment, `sortie` est un fichier vide (AIFF si son nom se termine par
+    .aif/.aiff, WAV sinon).
+    :param supprimer: Supprimer chaque fichier une fois copié.
+    :return: Durée totale en secondes.
+    """
+    ecrivain, module, parametres, trames = None, None, None, 0
+    try:
+        for chemin in chemins:
+            module_segment = _module_audio(chemin)
+            with module_segment.open(chemin, "rb") as segment:
+                if ecrivain is None:
+                    module, parametres = module_segment, segment.getparams()
+                    ecrivain = _ouvrir_sortie(module, sortie, parametres)
+                elif (module_segment is not module or segment.getparams()[:3] != parametres[:3]
+                      or segment.getparams().comptype != parametres.comptype):
+                    raise ValueError(f"Format audio différent du premier segment : {chemin}")
+                while True:
+                    bloc = segment.readframes(TRAMES_PAR_BLOC)
+                    if not bloc:
+                        break
+                    ecrivain.writeframesraw(bloc)
+                    trames += len(bloc) // (parametres.nchannels * parametres.sampwidth)
+            if supprimer:
+                os.remove(chemin)
+    finally:
+        if ecrivain is not None:
+            ecrivain.close()  # Met à jour la taille dans l'en-tête
+    if ecrivain is None:  # Document sans texte
+        module = _aifc() if sortie.lower().endswith((".aif", ".aiff")) else wave
+        with module.open(sortie, "wb") as vide:
+            vide.setnchannels(PARAMETRES_VIDE[0])
+            vide.setsampwidth(PARAMETRES_VIDE[1])
+            vide.setframerate(PARAMETRES_VIDE[2])
+        return 0.0
+    return trames / parametres.framerate
+
+
+def convertir_document(chemin_docx, sortie, taille_segment=TAILLE_SEGMENT, moteur=None, par_lot=PAR_LOT,
+                       progression=None, dossier_temp=None):
+    """
+    Convertit un document Word en un fichier audio, en flux.
+
+    :param moteur: Moteur pyttsx3 déjà initialisé (sinon créé ici).
+    :param progression: Fonction appelée après chaque segment avec
+                        (segments terminés, caractères synthétisés).
+    :param dossier_temp: Dossier des segments temporaires (défaut : celui de `sortie`).
+    :return: Dictionnaire {segments, caracteres, duree_audio_s, duree_s}.
+    """
+    debut = time.perf_counter()
+    stats = {"segments": 0, "caracteres": 0}
+    dossier = tempfile.mkdtemp(prefix="segments_", dir=dossier_temp or os.path.dirname(os.path.abspath(sortie)))
+
+    def termines():
+        for chemin, caracteres in synthetiser(decouper(paragraphes(chemin_docx), taille_segment),
+                                              dossier, moteur, par_lot):
+            stats["segments"] += 1
+            stats["caracteres"] += caracteres
+            if progression is not None:
+                progression(stats["segments"], stats["caracteres"])
+            yield chemin
+
+    try:
+        stats["duree_audio_s"] = concatener_wav(termines(), sortie, supprimer=True)
+    finally:
+        shutil.rmtree(dossier, ignore_errors=True)
+    stats["duree_s"] = time.perf_counter() - debut
+    return stats
@@ -0,0 +1,19 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+
+@pytest.fixture(scope="session")
+def suivi():
+    """
+    Module 2SGTqdUISh.py (son nom n'est pas un identifiant Python valide).
+    """
+    spec = importlib.util.spec_from_file_location("suivi_voyages", os.path.join(RACINE, "2SGTqdUISh.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
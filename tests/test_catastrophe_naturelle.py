@@ -0,0 +1,28 @@
+import pytest
+
+from CatastropheNaturelle import CUMULER, PROLONGER, REMPLACER, PlanificateurRecuperation
+
+
+def _echeances(planificateur, cycles):
+    """Éléments rétablis par cycle sur les `cycles` prochains cycles."""
+    return {planificateur.cycle: echus for _ in range(cycles) if (echus := planificateur.avancer())}
+
+
+@pytest.mark.parametrize("politique, attendu", [
+    (REMPLACER, {3: ["faune"]}),
+    (PROLONGER, {5: ["faune"]}),
+    (CUMULER, {3: ["faune"], 5: ["faune"]}),
+])
+def test_politiques_de_chevauchement(politique, attendu):
+    planificateur = PlanificateurRecuperation(politique)
+    planificateur.planifier("faune", 5)
+    planificateur.avancer()
+    planificateur.planifier("faune", 2)
+    assert "faune" in planificateur and planificateur.restant("faune") == (4 if politique == PROLONGER else 2)
+    assert _echeances(planificateur, 6) == attendu
+    assert len(planificateur) == 0 and planificateur.restant("faune") is None
+
+
+def test_politique_inconnue():
+    with pytest.raises(ValueError):
+        PlanificateurRecuperation("ignorer")
@@ -0,0 +1,51 @@
+import numpy as np
+import pyarrow.parquet as pq
+
+from CatastropheNaturelle import EruptionVolcanique
+from journal_evenements import (DECLENCHEMENT, IMPACT, PLANIFICATION, JournalConsole, JournalMemoire,
+                                JournalParquet)
+
+
+def _ecosysteme():
+    return {"végétation": 100, "faune": 100, "population": 100, "température": 20}
+
+
+def test_journal_memoire_en_colonnes():
+    journal = JournalMemoire()
+    journal.debut_cycle(3)
+    EruptionVolcanique().declencher(_ecosysteme(), journal)
+    colonnes = journal.colonnes()
+    assert colonnes["type"].tolist() == [DECLENCHEMENT] + [IMPACT] * 4 + [PLANIFICATION] * 2
+    assert np.all(colonnes["cycle"] == 3)
+    assert journal.noms[colonnes["element"][1]] == "végétation"
+    assert (colonnes["avant"][1], colonnes["apres"][1]) == (100.0, 20.0)
+    assert next(journal.evenements())["catastrophe"] == "Éruption Volcanique"
+
+
+def test_emission_apres_lecture_des_colonnes():
+    journal = JournalMemoire()
+    journal.emettre(DECLENCHEMENT, "Séisme")
+    colonnes = journal.colonnes()
+    for _ in range(1000):  # Force la réallocation des array sous-jacents
+        journal.emettre(IMPACT, "Séisme", "faune", 100.0, 50.0)
+    assert len(colonnes["type"]) == 1 and len(journal) == 1001
+
+
+def test_journal_console_affichage_d_origine(capsys):
+    EruptionVolcanique().declencher(_ecosysteme(), JournalConsole())
+    sortie = capsys.readouterr().out
+    assert "⚠️ Catastrophe en cours : Éruption Volcanique ⚠️" in sortie
+    assert "🔻 Végétation réduit à 20.0" in sortie
+
+
+def test_journal_parquet_par_blocs(tmp_path):
+    chemin = str(tmp_path / "journal.parquet")
+    journal = JournalParquet(chemin, taille_bloc=5)
+    for cycle in range(4):
+        journal.debut_cycle(cycle)
+        EruptionVolcanique().declencher(_ecosysteme(), journal)
+    journal.fermer()
+    table = pq.read_table(chemin)
+    assert table.num_rows == 28
+    assert table.column("type").to_pylist()[:2] == ["declenchement", "impact"]
+    assert table.column("cycle").to_pylist()[-1] == 3
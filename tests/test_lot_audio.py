@@ -0,0 +1,103 @@
+import os
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import lot_audio
+
+docx = pytest.importorskip("docx")
+
+
+class FauxMoteur:
+    """
+    Moteur pyttsx3 de test : un échantillon nul par caractère, le processus
+    meurt sur un texte contenant PLANTE.
+    """
+
+    def __init__(self):
+        self.file = []
+
+    def save_to_file(self, texte, chemin):
+        self.file.append((texte, chemin))
+
+    def runAndWait(self):
+        file, self.file = self.file, []
+        for texte, chemin in file:
+            if "PLANTE" in texte:
+                os._exit(1)
+            with wave.open(chemin, "wb") as sortie:
+                sortie.setnchannels(1)
+                sortie.setsampwidth(2)
+                sortie.setframerate(22050)
+                sortie.writeframes(b"\0\0" * len(texte))
+
+
+def fabrique():
+    return FauxMoteur()
+
+
+def _document(chemin, *textes):
+    document = docx.Document()
+    for texte in textes:
+        document.add_paragraph(texte)
+    document.save(chemin)
+
+
+@pytest.fixture
+def bibliotheque(tmp_path):
+    dossier = tmp_path / "bibliotheque"
+    dossier.mkdir()
+    for i in range(6):
+        _document(dossier / f"doc{i}.docx", f"Document {i}. Première phrase.", "Second paragraphe.")
+    _document(dossier / "vide.docx")
+    _document(dossier / "plante.docx", "Ce document PLANTE le moteur.")
+    (dossier / "casse.docx").write_bytes(b"pas un docx")
+    return dossier
+
+
+def _convertir(bibliotheque, tmp_path, **options):
+    return lot_audio.convertir_bibliotheque(str(bibliotheque), str(tmp_path / "audio"), processus=2,
+                                            fabrique_moteur=fabrique, **options)
+
+
+def _echecs(rapport):
+    return sorted(os.path.basename(echec["document"]) for echec in rapport["echecs"])
+
+
+@pytest.mark.parametrize("taille_decoupe", [lot_audio.TAILLE_DECOUPE, 0])
+def test_bibliotheque_avec_processus_qui_meurt(bibliotheque, tmp_path, taille_decoupe):
+    rapport = _convertir(bibliotheque, tmp_path, taille_decoupe=taille_decoupe, segments_par_partie=1)
+    assert rapport["documents"] == 9 and rapport["reussis"] == 7
+    assert _echecs(rapport) == ["casse.docx", "plante.docx"]
+    with wave.open(str(tmp_path / "audio" / "vide.wav")) as fichier:
+        assert fichier.getnframes() == 0
+    assert sorted(os.listdir(tmp_path / "audio")) == sorted(f"doc{i}.wav" for i in range(6)) + ["vide.wav"]
+
+
+def test_pool_casse_a_la_soumission(bibliotheque, tmp_path, monkeypatch):
+    soumissions = []
+
+    class PoolFragile(ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            soumissions.append(None)
+            if len(soumissions) in (2, 5, 6, 9):
+                raise BrokenProcessPool("simulé")
+            return super().submit(*args, **kwargs)
+
+    monkeypatch.setattr(lot_audio, "ProcessPoolExecutor", PoolFragile)
+    rapport = _convertir(bibliotheque, tmp_path, en_vol=3)
+    assert rapport["documents"] == 9 and rapport["reussis"] == 7
+    assert _echecs(rapport) == ["casse.docx", "plante.docx"]
+
+
+def test_pool_inutilisable(bibliotheque, tmp_path, monkeypatch):
+    class PoolMort(ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("simulé")
+
+    monkeypatch.setattr(lot_audio, "ProcessPoolExecutor", PoolMort)
+    rapport = _convertir(bibliotheque, tmp_path, tentatives=2)
+    assert rapport["documents"] == 9 and rapport["reussis"] == 0
+    assert rapport["resoumissions"] == 9  # Une par document, puis abandon
@@ -0,0 +1,54 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+import Calculateur_Porsche_992
+import calculer_consommation_essence
+import lot_couts
+from modele_couts import consommation_essence, entretien_seuil
+
+def _traiter(lignes, taille_bloc=lot_couts.TAILLE_BLOC, calculateur=calculer_consommation_essence):
+    sortie = io.StringIO()
+    compte = lot_couts.traiter_lot(lignes, sortie, calculateur.calculer_lot, calculateur.DEFAUTS_LOT, taille_bloc)
+    return compte, [json.loads(ligne, parse_constant=pytest.fail) for ligne in sortie.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("taille_bloc", [2, lot_couts.TAILLE_BLOC])
+def test_lot_jsonl(taille_bloc):
+    lignes = ['{"km_annuel": 12000, "vehicule": "é"}', "pas du json", "", '{"km_annuel": 1e400}',
+              '{"km_annuel": 5, "cout_total": 3}', '{"km_annuel": "x"}', "[1]", '{"km_annuel": 30000}']
+    (calcules, erreurs), sorties = _traiter(lignes, taille_bloc)
+    assert (calcules, erreurs) == (3, 4)
+    # Une ligne de sortie par ligne non vide, dans l'ordre de l'entrée
+    assert [sortie.get("ligne") for sortie in sorties] == [None, 2, None, 5, 6, 7, None]
+    assert "champ réservé" in sorties[3]["erreur"]
+
+    premiere = sorties[0]
+    assert premiere["vehicule"] == "é"
+    litres, cout_carburant = consommation_essence(12000.0, 13.0, 1.8)
+    assert premiere["litres"] == litres and premiere["cout_carburant"] == cout_carburant
+    assert premiere["cout_entretien"] == entretien_seuil(12000.0)
+    assert sorties[2]["litres"] is None  # Résultat non fini : null
+    assert sorties[6]["cout_entretien"] == entretien_seuil(30000.0)
+
+
+@pytest.mark.parametrize("taille_bloc", [2, lot_couts.TAILLE_BLOC])
+def test_lot_diviseur_nul_isole(taille_bloc):
+    lignes = ['{"km_annuel": 10000}', '{"km_pneus": 0}', '{"km_annuel": 5000}', '{"km_pneus": 0, "km_annuel": 1}']
+    (calcules, erreurs), sorties = _traiter(lignes, taille_bloc, Calculateur_Porsche_992)
+    assert (calcules, erreurs) == (2, 2)
+    assert [sortie.get("ligne") for sortie in sorties] == [None, 2, None, 4]
+    assert "km_pneus" in sorties[1]["erreur"]
+    assert [sortie["km_annuel"] for sortie in sorties[::2]] == [10000, 5000]
+    assert sorties[2]["litres"] == consommation_essence(5000.0, 13.0, 1.8)[0]
+
+
+def test_ligne_de_commande_lot():
+    entree = '{"km_annuel":10000}\n{"km_pneus":0}\n{"km_annuel":5000}\n'
+    resultat = subprocess.run([sys.executable, Calculateur_Porsche_992.__file__, "--lot", "-"], input=entree,
+                              capture_output=True, text=True, encoding="utf-8", check=True)
+    sorties = [json.loads(ligne) for ligne in resultat.stdout.splitlines()]
+    assert [sortie.get("ligne") for sortie in sorties] == [None, 2, None]
@@ -0,0 +1,67 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from modele_couts import cout_par_km, entretien_division, entretien_proportionnel, entretien_seuil
+
+KILOMETRAGES = [-20000, -1, 0, 1, 14999, 15000, 30001, 1e9, 2.5, math.inf, -math.inf, math.nan]
+
+
+# Versions scalaires d'origine des calculateurs
+
+def _seuil_origine(km_annuel, cout_revision=3000, cout_pneus=1500, km_pneus=15000):
+    cout_entretien = cout_revision
+    if km_annuel >= km_pneus:
+        cout_entretien += cout_pneus * (km_annuel // km_pneus)
+    return cout_entretien
+
+
+def _proportionnel_origine(kilometres_parcourus, cout_annuel_eur, km_par_an):
+    if km_par_an <= 0:
+        return 0.0
+    return (kilometres_parcourus / km_par_an) * cout_annuel_eur
+
+
+def _identiques(a, b):
+    return a == b or (math.isnan(a) and math.isnan(b))
+
+
+def test_noyaux_scalaires_egaux_aux_calculateurs_d_origine():
+    for km in KILOMETRAGES:
+        assert _identiques(entretien_seuil(km), _seuil_origine(km))
+        for km_par_an in KILOMETRAGES:
+            assert _identiques(entretien_proportionnel(km, 800.0, km_par_an),
+                               _proportionnel_origine(km, 800.0, km_par_an) + 0.0)
+
+
+@pytest.mark.parametrize("noyau", [entretien_seuil, entretien_division])
+def test_noyaux_entretien_tableau_egal_scalaire(noyau):
+    with np.errstate(invalid="ignore"):
+        resultats = noyau(np.array(KILOMETRAGES))
+    for km, resultat in zip(KILOMETRAGES, resultats.tolist()):
+        assert _identiques(resultat, float(noyau(km)))
+
+
+def test_branches_ecartees_sans_nan():
+    kilometres, diviseurs = zip(*itertools.product(KILOMETRAGES, repeat=2))
+    kilometres, diviseurs = np.array(kilometres), np.array(diviseurs)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        proportionnel = entretien_proportionnel(kilometres, 800.0, diviseurs)
+        par_km = cout_par_km(kilometres, diviseurs)
+    for i, (km, diviseur) in enumerate(zip(kilometres.tolist(), diviseurs.tolist())):
+        assert _identiques(proportionnel[i], entretien_proportionnel(km, 800.0, diviseur))
+        assert _identiques(par_km[i], cout_par_km(km, diviseur))
+        if diviseur <= 0:
+            assert proportionnel[i] == 0.0
+        if not diviseur > 0:
+            assert par_km[i] == 0.0
+
+
+@pytest.mark.parametrize("km_pneus", [0, np.array([15000, 0])])
+def test_km_pneus_nul(km_pneus):
+    with pytest.raises(ZeroDivisionError):
+        entretien_seuil(np.array([20000, 30000]), km_pneus=km_pneus)
+    with pytest.raises(ZeroDivisionError):
+        entretien_division(20000, km_pneus=0)
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from monte_carlo import executer_monte_carlo
+
+
+def test_resultats_independants_du_nombre_de_processus():
+    seul = executer_monte_carlo(250, 30, graine=4, processus=1, taille_lot=100)
+    pool = executer_monte_carlo(250, 30, graine=4, processus=2, taille_lot=100)
+    assert seul.n_simulations == 250
+    np.testing.assert_array_equal(seul.moyenne, pool.moyenne)
+    np.testing.assert_array_equal(seul.probabilite_extinction, pool.probabilite_extinction)
+    for p in seul.percentiles:
+        np.testing.assert_array_equal(seul.percentiles[p], pool.percentiles[p])
+
+
+@pytest.mark.parametrize("n_simulations", [0, -3])
+def test_nombre_de_simulations_invalide(n_simulations):
+    with pytest.raises(ValueError):
+        executer_monte_carlo(n_simulations, 10, processus=1)
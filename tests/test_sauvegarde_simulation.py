@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from sauvegarde_simulation import DELTA, SauvegardeSimulation, simuler_avec_sauvegardes
+from simulation_vectorisee import MoteurEcosystemes
+
+
+@pytest.mark.parametrize("reference", [False, True])
+@pytest.mark.parametrize("intervalle", [1, 10])
+def test_reprise_exacte_au_bit_pres(tmp_path, reference, intervalle):
+    chemin = str(tmp_path / "simulation.bin")
+    attendu = MoteurEcosystemes(50, graine=11, reference=reference).simuler(120).copy()
+
+    simuler_avec_sauvegardes(MoteurEcosystemes(50, graine=11, reference=reference), 60, chemin, intervalle)
+    repris = simuler_avec_sauvegardes(MoteurEcosystemes(50, graine=11, reference=reference), 120, chemin,
+                                      intervalle)
+    assert np.array_equal(repris.view(np.uint64), attendu.view(np.uint64))
+
+    sauvegarde = SauvegardeSimulation(chemin)
+    assert any(enregistrement[1] == DELTA for enregistrement in sauvegarde.enregistrements)
+    # Reprise depuis un instantané intermédiaire, reconstruit à partir de deltas
+    cycle = sauvegarde.cycles[len(sauvegarde.cycles) // 2 + 1]
+    moteur = MoteurEcosystemes(50, graine=11, reference=reference)
+    assert sauvegarde.restaurer(moteur, cycle) == cycle
+    assert np.array_equal(moteur.simuler(120 - cycle), attendu)
+
+
+def test_enregistrement_tronque_ignore(tmp_path):
+    chemin = str(tmp_path / "simulation.bin")
+    simuler_avec_sauvegardes(MoteurEcosystemes(30, graine=5), 40, chemin, intervalle=10)
+    with open(chemin, "r+b") as fichier:
+        fichier.truncate(fichier.seek(0, 2) - 3)  # Arrêt brutal pendant l'écriture du dernier
+    assert SauvegardeSimulation(chemin).cycles == [10, 20, 30]
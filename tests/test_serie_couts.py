@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from serie_couts import SerieCouts
+
+
+def test_serie_couts_flotte_identique_sans_index_par_vehicule():
+    rng = np.random.default_rng(0)
+    dates_prix = np.datetime64("2024-01-01") + np.r_[0, np.sort(rng.integers(1, 365, 30))]
+    prix = rng.uniform(1.6, 2.0, len(dates_prix))
+    vehicules = rng.choice(["AB-123-CD", "EF-456-GH", "IJ-789-KL"], 2000)
+    dates = np.datetime64("2024-01-01") + rng.integers(0, 366, 2000)
+    km = rng.uniform(1, 300, 2000)
+    conso = {"AB-123-CD": 9.0, "EF-456-GH": 15.5}
+
+    complete = SerieCouts((dates_prix, prix), (vehicules, dates, km), conso)
+    flotte = SerieCouts((dates_prix, prix), (vehicules, dates, km), conso, par_vehicule=False)
+    assert flotte._vehicules is None
+
+    # Référence : chaque trajet au prix du dernier relevé de sa date
+    prix_trajet = prix[np.searchsorted(dates_prix, dates, side="right") - 1]
+    litres = km / 100 * np.array([conso.get(v, 13.0) for v in vehicules])
+    dans_periode = (dates >= np.datetime64("2024-03-01")) & (dates <= np.datetime64("2024-06-30"))
+    for serie in (complete, flotte):
+        resultat = serie.cout("2024-03-01", "2024-06-30")
+        assert resultat["km"] == pytest.approx(km[dans_periode].sum())
+        assert resultat["litres"] == pytest.approx(litres[dans_periode].sum())
+        assert resultat["cout_carburant"] == pytest.approx((litres * prix_trajet)[dans_periode].sum())
+    total_vehicules = sum(complete.cout("2024-01-01", "2024-12-31", vehicule=v)["cout_carburant"]
+                          for v in complete.vehicules.tolist())
+    assert total_vehicules == pytest.approx(flotte.cout("2024-01-01", "2024-12-31")["cout_carburant"])
+    with pytest.raises(ValueError):
+        flotte.cout("2024-01-01", "2024-12-31", vehicule="AB-123-CD")
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from simulation_grille import GrilleEcosystemes, Propagation
+
+
+def test_resultat_independant_du_nombre_de_threads():
+    seul = GrilleEcosystemes(64, 48, graine=2, taille_tuile=16, echelle_frequences=5).simuler(30)
+    threads = GrilleEcosystemes(64, 48, graine=2, taille_tuile=16, echelle_frequences=5, processus=3).simuler(30)
+    np.testing.assert_array_equal(seul.carte("végétation"), threads.carte("végétation"))
+    assert seul.moyennes() == threads.moyennes()
+
+
+def test_propagation_aux_voisins():
+    grille = GrilleEcosystemes(40, 40, graine=0, taille_tuile=8, echelle_frequences=0.0,
+                               propagations={"Tempête": Propagation(1.0, voisinage=4)})
+    rang = 0  # Seule règle de propagation
+    grille.actifs[rang, 20, 20] = True
+    grille.etape()
+    assert sorted(zip(*np.nonzero(grille.actifs[rang]))) == [(19, 20), (20, 19), (20, 21), (21, 20)]
+
+
+def test_regles_invalides():
+    with pytest.raises(ValueError):
+        GrilleEcosystemes(8, 8, propagations={"Inconnue": Propagation(0.5)})
+    with pytest.raises(ValueError):
+        GrilleEcosystemes(8, 8, propagations={"Tempête": Propagation(0.5, voisinage=6)})
@@ -0,0 +1,31 @@
+import random
+
+import numpy as np
+import pytest
+
+from CatastropheNaturelle import Ecosysteme, declencher_evenements_aleatoires, recuperation_ecosysteme
+from simulation_vectorisee import ECOSYSTEME_INITIAL, MoteurEcosystemes
+
+
+def _simulation_scalaire(graine, cycles, ecosysteme):
+    random.seed(graine)
+    for _ in range(cycles):
+        declencher_evenements_aleatoires(ecosysteme)
+        recuperation_ecosysteme(ecosysteme)
+    return [ecosysteme[element] for element in ECOSYSTEME_INITIAL]
+
+
+@pytest.mark.parametrize("type_ecosysteme", [dict, Ecosysteme])
+def test_mode_reference_egal_simulation_scalaire(type_ecosysteme):
+    moteur = MoteurEcosystemes(20, graine=7, reference=True)
+    etat = moteur.simuler(200)
+    for i in range(20):
+        attendu = _simulation_scalaire(7 + i, 200, type_ecosysteme(ECOSYSTEME_INITIAL))
+        assert etat[i].tolist() == attendu
+
+
+def test_mode_rapide_reproductible():
+    premier = MoteurEcosystemes(500, graine=3).simuler(100)
+    second = MoteurEcosystemes(500, graine=3).simuler(100)
+    assert np.array_equal(premier, second)
+    assert np.all((premier >= 0) & np.isfinite(premier))
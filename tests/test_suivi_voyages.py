@@ -0,0 +1,105 @@
+import math
+import random
+
+import numpy as np
+import pytest
+from geopy.distance import geodesic
+
+
+def test_index_des_noms_suit_les_renommages(suivi):
+    store = suivi.LocationStore()
+    for i in range(3000):
+        store.append(f"N{i % 300}", 0.0, 0.0)
+    rng = random.Random(1)
+    for _ in range(3000):
+        store.rename(rng.randrange(len(store)), f"n{rng.randrange(400)}")
+    attendu = {}
+    for i in range(len(store)):
+        attendu.setdefault(store.names.get(i).casefold(), i)
+    assert len(store.name_index) == len(attendu)
+    assert all(store.name_index.get(nom) == indice for nom, indice in attendu.items())
+    assert store.name_index.get("absent") is None
+
+
+def test_rattachement_optionnel(suivi):
+    tracker = suivi.TravelTracker()
+    lieu = suivi.Location("Paris", 48.85, 2.35)
+    tracker.add_location(lieu)
+    tracker.mark_visited("paris")
+    assert not lieu.visited and tracker.locations[0].visited  # Objet non retenu
+    assert not tracker.store._attached
+
+    tracker = suivi.TravelTracker(attach_locations=True)
+    lieu = suivi.Location("Paris", 48.85, 2.35)
+    tracker.add_location(lieu)
+    tracker.mark_visited("Paris")
+    assert lieu.visited and lieu.color == 'green'
+    tracker.visited_locations.append(lieu)  # Retrouvé par identité, pas de doublon
+    assert len(tracker.locations) == 1 and len(tracker.visited_locations) == 1
+
+
+def test_couleur_restauree_apres_retrait(suivi):
+    tracker = suivi.TravelTracker()
+    tracker.add_location(suivi.Location("A", 48.85, 2.35, color='red'))
+    tracker.add_location(suivi.Location("B", 45.76, 4.83), visited=True)
+    tracker.mark_visited("a")
+    assert tracker.locations[0].color == 'green'
+    tracker.remove_visit(1)
+    assert [lieu.color for lieu in tracker.locations] == ['red', 'green']
+
+
+def test_pointage_insensible_a_la_casse_et_sans_doublon(suivi):
+    tracker = suivi.TravelTracker()
+    tracker.add_location(suivi.Location("Lyon", 45.76, 4.83))
+    tracker.add_location(suivi.Location("lyon", 45.0, 4.0))
+    tracker.mark_visited("LYON")
+    tracker.mark_visited("Lyon")
+    tracker.mark_visited("Inconnu")
+    assert [lieu.latitude for lieu in tracker.visited_locations] == [45.76]  # Premier lieu du nom
+
+
+def test_pointage_apres_renommage(suivi):
+    tracker = suivi.TravelTracker()
+    tracker.add_location(suivi.Location("Lyon", 45.76, 4.83))
+    tracker.add_location(suivi.Location("Lyon", 45.0, 4.0))
+    tracker.locations[0].name = "Nice"
+    tracker.mark_visited("nice")
+    tracker.mark_visited("lyon")  # Désigne maintenant le second lieu
+    assert [lieu.latitude for lieu in tracker.visited_locations] == [45.76, 45.0]
+
+
+def _distance_attendue(tracker):
+    coordonnees = tracker.visited_locations.coordinates()
+    return math.fsum(geodesic(a, b).kilometers for a, b in zip(coordonnees[:-1], coordonnees[1:]))
+
+
+@pytest.fixture
+def parcours(suivi):
+    rng = np.random.default_rng(2)
+    tracker = suivi.TravelTracker()
+    for i in range(40):
+        tracker.add_location(suivi.Location(f"lieu {i}", rng.uniform(-80, 80), rng.uniform(-180, 180)),
+                             visited=i % 4 != 3)
+    return tracker
+
+
+def test_distance_incrementale_apres_insertions_et_retraits(parcours):
+    attendue = _distance_attendue(parcours)
+    assert parcours.calculate_total_distance() == pytest.approx(round(attendue, 2), abs=0.011)
+    assert parcours.calculate_total_distance("geodesic") == round(attendue, 2)
+
+    parcours.insert_visit(1, "lieu 3")
+    parcours.remove_visit(5)
+    parcours.mark_visited("LIEU 7")
+    attendue = _distance_attendue(parcours)
+    assert parcours.calculate_total_distance() == pytest.approx(round(attendue, 2), abs=0.011)
+    assert parcours.leg_distances().sum() == pytest.approx(attendue, abs=1e-6)
+
+
+def test_distance_apres_deplacement_d_un_lieu_visite(parcours):
+    parcours.calculate_total_distance()  # Étapes déjà calculées avant le déplacement
+    lieu = parcours.visited_locations[4]
+    lieu.latitude, lieu.longitude = -33.87, 151.21
+    attendue = _distance_attendue(parcours)
+    assert parcours.calculate_total_distance() == pytest.approx(round(attendue, 2), abs=0.011)
+    assert parcours.leg_distances().sum() == pytest.approx(attendue, abs=1e-6)
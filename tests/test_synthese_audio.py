@@ -0,0 +1,35 @@
+import wave
+
+import pytest
+
+from synthese_audio import concatener_wav, decouper
+
+
+def test_decouper_garde_les_sauts_de_paragraphe():
+    assert list(decouper(["Un. Deux.", "", "Trois", "Quatre cinq six."], 20)) == \
+        ["Un. Deux.\nTrois", "Quatre cinq six."]
+    assert list(decouper([" ", ""])) == []
+
+
+def test_concatener_sans_segment_ecrit_un_fichier_vide(tmp_path):
+    sortie = str(tmp_path / "vide.wav")
+    assert concatener_wav([], sortie) == 0.0
+    with wave.open(sortie) as fichier:
+        assert fichier.getnframes() == 0
+
+
+def test_concatener_aiff(tmp_path):
+    aifc = pytest.importorskip("aifc")
+    segments = []
+    for i in range(3):
+        chemin = str(tmp_path / f"segment{i}.aiff")
+        with aifc.open(chemin, "wb") as segment:
+            segment.setnchannels(1)
+            segment.setsampwidth(2)
+            segment.setframerate(22050)
+            segment.writeframes(bytes(range(256)) * (i + 1))
+        segments.append(chemin)
+    sortie = str(tmp_path / "sortie.aiff")
+    concatener_wav(segments, sortie)
+    with aifc.open(sortie, "rb") as fichier:
+        assert fichier.readframes(10 ** 6) == bytes(range(256)) * 6
@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+import pytest
+from geopy.distance import geodesic
+
+from travel_distance import distance_totale, distances_etapes, haversine_km, vincenty_km
+
+
+def _points(n, graine=0):
+    rng = np.random.default_rng(graine)
+    return np.column_stack([rng.uniform(-80, 80, n), rng.uniform(-180, 180, n)])
+
+
+def test_vincenty_egale_geodesic():
+    points = _points(300)
+    distances = vincenty_km(points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1])
+    attendues = [geodesic(a, b).kilometers for a, b in zip(points[:-1], points[1:])]
+    np.testing.assert_allclose(distances, attendues, rtol=0, atol=1e-6)  # Au millimètre
+
+
+def test_vincenty_points_quasi_antipodaux():
+    distance = vincenty_km(0.0, 0.0, 0.5, 179.7)
+    assert distance == pytest.approx(geodesic((0.0, 0.0), (0.5, 179.7)).kilometers, abs=1e-6)
+
+
+def test_haversine_proche_de_geodesic():
+    points = _points(300, graine=1)
+    distances = haversine_km(points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1])
+    attendues = [geodesic(a, b).kilometers for a, b in zip(points[:-1], points[1:])]
+    np.testing.assert_allclose(distances, attendues, rtol=0.006)
+
+
+def test_distances_etapes_scalaire_et_vectorise_identiques():
+    points = _points(8)  # Chemin scalaire (SEUIL_SCALAIRE)
+    courtes = distances_etapes(points)
+    longues = distances_etapes(np.vstack([points, points]))[:7]
+    np.testing.assert_allclose(courtes, longues, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(distances_etapes(points, "haversine"),
+                               haversine_km(points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1]))
+    with pytest.raises(ValueError):
+        distances_etapes(points, "euclide")
+
+
+def test_distance_totale_parcours_courts():
+    assert distance_totale(np.zeros((0, 2))) == 0.0
+    assert distance_totale([(48.85, 2.35)]) == 0.0
+
+
+def test_methodes_du_suivi(suivi):
+    tracker = suivi.TravelTracker()
+    points = _points(20, graine=2)
+    for i, (latitude, longitude) in enumerate(points):
+        tracker.add_location(suivi.Location(f"lieu {i}", latitude, longitude), visited=True)
+    attendue = math.fsum(geodesic(a, b).kilometers for a, b in zip(points[:-1], points[1:]))
+    assert tracker.calculate_total_distance("geodesic") == round(attendue, 2)
+    assert tracker.calculate_total_distance("vincenty") == pytest.approx(round(attendue, 2), abs=0.011)
+    assert tracker.calculate_total_distance("haversine") == pytest.approx(attendue, rel=0.006)
@@ -0,0 +1,25 @@
+import os
+
+
+def _tracker(suivi, n):
+    tracker = suivi.TravelTracker()
+    for i in range(n):
+        tracker.add_location(suivi.Location(f"lieu {i}", 45.0 + i * 1e-3, 4.0), visited=i % 2 == 0)
+    return tracker
+
+
+def test_export_donnees_externes_au_dela_du_seuil(suivi, tmp_path, monkeypatch):
+    monkeypatch.setattr(suivi, "EXTERNAL_DATA_THRESHOLD", 50)
+    resultats = suivi.export_maps({"petit": _tracker(suivi, 10), "grand": _tracker(suivi, 200)},
+                                  str(tmp_path), processes=1)
+    assert [r.points for r in resultats] == [10, 200]
+    assert not os.path.exists(tmp_path / "petit_points.json")
+    assert os.path.exists(tmp_path / "grand_points.json")
+    assert "grand_points.json" in (tmp_path / "grand.html").read_text(encoding="utf-8")
+
+
+def test_export_html_autonome_force(suivi, tmp_path, monkeypatch):
+    monkeypatch.setattr(suivi, "EXTERNAL_DATA_THRESHOLD", 50)
+    suivi.export_maps([_tracker(suivi, 200)], str(tmp_path), processes=1, external_data=False)
+    assert os.listdir(tmp_path) == ["trip_00000.html"]
+    assert "lieu 199" in (tmp_path / "trip_00000.html").read_text(encoding="utf-8")
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from travel_distance import haversine_km
+from travel_spatial import SpatialIndex
+
+
+@pytest.fixture
+def lieux(suivi):
+    rng = np.random.default_rng(1)
+    store = suivi.LocationStore()
+    latitudes, longitudes = rng.uniform(-80, 80, 5000), rng.uniform(-180, 180, 5000)
+    store.extend([f"lieu {i}" for i in range(len(latitudes))], latitudes, longitudes)
+    return store
+
+
+def _dans_rayon(store, latitude, longitude, rayon):
+    distances = haversine_km(latitude, longitude, store.latitudes, store.longitudes)
+    return set(np.flatnonzero(distances <= rayon).tolist())
+
+
+def test_index_spatial_rayon_et_plus_proches(lieux):
+    index = SpatialIndex(lieux)
+    for latitude, longitude, rayon in [(45.0, 5.0, 800.0), (-60.0, 179.9, 1500.0), (88.0, 0.0, 500.0)]:
+        indices, distances = index.within_radius(latitude, longitude, rayon)
+        assert set(indices.tolist()) == _dans_rayon(lieux, latitude, longitude, rayon)
+        assert np.all(np.diff(distances) >= 0)
+
+        proches, _ = index.nearest(latitude, longitude, k=5)
+        toutes = haversine_km(latitude, longitude, lieux.latitudes, lieux.longitudes)
+        np.testing.assert_allclose(np.sort(toutes)[:5], toutes[proches])
+
+
+def test_index_spatial_suit_ajouts_et_deplacements(lieux):
+    index = SpatialIndex(lieux)
+    index.within_radius(0.0, 0.0, 10.0)  # Construit l'index
+    lieux.extend(["ajout"], [10.0], [10.0])
+    lieux.set_coordinates(0, -33.0, 151.0)  # Déplacé loin de sa cellule d'origine
+    assert len(lieux) - 1 in index.within_radius(10.0, 10.0, 1.0)[0].tolist()
+    assert 0 in index.within_radius(-33.0, 151.0, 1.0)[0].tolist()
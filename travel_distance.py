@@ -0,0 +1,189 @@
+"""
+Moteur de distances vectorisé pour le suivi de voyages.
+
+Calcule en une seule passe NumPy les distances de toutes les étapes d'un
+parcours (tableau de coordonnées (lat, lon) en degrés), au lieu d'appeler
+geopy une fois par paire de points.
+
+Deux méthodes sont disponibles :
+- "haversine" : sphère de rayon moyen, très rapide (erreur max ~0,5 %).
+- "vincenty"  : formule inverse de Vincenty sur l'ellipsoïde WGS-84,
+  précise au millimètre près comme geopy.distance.geodesic.
+"""
+
+import math
+
+import numpy as np
+from geopy.distance import geodesic
+
+RAYON_TERRE_KM = 6371.0088  # Rayon moyen de la Terre (IUGG)
+
+# Ellipsoïde WGS-84
+WGS84_A = 6378.137  # Demi-grand axe (km)
+WGS84_F = 1 / 298.257223563  # Aplatissement
+WGS84_B = WGS84_A * (1 - WGS84_F)  # Demi-petit axe (km)
+
+METHODES = ("haversine", "vincenty")
+SEUIL_SCALAIRE = 8  # En dessous, la boucle Python évite le coût fixe des appels NumPy
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Distance orthodromique (km) entre deux séries de points, sur une sphère."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lon2) - np.asarray(lon1))
+
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * RAYON_TERRE_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def vincenty_km(lat1, lon1, lat2, lon2, tolerance: float = 1e-12,
+                max_iterations: int = 200) -> np.ndarray:
+    """
+    Distance ellipsoïdale (km) entre deux séries de points (formule inverse de Vincenty).
+
+    Toutes les paires sont itérées ensemble ; seules celles qui n'ont pas encore
+    convergé sont recalculées. Les rares paires quasi antipodales pour lesquelles
+    Vincenty ne converge pas sont calculées avec geopy.distance.geodesic.
+    """
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (lat1, lon1, lat2, lon2))
+    )
+    forme = lat1.shape
+    lat1, lon1, lat2, lon2 = (x.ravel() for x in (lat1, lon1, lat2, lon2))
+
+    L = np.radians(lon2 - lon1)
+    U1 = np.arctan((1 - WGS84_F) * np.tan(np.radians(lat1)))
+    U2 = np.arctan((1 - WGS84_F) * np.tan(np.radians(lat2)))
+    sinU1, cosU1 = np.sin(U1), np.cos(U1)
+    sinU2, cosU2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    sin_sigma = np.zeros_like(L)
+    cos_sigma = np.ones_like(L)
+    sigma = np.zeros_like(L)
+    cos2_alpha = np.ones_like(L)
+    cos_2sigma_m = np.zeros_like(L)
+
+    actifs = np.ones(L.shape, dtype=bool)
+    for _ in range(max_iterations):
+        if not actifs.any():
+            break
+        idx = np.flatnonzero(actifs)
+        lam_i = lam[idx]
+        sin_lam, cos_lam = np.sin(lam_i), np.cos(lam_i)
+
+        s_sigma = np.sqrt((cosU2[idx] * sin_lam) ** 2 +
+                          (cosU1[idx] * sinU2[idx] - sinU1[idx] * cosU2[idx] * cos_lam) ** 2)
+        c_sigma = sinU1[idx] * sinU2[idx] + cosU1[idx] * cosU2[idx] * cos_lam
+        sig = np.arctan2(s_sigma, c_sigma)
+
+        # Points confondus : distance nulle, on évite la division par zéro
+        confondus = s_sigma == 0
+        s_sigma_sur = np.where(confondus, 1.0, s_sigma)
+        sin_alpha = cosU1[idx] * cosU2[idx] * sin_lam / s_sigma_sur
+        c2_alpha = 1 - sin_alpha ** 2
+        # Lignes équatoriales : cos²α = 0, cos(2σm) est alors nul par convention
+        c2_alpha_sur = np.where(c2_alpha == 0, 1.0, c2_alpha)
+        c_2sigma_m = np.where(c2_alpha == 0, 0.0,
+                              c_sigma - 2 * sinU1[idx] * sinU2[idx] / c2_alpha_sur)
+
+        C = WGS84_F / 16 * c2_alpha * (4 + WGS84_F * (4 - 3 * c2_alpha))
+        nouveau_lam = L[idx] + (1 - C) * WGS84_F * sin_alpha * (
+            sig + C * s_sigma * (c_2sigma_m + C * c_sigma * (-1 + 2 * c_2sigma_m ** 2))
+        )
+
+        lam[idx] = nouveau_lam
+        sin_sigma[idx] = s_sigma
+        cos_sigma[idx] = c_sigma
+        sigma[idx] = sig
+        cos2_alpha[idx] = c2_alpha
+        cos_2sigma_m[idx] = c_2sigma_m
+
+        converge = (np.abs(nouveau_lam - lam_i) <= tolerance) | confondus
+        actifs[idx[converge]] = False
+
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+        B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+    ))
+    distances = WGS84_B * A * (sigma - delta_sigma)
+
+    # Repli sur geopy pour les paires (quasi antipodales) non convergées
+    for i in np.flatnonzero(actifs):
+        distances[i] = geodesic((lat1[i], lon1[i]), (lat2[i], lon2[i])).kilometers
+
+    return distances.reshape(forme)
+
+
+def _vincenty_scalaire(lat1: float, lon1: float, lat2: float, lon2: float,
+                       tolerance: float = 1e-12, max_iterations: int = 200) -> float:
+    """Même calcul que vincenty_km pour une seule paire, en arithmétique Python."""
+    L = math.radians(lon2 - lon1)
+    U1 = math.atan((1 - WGS84_F) * math.tan(math.radians(lat1)))
+    U2 = math.atan((1 - WGS84_F) * math.tan(math.radians(lat2)))
+    sinU1, cosU1 = math.sin(U1), math.cos(U1)
+    sinU2, cosU2 = math.sin(U2), math.cos(U2)
+
+    lam = L
+    for _ in range(max_iterations):
+        sin_lam, cos_lam = math.sin(lam), math.cos(lam)
+        sin_sigma = math.hypot(cosU2 * sin_lam, cosU1 * sinU2 - sinU1 * cosU2 * cos_lam)
+        if sin_sigma == 0:
+            return 0.0  # Points confondus
+        cos_sigma = sinU1 * sinU2 + cosU1 * cosU2 * cos_lam
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cosU1 * cosU2 * sin_lam / sin_sigma
+        cos2_alpha = 1 - sin_alpha ** 2
+        cos_2sigma_m = cos_sigma - 2 * sinU1 * sinU2 / cos2_alpha if cos2_alpha != 0 else 0.0
+        C = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+        lam_precedent = lam
+        lam = L + (1 - C) * WGS84_F * sin_alpha * (
+            sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))
+        )
+        if abs(lam - lam_precedent) <= tolerance:
+            break
+    else:
+        return geodesic((lat1, lon1), (lat2, lon2)).kilometers
+
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+        B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+    ))
+    return WGS84_B * A * (sigma - delta_sigma)
+
+
+def distances_etapes(coordonnees, methode: str = "vincenty") -> np.ndarray:
+    """
+    Distances (km) de chaque étape d'un parcours.
+
+    :param coordonnees: tableau (N, 2) de points (latitude, longitude) en degrés.
+    :param methode: "haversine" ou "vincenty".
+    :return: tableau de N-1 distances.
+    """
+    points = np.asarray(coordonnees, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 2:
+        return np.zeros(0)
+
+    lat, lon = points[:, 0], points[:, 1]
+    if methode == "vincenty" and len(points) <= SEUIL_SCALAIRE:
+        lat, lon = lat.tolist(), lon.tolist()
+        return np.array([_vincenty_scalaire(lat[i], lon[i], lat[i + 1], lon[i + 1])
+                         for i in range(len(lat) - 1)])
+    if methode == "haversine":
+        return haversine_km(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    if methode == "vincenty":
+        return vincenty_km(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    raise ValueError(f"Méthode de calcul inconnue : {methode!r} (attendu : {', '.join(METHODES)})")
+
+
+def distance_totale(coordonnees, methode: str = "vincenty") -> float:
+    """Distance totale (km) d'un parcours, somme de toutes ses étapes."""
+    return float(distances_etapes(coordonnees, methode).sum())
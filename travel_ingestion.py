@@ -0,0 +1,291 @@
+"""
+Chargement en flux de journaux de voyage (CSV, GPX, Parquet).
+
+Les fichiers sont lus par blocs de taille fixe : chaque bloc est ajouté au
+TravelTracker (et éventuellement à une TravelMap) puis libéré, et la distance
+parcourue est cumulée au fil de l'eau. La mémoire du chargeur reste bornée
+par la taille d'un bloc, quelle que soit la taille du fichier.
+"""
+
+import csv
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from travel_distance import distances_etapes
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Noms de colonnes reconnus automatiquement (CSV et Parquet)
+LATITUDE_COLUMNS = ('latitude', 'lat')
+LONGITUDE_COLUMNS = ('longitude', 'lon', 'lng', 'long')
+NAME_COLUMNS = ('name', 'nom')
+DESCRIPTION_COLUMNS = ('description', 'desc')
+
+
+@dataclass
+class PointChunk:
+    """Bloc de points lus depuis un fichier, stocké en colonnes."""
+    names: List[str]
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    descriptions: Optional[List[str]] = None
+    skipped: int = 0  # Lignes ignorées faute de coordonnées valides
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass
+class IngestionProgress:
+    """État d'avancement renvoyé après chaque bloc."""
+    points: int = 0
+    chunks: int = 0
+    distance_km: float = 0.0
+    skipped: int = 0  # Lignes sans latitude/longitude valide, ignorées
+
+
+def _find_column(columns, candidates, required: bool = True) -> Optional[str]:
+    lowered = {column.lower(): column for column in columns}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    if required:
+        raise ValueError(f"Colonne introuvable (attendu : {', '.join(candidates)})")
+    return None
+
+
+def _to_float(value) -> float:
+    """Coordonnée lue dans un fichier ; NaN si elle est absente ou illisible."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _make_chunk(names, latitudes, longitudes, descriptions, offset: int) -> PointChunk:
+    """Bloc de points ; les lignes sans coordonnées finies sont retirées et comptées."""
+    if names is None:
+        names = [f"Point {offset + i + 1}" for i in range(len(latitudes))]
+    latitudes = np.array([_to_float(x) for x in latitudes], dtype=np.float64)
+    longitudes = np.array([_to_float(x) for x in longitudes], dtype=np.float64)
+    valid = np.isfinite(latitudes) & np.isfinite(longitudes)
+    skipped = len(valid) - int(valid.sum())
+    if skipped:
+        kept = np.flatnonzero(valid).tolist()
+        names = [names[i] for i in kept]
+        descriptions = [descriptions[i] for i in kept] if descriptions is not None else None
+        latitudes, longitudes = latitudes[valid], longitudes[valid]
+    return PointChunk(names, latitudes, longitudes, descriptions, skipped)
+
+
+def iter_csv_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    delimiter: str = ',') -> Iterator[PointChunk]:
+    """Lit un CSV (avec en-tête) par blocs de `chunk_size` lignes."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader)
+        lat_i = header.index(_find_column(header, LATITUDE_COLUMNS))
+        lon_i = header.index(_find_column(header, LONGITUDE_COLUMNS))
+        name_column = _find_column(header, NAME_COLUMNS, required=False)
+        desc_column = _find_column(header, DESCRIPTION_COLUMNS, required=False)
+        name_i = header.index(name_column) if name_column else None
+        desc_i = header.index(desc_column) if desc_column else None
+
+        offset = 0
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield _chunk_from_rows(rows, lat_i, lon_i, name_i, desc_i, offset)
+                offset += len(rows)
+                rows = []
+        if rows:
+            yield _chunk_from_rows(rows, lat_i, lon_i, name_i, desc_i, offset)
+
+
+def _chunk_from_rows(rows, lat_i, lon_i, name_i, desc_i, offset: int) -> PointChunk:
+    latitudes = [row[lat_i] if lat_i < len(row) else None for row in rows]
+    longitudes = [row[lon_i] if lon_i < len(row) else None for row in rows]
+    names = [row[name_i] for row in rows] if name_i is not None else None
+    descriptions = [row[desc_i] for row in rows] if desc_i is not None else None
+    return _make_chunk(names, latitudes, longitudes, descriptions, offset)
+
+
+def iter_gpx_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[PointChunk]:
+    """
+    Lit les points d'un fichier GPX (wpt, rtept, trkpt) par blocs.
+
+    Le XML est parcouru avec iterparse et chaque point est retiré de l'arbre
+    une fois lu : le document complet n'est jamais construit en mémoire.
+    """
+    point_tags = ('wpt', 'rtept', 'trkpt')
+    names, latitudes, longitudes, descriptions = [], [], [], []
+    offset = 0
+
+    parents = []
+    for event, element in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+        parents.pop()
+        tag = element.tag.rsplit('}', 1)[-1]  # Ignore l'espace de noms GPX
+        if tag not in point_tags:
+            continue
+
+        name = description = time = None
+        for child in element:
+            child_tag = child.tag.rsplit('}', 1)[-1]
+            if child_tag == 'name':
+                name = child.text
+            elif child_tag == 'desc':
+                description = child.text
+            elif child_tag == 'time':
+                time = child.text
+        names.append(name or time or f"Point {offset + len(names) + 1}")
+        latitudes.append(element.get('lat'))
+        longitudes.append(element.get('lon'))
+        descriptions.append(description or "")
+        if parents:
+            parents[-1].remove(element)  # Libère le point une fois lu
+
+        if len(names) == chunk_size:
+            yield _make_chunk(names, latitudes, longitudes, descriptions, offset)
+            offset += len(names)
+            names, latitudes, longitudes, descriptions = [], [], [], []
+
+    if names:
+        yield _make_chunk(names, latitudes, longitudes, descriptions, offset)
+
+
+def iter_parquet_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[PointChunk]:
+    """Lit un fichier Parquet par lots de lignes (nécessite pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("La lecture Parquet nécessite pyarrow : pip install pyarrow") from exc
+
+    parquet_file = pq.ParquetFile(path)
+    columns = parquet_file.schema_arrow.names
+    lat_column = _find_column(columns, LATITUDE_COLUMNS)
+    lon_column = _find_column(columns, LONGITUDE_COLUMNS)
+    name_column = _find_column(columns, NAME_COLUMNS, required=False)
+    desc_column = _find_column(columns, DESCRIPTION_COLUMNS, required=False)
+    selected = [c for c in (lat_column, lon_column, name_column, desc_column) if c]
+
+    offset = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=selected):
+        data = batch.to_pydict()
+        names = ["" if n is None else str(n) for n in data[name_column]] if name_column else None
+        descriptions = [d or "" for d in data[desc_column]] if desc_column else None
+        yield _make_chunk(names, data[lat_column], data[lon_column], descriptions, offset)
+        offset += batch.num_rows
+
+
+READERS = {
+    '.csv': iter_csv_chunks,
+    '.gpx': iter_gpx_chunks,
+    '.parquet': iter_parquet_chunks,
+    '.pq': iter_parquet_chunks,
+}
+
+
+def iter_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[PointChunk]:
+    """Choisit le lecteur d'après l'extension du fichier."""
+    extension = os.path.splitext(path)[1].lower()
+    reader = READERS.get(extension)
+    if reader is None:
+        raise ValueError(f"Format non pris en charge : {extension!r} "
+                         f"(attendu : {', '.join(sorted(READERS))})")
+    return reader(path, chunk_size=chunk_size)
+
+
+def stream_trip(path: str, tracker=None, travel_map=None, visited: bool = True,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                method: str = 'vincenty') -> Iterator[IngestionProgress]:
+    """
+    Charge un journal de voyage bloc par bloc.
+
+    Chaque bloc est ajouté au tracker (TravelTracker.add_locations) et à la carte
+    (TravelMap.add_location, idéalement en mode high_volume), puis la distance
+    cumulée est mise à jour en reliant le bloc au dernier point du précédent.
+    Si les points sont ajoutés comme visités à un tracker qui en contient
+    déjà, la distance part de son total et du dernier lieu visité : elle
+    reste égale à tracker.calculate_total_distance(method). Les lignes sans
+    coordonnées valides sont ignorées et comptées dans `skipped`.
+
+    :return: générateur d'IngestionProgress, un par bloc traité.
+    """
+    progress = IngestionProgress()
+    last_point = None
+    if tracker is not None and visited:
+        coordinates = tracker.visited_locations.coordinates()
+        if len(coordinates):
+            last_point = coordinates[-1:]
+            if method == 'vincenty':
+                progress.distance_km = float(tracker.leg_distances().sum())
+            else:
+                progress.distance_km = float(distances_etapes(coordinates, method).sum())
+
+    for chunk in iter_chunks(path, chunk_size):
+        progress.skipped += chunk.skipped
+        if not len(chunk):
+            progress.chunks += 1
+            yield progress
+            continue
+        if tracker is not None:
+            tracker.add_locations(chunk.names, chunk.latitudes, chunk.longitudes,
+                                  chunk.descriptions, visited=visited)
+        if travel_map is not None:
+            _add_chunk_to_map(travel_map, chunk, visited)
+
+        points = np.column_stack((chunk.latitudes, chunk.longitudes))
+        if last_point is not None:
+            points = np.vstack((last_point, points))
+        progress.distance_km += float(distances_etapes(points, method).sum())
+        last_point = points[-1:]
+
+        progress.points += len(chunk)
+        progress.chunks += 1
+        yield progress
+
+
+def _add_chunk_to_map(travel_map, chunk: PointChunk, visited: bool) -> None:
+    color, icon = ('green', 'check') if visited else ('blue', 'info-sign')
+    markers = getattr(travel_map, 'markers', None)
+    for i, (latitude, longitude) in enumerate(zip(chunk.latitudes.tolist(),
+                                                  chunk.longitudes.tolist())):
+        description = chunk.descriptions[i] if chunk.descriptions is not None else ""
+        if markers is not None:
+            markers.add_point(latitude, longitude, chunk.names[i], description, color, icon)
+        else:
+            travel_map.add_location(_MapPoint(chunk.names[i], latitude, longitude,
+                                              description, visited, color))
+
+
+@dataclass
+class _MapPoint:
+    """Point minimal transmis à TravelMap.add_location (mêmes attributs que Location)."""
+    name: str
+    latitude: float
+    longitude: float
+    description: str
+    visited: bool
+    color: str
+
+    def get_coordinates(self):
+        return (self.latitude, self.longitude)
+
+
+def load_trip(path: str, tracker=None, travel_map=None, visited: bool = True,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, method: str = 'vincenty') -> IngestionProgress:
+    """Charge tout le fichier et retourne le bilan final (points, blocs, distance)."""
+    progress = IngestionProgress()
+    for progress in stream_trip(path, tracker, travel_map, visited, chunk_size, method):
+        pass
+    return progress
@@ -0,0 +1,178 @@
+"""
+Couches folium pour les cartes de voyage à fort volume.
+
+BulkMarkerLayer remplace les milliers de folium.Marker individuels par une
+seule couche : les points sont sérialisés en colonnes compactes, les icônes
+sont définies une fois et partagées, et les marqueurs sont construits dans le
+navigateur par Leaflet.markercluster (chargement progressif).
+
+ZoomPyramidPolyLine affiche un tracé précalculé à plusieurs niveaux de
+simplification et choisit la version adaptée au zoom courant.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from branca.element import MacroElement
+from folium.plugins import MarkerCluster
+from folium.template import Template
+
+COORDINATE_DECIMALS = 5  # ~1 m de précision, suffisant pour l'affichage
+EXTERNAL_DATA_THRESHOLD = 20_000  # Points au-delà desquels les données quittent le HTML (~35 o/point)
+
+
+class BulkMarkerLayer(MarkerCluster):
+    """
+    Couche de marqueurs groupés pour des centaines de milliers de lieux.
+
+    Les données peuvent être intégrées au HTML ou écrites dans un fichier JSON
+    annexe (`data_file`) chargé au démarrage : la taille du HTML reste alors
+    bornée quel que soit le nombre de points (la page doit être servie en HTTP,
+    les navigateurs bloquant fetch() sur file://).
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function(){
+                var icons = {{ this.icons|tojson }}.map(function (options) {
+                    return L.AwesomeMarkers.icon(options);
+                });
+                var cluster = L.markerClusterGroup({{ this.options|tojson }});
+                var points = null;
+
+                function popupContent(i) {
+                    var content = '<b>' + points.names[i] + '</b>';
+                    var description = points.descriptions[points.description_codes[i]];
+                    return description ? content + '<br>' + description : content;
+                }
+
+                function build(data) {
+                    points = data;
+                    var markers = new Array(data.lat.length);
+                    for (var i = 0; i < markers.length; i++) {
+                        markers[i] = L.marker([data.lat[i], data.lon[i]],
+                                              {icon: icons[data.icon_codes[i]], row: i});
+                    }
+                    cluster.addLayers(markers);
+                }
+
+                // Un seul popup et un seul tooltip partagés, créés à la demande
+                cluster.on('click', function (e) {
+                    L.popup().setLatLng(e.layer.getLatLng())
+                        .setContent(popupContent(e.layer.options.row))
+                        .openOn({{ this._parent.get_name() }});
+                });
+                cluster.on('mouseover', function (e) {
+                    e.layer.bindTooltip(points.names[e.layer.options.row]).openTooltip();
+                });
+
+                {%- if this.data_url %}
+                fetch({{ this.data_url|tojson }})
+                    .then(function (response) { return response.json(); })
+                    .then(build);
+                {%- else %}
+                build({{ this.data|tojson }});
+                {%- endif %}
+
+                cluster.addTo({{ this._parent.get_name() }});
+                return cluster;
+            })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, name: Optional[str] = None, options: Optional[dict] = None):
+        options = {'chunkedLoading': True, **(options or {})}
+        super().__init__(name=name, options=options)
+        self.options = options
+        self.icons: List[Dict[str, str]] = []
+        self._icon_codes: Dict[Tuple[str, str], int] = {}
+        self.descriptions: List[str] = []
+        self._description_codes: Dict[str, int] = {}
+        self.data = {'lat': [], 'lon': [], 'names': [], 'icon_codes': [],
+                     'description_codes': [], 'descriptions': self.descriptions}
+        self.data_url: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.data['lat'])
+
+    def _icon_code(self, color: str, icon: str) -> int:
+        key = (color, icon)
+        code = self._icon_codes.get(key)
+        if code is None:
+            code = len(self.icons)
+            self.icons.append({'markerColor': color, 'icon': icon, 'prefix': 'fa'})
+            self._icon_codes[key] = code
+        return code
+
+    def _description_code(self, description: str) -> int:
+        code = self._description_codes.get(description)
+        if code is None:
+            code = len(self.descriptions)
+            self.descriptions.append(description)
+            self._description_codes[description] = code
+        return code
+
+    def add_point(self, latitude: float, longitude: float, name: str,
+                  description: str = "", color: str = 'blue', icon: str = 'info-sign') -> None:
+        """Ajoute un point à la couche (sans créer d'objet folium)."""
+        self.data['lat'].append(round(float(latitude), COORDINATE_DECIMALS))
+        self.data['lon'].append(round(float(longitude), COORDINATE_DECIMALS))
+        self.data['names'].append(name)
+        self.data['icon_codes'].append(self._icon_code(color, icon))
+        self.data['description_codes'].append(self._description_code(description))
+
+    def write_data_file(self, path: str, url: Optional[str] = None) -> None:
+        """Écrit les points dans un fichier JSON annexe que la page chargera."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, separators=(',', ':'))
+        self.data_url = url if url is not None else os.path.basename(path)
+
+
+class ZoomPyramidPolyLine(MacroElement):
+    """
+    Tracé multi-résolution : une version simplifiée par niveau de zoom.
+
+    :param levels: {zoom minimal : points (N, 2)}, par exemple le résultat de
+                   travel_simplify.simplification_pyramid().
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function(){
+                var map = {{ this._parent.get_name() }};
+                var levels = {{ this.levels|tojson }};
+                var line = L.polyline([], {{ this.options|tojson }}).addTo(map);
+                {%- if this.tooltip %}
+                line.bindTooltip({{ this.tooltip|tojson }});
+                {%- endif %}
+
+                function update() {
+                    var zoom = map.getZoom();
+                    var points = levels[0][1];
+                    for (var i = 1; i < levels.length && levels[i][0] <= zoom; i++) {
+                        points = levels[i][1];
+                    }
+                    line.setLatLngs(points);
+                }
+                map.on('zoomend', update);
+                update();
+                return line;
+            })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, levels: Dict[int, np.ndarray], color: str = 'red', weight: float = 2.5,
+                 opacity: float = 1, tooltip: Optional[str] = None):
+        super().__init__()
+        self._name = 'ZoomPyramidPolyLine'
+        self.levels = [
+            [int(zoom), np.round(np.asarray(points, dtype=np.float64),
+                                 COORDINATE_DECIMALS).tolist()]
+            for zoom, points in sorted(levels.items())
+        ]
+        self.options = {'color': color, 'weight': weight, 'opacity': opacity}
+        self.tooltip = tooltip
@@ -0,0 +1,148 @@
+"""
+Simplification de tracés pour l'affichage (TravelMap.add_path).
+
+Les points (lat, lon) sont projetés localement en mètres (équirectangulaire
+autour de la latitude moyenne), puis simplifiés avec une tolérance en mètres :
+- Douglas–Peucker : garde les points qui s'écartent de plus de `tolerance_m`
+  du segment simplifié ;
+- Visvalingam–Whyatt : retire en priorité les points dont le triangle formé
+  avec leurs voisins a la plus petite aire (seuil : tolerance_m²).
+
+simplification_pyramid() précalcule une version par niveau de zoom, avec une
+tolérance égale à la taille d'un pixel à ce zoom.
+"""
+
+import heapq
+from typing import Dict, Iterable
+
+import numpy as np
+
+from travel_distance import RAYON_TERRE_KM
+
+RAYON_TERRE_M = RAYON_TERRE_KM * 1000
+METRES_PAR_PIXEL_ZOOM_0 = 156543.03392  # Web Mercator, à l'équateur
+
+METHODES = ("douglas-peucker", "visvalingam")
+
+
+def _project(points: np.ndarray) -> np.ndarray:
+    """Projection équirectangulaire locale (mètres) autour de la latitude moyenne."""
+    lat = np.radians(points[:, 0])
+    lon = np.radians(points[:, 1])
+    cos_lat0 = np.cos(lat.mean())
+    return np.column_stack((RAYON_TERRE_M * lon * cos_lat0, RAYON_TERRE_M * lat))
+
+
+def _segment_distances(xy: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Distances (m) des points `xy` au segment [start, end]."""
+    segment = end - start
+    length2 = float(segment @ segment)
+    if length2 == 0.0:
+        return np.hypot(*(xy - start).T)
+    t = np.clip(((xy - start) @ segment) / length2, 0.0, 1.0)
+    projection = start + t[:, None] * segment
+    return np.hypot(*(xy - projection).T)
+
+
+def douglas_peucker(points, tolerance_m: float) -> np.ndarray:
+    """Simplifie un tracé (N, 2) par Douglas–Peucker ; retourne les points conservés."""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 3 or tolerance_m <= 0:
+        return points.copy()
+
+    xy = _project(points)
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    # Pile explicite plutôt que récursion : pas de limite de profondeur
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = _segment_distances(xy[first + 1:last], xy[first], xy[last])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance_m:
+            middle = first + 1 + farthest
+            keep[middle] = True
+            stack.append((first, middle))
+            stack.append((middle, last))
+
+    return points[keep]
+
+
+def visvalingam(points, tolerance_m: float) -> np.ndarray:
+    """Simplifie un tracé (N, 2) par Visvalingam–Whyatt (aire minimale tolerance_m²)."""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n = len(points)
+    if n < 3 or tolerance_m <= 0:
+        return points.copy()
+
+    xy = _project(points)
+    x, y = xy[:, 0].tolist(), xy[:, 1].tolist()
+    previous = list(range(-1, n - 1))
+    following = list(range(1, n + 1))
+    removed = [False] * n
+    min_area = tolerance_m ** 2
+
+    def area(i: int) -> float:
+        a, c = previous[i], following[i]
+        return abs((x[a] - x[i]) * (y[c] - y[i]) - (x[c] - x[i]) * (y[a] - y[i])) / 2
+
+    # Aires initiales de tous les points intérieurs calculées en une passe NumPy
+    a, b, c = xy[:-2], xy[1:-1], xy[2:]
+    areas = np.abs((a[:, 0] - b[:, 0]) * (c[:, 1] - b[:, 1]) -
+                   (c[:, 0] - b[:, 0]) * (a[:, 1] - b[:, 1])) / 2
+    current = [0.0] + areas.tolist() + [0.0]
+    heap = [(current[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+
+    while heap:
+        surface, i = heapq.heappop(heap)
+        if removed[i] or surface != current[i]:
+            continue  # Entrée périmée : l'aire du point a été recalculée
+        if surface >= min_area:
+            break
+        removed[i] = True
+        a, c = previous[i], following[i]
+        following[a], previous[c] = c, a
+        for neighbour in (a, c):
+            if 0 < neighbour < n - 1:
+                # L'aire d'un voisin ne descend pas sous celle du point retiré
+                current[neighbour] = max(area(neighbour), surface)
+                heapq.heappush(heap, (current[neighbour], neighbour))
+
+    return points[~np.array(removed)]
+
+
+def simplify(points, tolerance_m: float, method: str = "douglas-peucker") -> np.ndarray:
+    """Simplifie un tracé avec la méthode choisie."""
+    if method == "douglas-peucker":
+        return douglas_peucker(points, tolerance_m)
+    if method == "visvalingam":
+        return visvalingam(points, tolerance_m)
+    raise ValueError(f"Méthode de simplification inconnue : {method!r} "
+                     f"(attendu : {', '.join(METHODES)})")
+
+
+def metres_per_pixel(zoom: int, latitude: float = 0.0) -> float:
+    """Taille au sol (m) d'un pixel de tuile Web Mercator au zoom donné."""
+    return METRES_PAR_PIXEL_ZOOM_0 * np.cos(np.radians(latitude)) / 2 ** zoom
+
+
+def simplification_pyramid(points, zoom_levels: Iterable[int] = range(4, 19, 2),
+                           pixel_tolerance: float = 1.0,
+                           method: str = "douglas-peucker") -> Dict[int, np.ndarray]:
+    """
+    Précalcule un tracé simplifié par niveau de zoom.
+
+    :param pixel_tolerance: écart maximal toléré, en pixels écran.
+    :return: {zoom minimal : points simplifiés}, chaque version étant utilisée
+             du zoom indiqué jusqu'au niveau suivant.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    latitude = float(points[:, 0].mean()) if len(points) else 0.0
+    return {
+        zoom: simplify(points, pixel_tolerance * metres_per_pixel(zoom, latitude), method)
+        for zoom in sorted(zoom_levels)
+    }
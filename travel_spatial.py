@@ -0,0 +1,219 @@
+"""
+Index spatial sur les lieux d'un LocationStore (grille régulière lat/lon).
+
+Chaque lieu est rangé dans une cellule de `cell_size_deg` degrés. Les indices
+sont triés par cellule (disposition CSR) : une ligne de cellules correspond à
+une seule plage contiguë du tableau trié, retrouvée par recherche dichotomique.
+Les candidats sont ensuite filtrés en une passe NumPy (haversine).
+
+L'index se met à jour de lui-même : les lieux ajoutés au stockage depuis la
+dernière construction sont traités par balayage direct, puis fusionnés dans
+l'index trié dès qu'ils deviennent nombreux. Un lieu déplacé
+(LocationStore.set_coordinates) provoque une reconstruction complète.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from travel_distance import RAYON_TERRE_KM, haversine_km
+
+KM_PAR_DEGRE = np.pi * RAYON_TERRE_KM / 180
+MAX_RINGS = 64  # Au-delà, la recherche des plus proches voisins balaie tout
+
+
+class SpatialIndex:
+    """Requêtes de rayon, plus proches voisins et boîte englobante sur un LocationStore."""
+
+    def __init__(self, store, cell_size_deg: float = 0.1):
+        self.store = store
+        self.cell_size_deg = cell_size_deg
+        self._rows = int(np.ceil(180 / cell_size_deg)) + 1
+        self._columns = int(np.ceil(360 / cell_size_deg))
+        self._sorted_keys = np.zeros(0, dtype=np.int64)
+        self._sorted_indices = np.zeros(0, dtype=np.int64)
+        self._built_count = 0
+        self._coordinates_version = store.coordinates_version
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    # --- Construction ----------------------------------------------------
+
+    def _cell_rows(self, latitudes) -> np.ndarray:
+        rows = np.floor((np.asarray(latitudes) + 90) / self.cell_size_deg).astype(np.int64)
+        return np.clip(rows, 0, self._rows - 1)
+
+    def _cell_columns(self, longitudes) -> np.ndarray:
+        columns = np.floor((np.asarray(longitudes) + 180) / self.cell_size_deg).astype(np.int64)
+        return columns % self._columns
+
+    def _sync(self) -> None:
+        """Fusionne les lieux récemment ajoutés si le balayage direct devient coûteux."""
+        pending = len(self.store) - self._built_count
+        if (pending > max(4096, self._built_count // 8) or
+                self._coordinates_version != self.store.coordinates_version):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Intègre dans l'index trié tous les lieux ajoutés depuis la dernière construction."""
+        if self._coordinates_version != self.store.coordinates_version:
+            # Des lieux ont été déplacés : leurs cellules ne sont plus valides
+            self._sorted_keys = np.zeros(0, dtype=np.int64)
+            self._sorted_indices = np.zeros(0, dtype=np.int64)
+            self._built_count = 0
+            self._coordinates_version = self.store.coordinates_version
+        start, end = self._built_count, len(self.store)
+        if start == end:
+            return
+        keys = (self._cell_rows(self.store.latitudes[start:end]) * self._columns +
+                self._cell_columns(self.store.longitudes[start:end]))
+        new_keys = np.concatenate((self._sorted_keys, keys))
+        new_indices = np.concatenate((self._sorted_indices, np.arange(start, end)))
+        # Tri stable : la partie déjà triée est reconnue comme une seule séquence
+        order = np.argsort(new_keys, kind='stable')
+        self._sorted_keys = new_keys[order]
+        self._sorted_indices = new_indices[order]
+        self._built_count = end
+
+    # --- Recherche -------------------------------------------------------
+
+    def _candidates(self, row_min: int, row_max: int,
+                    lon_min: float, lon_max: float) -> np.ndarray:
+        """Indices des lieux des cellules couvrant les lignes et longitudes données."""
+        self._sync()
+        row_min, row_max = max(row_min, 0), min(row_max, self._rows - 1)
+        if lon_max - lon_min >= 360 - self.cell_size_deg:
+            column_ranges = [(0, self._columns - 1)]
+        else:
+            first = int(self._cell_columns(lon_min))
+            last = int(self._cell_columns(lon_max))
+            if first <= last:
+                column_ranges = [(first, last)]
+            else:  # Traversée de l'antiméridien
+                column_ranges = [(first, self._columns - 1), (0, last)]
+
+        rows = np.arange(row_min, row_max + 1, dtype=np.int64) * self._columns
+        low = np.concatenate([rows + first for first, _ in column_ranges])
+        high = np.concatenate([rows + last for _, last in column_ranges])
+        starts = np.searchsorted(self._sorted_keys, low, side='left')
+        ends = np.searchsorted(self._sorted_keys, high, side='right')
+
+        parts = [self._sorted_indices[s:e] for s, e in zip(starts.tolist(), ends.tolist()) if e > s]
+        # Lieux pas encore intégrés à l'index trié
+        parts.append(np.arange(self._built_count, len(self.store)))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def _distances(self, indices: np.ndarray, latitude: float, longitude: float) -> np.ndarray:
+        return haversine_km(latitude, longitude,
+                            self.store.latitudes[indices], self.store.longitudes[indices])
+
+    def _filter(self, indices: np.ndarray, mask: Optional[np.ndarray],
+                unvisited_only: bool) -> np.ndarray:
+        if mask is not None:
+            indices = indices[mask[indices]]
+        if unvisited_only:
+            indices = indices[~self.store.visited_at(indices)]
+        return indices
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float,
+                      mask: Optional[np.ndarray] = None,
+                      unvisited_only: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lieux situés à moins de `radius_km` du point donné.
+
+        :param mask: masque booléen optionnel sur les lieux.
+        :param unvisited_only: ne retient que les lieux non visités.
+        :return: (indices, distances en km), triés par distance croissante.
+        """
+        dlat = radius_km / KM_PAR_DEGRE
+        lat_min, lat_max = latitude - dlat, latitude + dlat
+        if lat_min <= -90 or lat_max >= 90:
+            lon_min, lon_max = -180.0, 180.0  # Le cercle contient un pôle
+        else:
+            cos_lat = np.cos(np.radians(max(abs(lat_min), abs(lat_max))))
+            dlon = radius_km / (KM_PAR_DEGRE * cos_lat)
+            lon_min, lon_max = longitude - dlon, longitude + dlon
+
+        candidates = self._candidates(int(self._cell_rows(lat_min)), int(self._cell_rows(lat_max)),
+                                      lon_min, lon_max)
+        candidates = self._filter(candidates, mask, unvisited_only)
+        distances = self._distances(candidates, latitude, longitude)
+        inside = distances <= radius_km
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind='stable')
+        return candidates[order], distances[order]
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1,
+                mask: Optional[np.ndarray] = None,
+                unvisited_only: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Les `k` lieux les plus proches du point donné.
+
+        La recherche s'étend anneau de cellules par anneau de cellules jusqu'à ce
+        que les k meilleurs candidats soient plus proches que toute cellule non
+        visitée ; au-delà de MAX_RINGS anneaux, tous les lieux sont balayés.
+        """
+        row = int(self._cell_rows(latitude))
+        for ring in range(MAX_RINGS + 1):
+            lat_min = (row - ring) * self.cell_size_deg - 90
+            lat_max = (row + ring + 1) * self.cell_size_deg - 90
+            if lat_min <= -90 or lat_max >= 90:
+                break  # L'anneau atteint un pôle : balayage complet
+            half_width = (ring + 1) * self.cell_size_deg
+            candidates = self._candidates(row - ring, row + ring,
+                                          longitude - half_width, longitude + half_width)
+            candidates = self._filter(candidates, mask, unvisited_only)
+            if len(candidates) < k:
+                continue
+            distances = self._distances(candidates, latitude, longitude)
+            covered_km = self._covered_km(ring, half_width, max(abs(lat_min), abs(lat_max)))
+            best = np.argpartition(distances, k - 1)[:k]
+            if distances[best].max() <= covered_km:
+                order = best[np.argsort(distances[best], kind='stable')]
+                return candidates[order], distances[order]
+
+        candidates = self._filter(np.arange(len(self.store)), mask, unvisited_only)
+        distances = self._distances(candidates, latitude, longitude)
+        k = min(k, len(candidates))
+        if k == 0:
+            return candidates, distances
+        best = np.argpartition(distances, k - 1)[:k]
+        order = best[np.argsort(distances[best], kind='stable')]
+        return candidates[order], distances[order]
+
+    def _covered_km(self, ring: int, half_width_deg: float, max_abs_lat: float) -> float:
+        """
+        Distance minimale garantie entre le point cherché et tout lieu hors de l'anneau.
+
+        Hors des lignes couvertes, l'écart en latitude dépasse `ring` cellules ;
+        dans ces lignes, l'écart en longitude dépasse `half_width_deg` et
+        hav(d) >= cos²(φmax)·hav(Δλ) borne la distance orthodromique.
+        """
+        by_latitude = ring * self.cell_size_deg * KM_PAR_DEGRE
+        if half_width_deg >= 180:
+            return by_latitude
+        sin_half = np.cos(np.radians(max_abs_lat)) * np.sin(np.radians(half_width_deg) / 2)
+        by_longitude = 2 * RAYON_TERRE_KM * np.arcsin(min(1.0, sin_half))
+        return min(by_latitude, by_longitude)
+
+    def in_bounding_box(self, lat_min: float, lon_min: float, lat_max: float, lon_max: float,
+                        mask: Optional[np.ndarray] = None,
+                        unvisited_only: bool = False) -> np.ndarray:
+        """
+        Indices des lieux contenus dans la boîte donnée.
+
+        Si lon_min > lon_max, la boîte traverse l'antiméridien.
+        """
+        span = lon_max - lon_min if lon_min <= lon_max else lon_max + 360 - lon_min
+        candidates = self._candidates(int(self._cell_rows(lat_min)), int(self._cell_rows(lat_max)),
+                                      lon_min, lon_min + span)
+        candidates = self._filter(candidates, mask, unvisited_only)
+        latitudes = self.store.latitudes[candidates]
+        longitudes = self.store.longitudes[candidates]
+        inside = (latitudes >= lat_min) & (latitudes <= lat_max)
+        if lon_min <= lon_max:
+            inside &= (longitudes >= lon_min) & (longitudes <= lon_max)
+        else:
+            inside &= (longitudes >= lon_min) | (longitudes <= lon_max)
+        return np.sort(candidates[inside])